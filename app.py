@@ -5,18 +5,69 @@ A clean, modern, and user-friendly GST calculator for Indian consumers and busin
 
 import streamlit as st
 import os
-from database_gst_service import get_category_list, get_category_scenarios, gst_db_service
-from utils import format_currency, calculate_gst, calculate_gst_breakdown, validate_amount
+from gst.database_gst_service import get_category_list, get_category_scenarios, gst_db_service
+from gst.utils import format_currency, format_data_age, calculate_gst_batch, validate_amount
+from site_content import DISCLAIMER_MARKDOWN, PRIVACY_POLICY_MARKDOWN, inject_google_analytics, inject_page_metadata, inject_styles
 
+@st.cache_resource
+def start_background_services():
+    """Warm the rate caches and start the background services once per process"""
+    gst_db_service.warm_up()
+    # Offline or without a database there is nothing to LISTEN on
+    if os.getenv('GST_CHANGE_LISTENER', '1') == '1' and gst_db_service.database_configured:
+        gst_db_service.start_change_listener()
+    # Optional JSON API served from this process so it shares the UI's rate cache
+    if os.getenv('GST_API_PORT'):
+        from gst.api import start_api_server_thread
+        start_api_server_thread()
+
+# Largest bulk result built for download. Results are rebuilt when the
+# download is clicked rather than kept in the session, so this only bounds
+# one request's memory. The default matches Streamlit's 200 MB upload limit,
+# enough for registers of several hundred thousand rows.
+BULK_MAX_OUTPUT_MB = int(os.getenv('GST_BULK_MAX_OUTPUT_MB', '200'))
+
+# data_version is part of the cache key, so a rate change pushed by the
+# listener produces fresh entries without waiting for the TTL to expire
 @st.cache_data(ttl=3600)  # Cache for 1 hour for better performance
-def get_cached_categories():
+def get_cached_categories(data_version=0):
     """Get categories with caching for faster loading"""
     return get_category_list()
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour for better performance
-def get_cached_scenarios(category):
+# cache_resource, not cache_data: every session shares this one tuple instead
+# of receiving its own copy, so treat it as read-only
+@st.cache_resource(ttl=3600, max_entries=512)
+def get_cached_scenarios(category, data_version=0):
     """Get scenarios with caching for faster loading"""
-    return get_category_scenarios(category)
+    return tuple(get_category_scenarios(category))
+
+# One entry per (category, amount, data_version); bounded because amounts are free-form
+@st.cache_data(ttl=3600, max_entries=256)
+def get_results_table(category, amount, data_version=0):
+    """GST results for every scenario in a category, computed column by column"""
+    import pandas as pd
+    
+    scenarios = get_cached_scenarios(category, data_version)
+    if not scenarios:
+        return None
+    
+    columns = calculate_gst_batch(
+        amount,
+        [scenario['gst_rate'] for scenario in scenarios],
+        cgst_rates=[scenario['breakdown']['CGST'] for scenario in scenarios],
+        sgst_rates=[scenario['breakdown']['SGST'] for scenario in scenarios],
+    )
+    # Numbers stay numeric; formatting is left to the table's column config
+    return pd.DataFrame({
+        "Item/Service": [scenario['name'] for scenario in scenarios],
+        "HSN/SAC Code": [scenario.get('hsn_code') or scenario.get('sac_code') or 'N/A' for scenario in scenarios],
+        "GST Rate": columns['gst_rate'],
+        "Base Amount": columns['base_amount'],
+        "CGST": columns['cgst_amount'],
+        "SGST": columns['sgst_amount'],
+        "Total GST": columns['gst_amount'],
+        "Final Amount": columns['total_amount'],
+    })
 
 def show_loading_screen():
     """Show engaging loading screen while data loads"""
@@ -56,12 +107,10 @@ def show_loading_screen():
     with st.spinner(""):
         try:
             # Load categories and stats
-            categories = get_cached_categories()
-            db_stats = gst_db_service.get_database_stats()
+            get_cached_categories(gst_db_service.data_version)
+            gst_db_service.get_database_stats()
             
-            # Store in session state
-            st.session_state.categories_data = categories
-            st.session_state.db_stats = db_stats
+            # Both stay in the shared caches; the session only records that loading finished
             st.session_state.data_loaded = True
             
             # Auto-refresh to show main app
@@ -72,9 +121,15 @@ def show_loading_screen():
             st.info("💡 Please refresh the page to try again")
             st.stop()
 
-def inject_google_analytics():
-    """Google Analytics is now loaded directly in the page head"""
-    pass
+def show_data_freshness_notice():
+    """Tell users when rates come from cache because the database is unreachable"""
+    status = gst_db_service.get_data_status()
+    if status["database_available"] or status["offline"]:
+        return
+    if status["age_seconds"] is not None:
+        st.warning(f"⚠️ Live rate database is temporarily unavailable. Showing rates last refreshed {format_data_age(status['age_seconds'])} ago.")
+    else:
+        st.warning("⚠️ Live rate database is temporarily unavailable. Please try again in a few minutes.")
 
 # Page configuration
 st.set_page_config(
@@ -84,371 +139,16 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Add meta tag for crawler-friendly rendering
-st.markdown("""
-<meta name="fragment" content="!">
-<meta name="prerender-status-code" content="200">
-""", unsafe_allow_html=True)
+start_background_services()
 
-# Set page title using components
-st.markdown("""
-<script>
-setTimeout(function() {
-    document.title = "Indian GST Calculator Online - Accurate Rates | GSTCalcIndia";
-}, 100);
-</script>
-""", unsafe_allow_html=True)
-
-# Google Analytics - Enhanced loading method
-st.markdown("""
-<script async src="https://www.googletagmanager.com/gtag/js?id=G-561C8F8S4P"></script>
-<script>
-  window.dataLayer = window.dataLayer || [];
-  function gtag(){dataLayer.push(arguments);}
-  gtag('js', new Date());
-  gtag('config', 'G-561C8F8S4P');
-</script>
-""", unsafe_allow_html=True)
-
-# Additional Google Analytics injection using JavaScript
-st.components.v1.html("""
-<script async src="https://www.googletagmanager.com/gtag/js?id=G-561C8F8S4P"></script>
-<script>
-  window.dataLayer = window.dataLayer || [];
-  function gtag(){dataLayer.push(arguments);}
-  gtag('js', new Date());
-  gtag('config', 'G-561C8F8S4P');
-  
-  // Send initial page view
-  gtag('event', 'page_view', {
-    page_title: 'Indian GST Calculator',
-    page_location: window.location.href
-  });
-</script>
-""", height=0)
-
-# SEO Meta Tags and Schema Markup
-st.markdown("""
-<link rel="canonical" href="https://gstcalcindia.com/" />
-<meta name="description" content="Calculate GST online for goods & services in India with GSTCalcIndia.com. Fast, accurate, and up-to-date with official CBIC rates. Mobile-friendly GST calculator.">
-<meta name="keywords" content="GST calculator India, Indian GST calculator, online GST calculator, GST rates India, GST calculation, HSN code GST, SAC code GST, CBIC rates">
-<meta name="author" content="GSTCalcIndia.com">
-<meta name="robots" content="index, follow">
-<meta name="language" content="English">
-<meta name="geo.region" content="IN">
-<meta name="geo.country" content="India">
-
-<!-- Open Graph Tags for Social Media -->
-<meta property="og:title" content="Indian GST Calculator Online - Accurate Rates | GSTCalcIndia">
-<meta property="og:description" content="Calculate GST online for goods & services in India. Fast, accurate, and up-to-date with official CBIC rates.">
-<meta property="og:type" content="website">
-<meta property="og:url" content="https://gstcalcindia.com">
-<meta property="og:locale" content="en_IN">
-
-<!-- Twitter Card Tags -->
-<meta name="twitter:card" content="summary">
-<meta name="twitter:title" content="Indian GST Calculator Online - Accurate Rates">
-<meta name="twitter:description" content="Calculate GST online for goods & services in India. Fast, accurate, and up-to-date with official CBIC rates.">
-
-<!-- Schema.org Structured Data -->
-<script type="application/ld+json">
-{
-  "@context": "https://schema.org",
-  "@type": "WebApplication",
-  "name": "Indian GST Calculator",
-  "description": "Online GST calculator for goods and services in India with official CBIC rates",
-  "url": "https://gstcalcindia.com",
-  "applicationCategory": "FinanceApplication",
-  "operatingSystem": "Web Browser",
-  "inLanguage": "en-IN",
-  "offers": {
-    "@type": "Offer",
-    "price": "0",
-    "priceCurrency": "INR"
-  },
-  "author": {
-    "@type": "Organization",
-    "name": "GSTCalcIndia.com"
-  },
-  "geo": {
-    "@type": "Country",
-    "name": "India"
-  }
-}
-</script>
-
-<!-- Google Analytics will be injected here when GOOGLE_ANALYTICS_ID is provided -->
-
-<!-- Clean Light Mode Styling -->
-<style>
-    /* Import clean fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600&display=swap');
-    
-    /* Override all default fonts with Inter */
-    * {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-    
-    /* Light theme base */
-    .stApp {
-        background-color: #ffffff;
-        color: #1f2937;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-    
-    /* Explicitly override Streamlit's default font references */
-    body, html, div, span, h1, h2, h3, h4, h5, h6, p, a, button, input, select, textarea {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-    
-    /* Main content styling */
-    .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-    
-    /* Header styling */
-    .main-header {
-        text-align: center;
-        color: #1f2937;
-        font-weight: 600;
-        font-size: 2.2rem;
-        margin-bottom: 0.5rem;
-        letter-spacing: -0.025em;
-    }
-    
-    .subtitle {
-        text-align: center;
-        color: #6b7280;
-        font-size: 1rem;
-        margin-bottom: 2rem;
-        font-weight: 400;
-    }
-    
-    /* Calculator container - remove background */
-    .calculator-container {
-        background-color: transparent;
-        border: none;
-        padding: 2rem;
-        margin: 1.5rem 0;
-    }
-    
-    /* Input styling - make consistent */
-    .stNumberInput > div > div > input {
-        background-color: #f9fafb;
-        border: 1px solid #d1d5db;
-        color: #1f2937;
-        border-radius: 6px;
-        font-size: 1rem;
-    }
-    
-    .stNumberInput > div > div > input:focus {
-        border-color: #6b7280;
-        outline: none;
-        box-shadow: 0 0 0 1px #6b7280;
-    }
-    
-    /* Selectbox styling - make consistent with input */
-    .stSelectbox > div > div {
-        background-color: #f9fafb;
-        border: 1px solid #d1d5db;
-        border-radius: 6px;
-    }
-    
-    .stSelectbox > div > div > div {
-        background-color: #f9fafb;
-        color: #1f2937;
-    }
-    
-    .stSelectbox > div > div > div > div {
-        background-color: #f9fafb;
-        color: #1f2937;
-    }
-    
-    /* Dropdown options */
-    .stSelectbox [data-baseweb="select"] {
-        background-color: #f9fafb;
-        color: #1f2937;
-    }
-    
-    .stSelectbox [data-baseweb="select"] > div {
-        background-color: #f9fafb;
-        border-color: #d1d5db;
-        color: #1f2937;
-    }
-    
-    /* Dropdown menu - fix white background issue */
-    [data-baseweb="popover"] {
-        background-color: #f9fafb;
-        border: 1px solid #d1d5db;
-    }
-    
-    [data-baseweb="menu"] {
-        background-color: #f9fafb;
-        border: 1px solid #d1d5db;
-    }
-    
-    [data-baseweb="menu"] > li {
-        background-color: #f9fafb;
-        color: #1f2937;
-    }
-    
-    [data-baseweb="menu"] > li:hover {
-        background-color: #e5e7eb;
-        color: #1f2937;
-    }
-    
-    /* Fix selectbox text color */
-    .stSelectbox div[data-baseweb="select"] span {
-        color: #1f2937;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background-color: #f3f4f6;
-        color: #1f2937;
-        border: 1px solid #d1d5db;
-        border-radius: 6px;
-        padding: 0.5rem 1rem;
-        font-weight: 500;
-        transition: all 0.2s ease;
-    }
-    
-    .stButton > button:hover {
-        background-color: #e5e7eb;
-        border-color: #9ca3af;
-    }
-    
-    /* Table styling */
-    .dataframe {
-        background-color: #ffffff;
-        border: 1px solid #e5e7eb;
-        border-radius: 6px;
-    }
-    
-    /* Metrics styling */
-    [data-testid="metric-container"] {
-        background-color: #f9fafb;
-        border: 1px solid #e5e7eb;
-        border-radius: 6px;
-        padding: 1rem;
-    }
-    
-    [data-testid="metric-container"] [data-testid="metric-value"] {
-        color: #1f2937;
-    }
-    
-    [data-testid="metric-container"] [data-testid="metric-label"] {
-        color: #6b7280;
-    }
-    
-    /* Info box styling */
-    .stInfo {
-        background-color: #eff6ff;
-        border-left: 4px solid #3b82f6;
-        color: #1f2937;
-    }
-    
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        background-color: #f9fafb;
-        border: 1px solid #e5e7eb;
-        color: #1f2937;
-    }
-    
-    /* Simple badges */
-    .feature-badge {
-        display: inline-block;
-        background-color: #f3f4f6;
-        color: #1f2937;
-        padding: 0.25rem 0.75rem;
-        border-radius: 4px;
-        font-size: 0.875rem;
-        font-weight: 500;
-        margin: 0.25rem;
-        border: 1px solid #d1d5db;
-    }
-    
-    .success-badge {
-        display: inline-block;
-        background-color: #ecfdf5;
-        color: #065f46;
-        padding: 0.25rem 0.5rem;
-        border-radius: 4px;
-        font-size: 0.8rem;
-        font-weight: 500;
-        margin: 0.125rem;
-        border: 1px solid #a7f3d0;
-    }
-    
-    /* Hide Streamlit elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Text colors */
-    h1, h2, h3, h4, h5, h6 {
-        color: #1f2937;
-    }
-    
-    p, div, span {
-        color: #1f2937;
-    }
-    
-    /* Divider */
-    hr {
-        border-color: #e5e7eb;
-    }
-    
-    .disclaimer {
-        background-color: #f9fafb;
-        border: 1px solid #d1d5db;
-        color: #1f2937;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Stylesheet and crawler metadata, sent on a session's first run only
+inject_styles()
+inject_page_metadata()
 
 def show_disclaimer():
     """Show disclaimer content"""
     st.markdown("### ⚠️ Important Disclaimer")
-    st.write("**Last Updated:** May 25, 2025")
-    
-    st.write("""
-    Welcome to GSTCalcIndia.com. The information and tools provided on this website, including but not limited to the GST calculator, are for general guidance and informational purposes only.
-    """)
-    
-    st.subheader("📊 Accuracy of Information")
-    st.write("""
-    While we strive to provide accurate and up-to-date information and base our calculations on official notifications from the Central Board of Indirect Taxes and Customs (CBIC) and common interpretations of GST law in India, GSTCalcIndia.com makes no representations or warranties of any kind, express or implied, about the completeness, accuracy, reliability, suitability, or availability with respect to the website or the information, products, services, or related graphics contained on the website for any purpose.
-    """)
-    
-    st.subheader("🔢 Estimates Only")
-    st.write("""
-    The GST calculations provided by our tool are estimates based on the input you provide and common scenarios. GST rates, rules, and their applicability can vary significantly based on many factors, including but not limited to:
-    
-    - Specific product specifications and HSN/SAC classifications
-    - The exact nature of the service or goods
-    - Applicable exemptions or concessions
-    - Changes in state or central government regulations and notifications
-    - The place of supply and other transactional details
-    
-    Our calculator may not account for all such specific nuances, conditions, or the most recent changes that may not yet be universally implemented or reflected in general public data.
-    """)
-    
-    st.subheader("⚖️ Not Professional Advice")
-    st.write("""
-    The content on GSTCalcIndia.com is not intended to be a substitute for professional tax, legal, or financial advice. All content is for informational purposes only.
-    
-    Users are strongly encouraged to consult with a qualified tax professional, chartered accountant, or other appropriate financial advisor for advice tailored to their specific situation before making any financial decisions or taking any action based on the information or calculations provided by this website.
-    """)
-    
-    st.subheader("🛡️ Limitation of Liability")
-    st.write("""
-    In no event will GSTCalcIndia.com, its owners, or operators be liable for any loss or damage including without limitation, indirect or consequential loss or damage, or any loss or damage whatsoever arising from loss of data or profits arising out of, or in connection with, the use of this website or its calculator.
-    """)
+    st.markdown(DISCLAIMER_MARKDOWN)
     
     if st.button("← Back to Calculator"):
         st.session_state.show_page = "calculator"
@@ -456,38 +156,7 @@ def show_disclaimer():
 
 def show_privacy_policy():
     """Show privacy policy content"""
-    st.markdown("### 🔒 Privacy Policy")
-    st.write("**Last Updated:** May 25, 2025")
-    
-    st.write("""
-    **GSTCalcIndia.com Privacy Policy**
-    
-    **Information We Collect:**
-    - We use Google Analytics to understand how visitors use our calculator
-    - No personal information is collected or stored
-    - No registration or login is required
-    
-    **How We Use Information:**
-    - Analytics data helps us improve the calculator
-    - We do not sell or share any data with third parties
-    - All usage data is anonymized
-    
-    **Cookies:**
-    - We use Google Analytics cookies to track website usage
-    - You can disable cookies in your browser settings
-    
-    **Data Security:**
-    - All calculations are performed locally in your browser
-    - We do not store your calculation data
-    - No sensitive information is transmitted or stored
-    
-    **Contact Us:**
-    - For privacy questions, please contact us through our website
-    
-    **Changes to Policy:**
-    - We may update this policy occasionally
-    - Changes will be posted on this page
-    """)
+    st.markdown(PRIVACY_POLICY_MARKDOWN)
     
     if st.button("← Back to Calculator"):
         st.session_state.show_page = "calculator"
@@ -539,13 +208,26 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
+    show_data_freshness_notice()
+    
     # Initialize session state
     if 'calculated' not in st.session_state:
         st.session_state.calculated = False
     if 'results' not in st.session_state:
         st.session_state.results = None
     
-    # Calculator section
+    # Each section is a fragment, so a widget inside one reruns only that section
+    display_calculator()
+    
+    # Bulk file calculation
+    display_bulk_calculator()
+    
+    # Information sections
+    display_info_sections()
+
+@st.fragment
+def display_calculator():
+    """Calculator form and its results; reruns on its own without the page around it"""
     with st.container():
         col1, col2, col3 = st.columns([1, 2, 1])
         
@@ -559,11 +241,34 @@ def main():
                 help="Enter the base amount for GST calculation"
             )
             
+            # Optional item search that jumps to the matching category
+            categories = get_cached_categories(gst_db_service.data_version)
+            category_index = 0
+            search_query = st.text_input(
+                "🔎 Search Items (optional)",
+                placeholder="e.g., laptop, hotel 5000",
+                help="Type an item, service or HSN/SAC code to find its category"
+            )
+            if search_query.strip():
+                matches = gst_db_service.search_scenarios(search_query, limit=8)
+                if matches:
+                    match = st.selectbox(
+                        "Matching Items",
+                        options=matches,
+                        format_func=lambda m: f"{m['scenario']['name']} — {m['category']} "
+                                              f"({m['scenario'].get('hsn_code') or m['scenario'].get('sac_code') or 'N/A'}, "
+                                              f"{m['scenario']['gst_rate']}%)"
+                    )
+                    if match['category'] in categories:
+                        category_index = categories.index(match['category']) + 1
+                else:
+                    st.caption("No matching items found. Try a different word or pick a category below.")
+
             # Category selection
-            categories = get_cached_categories()
             selected_category = st.selectbox(
                 "Select Product/Service Category",
                 options=["Select a Category..."] + categories,
+                index=category_index,
                 help="Choose the category that best matches your product or service"
             )
             
@@ -585,21 +290,21 @@ def main():
                     else:
                         # Store results in session state
                         st.session_state.calculated = True
+                        # Only the inputs and the rate version; scenarios come from the shared cache
                         st.session_state.results = {
                             'amount': amount,
                             'category': selected_category,
-                            'scenarios': get_cached_scenarios(selected_category)
+                            'data_version': gst_db_service.data_version
                         }
-                        st.rerun()
-        
-
     
     # Results section
+    display_results_section()
+
+@st.fragment
+def display_results_section():
+    """Results table; "Start New Calculation" reruns just this section"""
     if st.session_state.calculated and st.session_state.results:
         display_results(st.session_state.results)
-    
-    # Information sections
-    display_info_sections()
 
 def display_results(results):
     """Display GST calculation results in tabular format"""
@@ -612,40 +317,12 @@ def display_results(results):
     with col2:
         st.info(f"**Amount:** {format_currency(results['amount'])} | **Category:** {results['category']}")
     
-    # Scenarios
-    scenarios = results['scenarios']
+    df = get_results_table(results['category'], results['amount'], results['data_version'])
     
-    if not scenarios:
+    if df is None:
         st.warning("No GST scenarios available for this category.")
         return
     
-    # Prepare data for the table
-    table_data = []
-    for scenario in scenarios:
-        # Calculate GST
-        gst_calc = calculate_gst(results['amount'], scenario['gst_rate'])
-        breakdown = calculate_gst_breakdown(results['amount'], scenario['breakdown'])
-        
-        # Get HSN/SAC code if available
-        hsn_sac_code = scenario.get('hsn_code') or scenario.get('sac_code') or 'N/A'
-        
-        # Build row data with HSN/SAC code
-        row = {
-            "Item/Service": scenario["name"],
-            "HSN/SAC Code": hsn_sac_code,
-            "GST Rate": f"{scenario['gst_rate']}%",
-            "Base Amount": format_currency(gst_calc["base_amount"]),
-            "CGST": f"{breakdown['cgst_rate']}% = {format_currency(breakdown['cgst_amount'])}",
-            "SGST": f"{breakdown['sgst_rate']}% = {format_currency(breakdown['sgst_amount'])}",
-            "Total GST": format_currency(gst_calc["gst_amount"]),
-            "Final Amount": format_currency(gst_calc["total_amount"])
-        }
-        table_data.append(row)
-    
-    # Display as table
-    import pandas as pd
-    df = pd.DataFrame(table_data)
-    
     # Style the dataframe for better readability
     st.markdown("### 📋 Complete GST Breakdown")
     
@@ -657,12 +334,14 @@ def display_results(results):
         column_config={
             "Item/Service": st.column_config.TextColumn("Item/Service", width="large"),
             "HSN/SAC Code": st.column_config.TextColumn("HSN/SAC Code", width="small"),
-            "GST Rate": st.column_config.TextColumn("GST Rate", width="small"),
-            "Base Amount": st.column_config.TextColumn("Base Amount", width="medium"),
-            "CGST": st.column_config.TextColumn("CGST", width="medium"),
-            "SGST": st.column_config.TextColumn("SGST", width="medium"),
-            "Total GST": st.column_config.TextColumn("Total GST", width="medium"),
-            "Final Amount": st.column_config.TextColumn("Final Amount", width="medium")
+            "GST Rate": st.column_config.NumberColumn("GST Rate", width="small", format="%g%%"),
+            "Base Amount": st.column_config.NumberColumn("Base Amount", width="medium", format="₹%,.2f"),
+            "CGST": st.column_config.NumberColumn("CGST", width="medium", format="₹%,.2f",
+                                                  help="Central GST, half of the GST rate"),
+            "SGST": st.column_config.NumberColumn("SGST", width="medium", format="₹%,.2f",
+                                                  help="State GST, half of the GST rate"),
+            "Total GST": st.column_config.NumberColumn("Total GST", width="medium", format="₹%,.2f"),
+            "Final Amount": st.column_config.NumberColumn("Final Amount", width="medium", format="₹%,.2f")
         }
     )
     
@@ -670,9 +349,9 @@ def display_results(results):
     st.markdown("### 💡 Key Information")
     
     # Create summary metrics
-    total_scenarios = len(scenarios)
-    min_gst = min(scenario['gst_rate'] for scenario in scenarios)
-    max_gst = max(scenario['gst_rate'] for scenario in scenarios)
+    total_scenarios = len(df)
+    min_gst = df["GST Rate"].min()
+    max_gst = df["GST Rate"].max()
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -700,11 +379,79 @@ def display_results(results):
     # Action buttons
     col1, col2, col3 = st.columns([1, 1, 1])
     with col2:
-        if st.button("🔄 Start New Calculation", use_container_width=True):
-            st.session_state.calculated = False
-            st.session_state.results = None
-            st.rerun()
+        # Cleared in the click callback, so the results fragment's own rerun already sees it
+        st.button("🔄 Start New Calculation", use_container_width=True, on_click=clear_results)
+
+def clear_results():
+    st.session_state.calculated = False
+    st.session_state.results = None
+
+@st.fragment
+def display_bulk_calculator():
+    """Upload a sales register and download it with GST columns added"""
+    with st.expander("📁 Bulk GST Calculation (CSV/Excel)"):
+        st.write("Upload a sales register with an **amount** column and an **hsn_sac** column. "
+                 "Every row is calculated with the same official rates and returned as a download.")
+        
+        uploaded = st.file_uploader("Sales register", type=["csv", "xlsx"], key="bulk_upload")
+        inter_state = st.checkbox("Inter-state supplies (charge IGST instead of CGST + SGST)", key="bulk_inter_state")
+        output_format = st.radio("Output format", ["CSV", "Parquet"], horizontal=True, key="bulk_format")
+        
+        if uploaded is None:
+            st.session_state.pop("bulk_result", None)
+        elif st.button("🔢 Calculate GST for File", key="bulk_calculate_btn"):
+            # Drop the previous result before building the next one
+            st.session_state.pop("bulk_result", None)
+            options = {
+                "inter_state": inter_state,
+                "input_format": "excel" if uploaded.name.lower().endswith(".xlsx") else "csv",
+                "output_format": output_format.lower(),
+            }
+            try:
+                with st.spinner("Calculating GST for every row..."):
+                    # Only the summary is kept; the file itself is built on download
+                    summary = build_bulk_output(uploaded, options)[1]
+                extension = ".parquet" if output_format == "Parquet" else ".csv"
+                st.session_state.bulk_result = {
+                    "file_id": uploaded.file_id,
+                    "options": options,
+                    "summary": summary,
+                    "file_name": os.path.splitext(uploaded.name)[0] + "_gst" + extension,
+                }
+            except Exception as e:
+                st.error(f"❌ Could not process file: {e}")
+        
+        bulk_result = st.session_state.get("bulk_result")
+        if bulk_result and uploaded is not None and bulk_result["file_id"] == uploaded.file_id:
+            summary = bulk_result["summary"]
+            st.success(f"✅ Processed {summary['rows']:,} rows | Total tax: {format_currency(summary['total_tax'])}")
+            if summary["unknown_code"] or summary["invalid_amount"]:
+                st.warning(f"⚠️ {summary['unknown_code']:,} rows with unknown HSN/SAC codes and "
+                           f"{summary['invalid_amount']:,} rows with invalid amounts (see the status column)")
+            options = bulk_result["options"]
+            st.download_button(
+                "⬇️ Download Results",
+                # Built when clicked and released once sent, so no result bytes stay in the session
+                lambda: build_bulk_output(uploaded, options)[0],
+                file_name=bulk_result["file_name"],
+                on_click="ignore",
+                key="bulk_download_btn",
+            )
+            st.caption(f"Results larger than {BULK_MAX_OUTPUT_MB} MB are rejected (GST_BULK_MAX_OUTPUT_MB).")
+
+def build_bulk_output(uploaded, options):
+    """Run the bulk pipeline over an upload and return (file bytes, summary)"""
+    import io
+    from gst.bulk_pipeline import BoundedBuffer, process_file
+    
+    # A private reader, since downloads run on their own thread
+    source = io.BytesIO(uploaded.getvalue())
+    # Kept in memory only, so nothing from the upload is left on server disk
+    output = BoundedBuffer(BULK_MAX_OUTPUT_MB * 1024 * 1024)
+    summary = process_file(source, output, **options)
+    return output.getvalue(), summary
 
+@st.fragment
 def display_info_sections():
     """Display informational sections"""
     
@@ -766,6 +513,10 @@ def display_info_sections():
             if stats.get('last_updated'):
                 st.write(f"**Content & Tax Rates Last Reviewed:** {stats['last_updated'].strftime('%B %Y')}")
             
+            data_status = gst_db_service.get_data_status()
+            if data_status["age_seconds"] is not None:
+                st.caption(f"Rates loaded {format_data_age(data_status['age_seconds'])} ago")
+            
             st.write("**Tax rate information is sourced from official CBIC notifications.**")
         except Exception as e:
             st.write("Coverage statistics temporarily unavailable.")
@@ -799,19 +550,7 @@ def display_info_sections():
             </p>
         </div>
         """.format(current_year=2025), unsafe_allow_html=True)
-    
-    # Final title override to ensure it changes from Streamlit default
-    st.markdown("""
-    <script>
-    // Override Streamlit's default title
-    document.addEventListener('DOMContentLoaded', function() {
-        document.title = "Indian GST Calculator Online - Accurate Rates | GSTCalcIndia";
-    });
-    // Also try immediate change
-    document.title = "Indian GST Calculator Online - Accurate Rates | GSTCalcIndia";
-    </script>
-    """, unsafe_allow_html=True)
-    
+
 
 
 if __name__ == "__main__":
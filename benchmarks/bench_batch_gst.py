@@ -0,0 +1,70 @@
+"""
+Throughput of the vectorized batch GST engine versus the per-scenario Python loop
+
+Usage: python benchmarks/bench_batch_gst.py [num_amounts] [num_scenarios]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gst.utils import calculate_gst_batch
+
+
+def loop_baseline(amounts, scenarios):
+    """The pre-batch approach: scalar formulas and a fresh dict per (amount, scenario)"""
+    rows = []
+    for amount in amounts:
+        for scenario in scenarios:
+            gst_amount = (amount * scenario["gst_rate"]) / 100
+            cgst_amount = (amount * scenario["breakdown"]["CGST"]) / 100
+            sgst_amount = (amount * scenario["breakdown"]["SGST"]) / 100
+            rows.append({
+                "base_amount": amount,
+                "gst_rate": scenario["gst_rate"],
+                "gst_amount": gst_amount,
+                "total_amount": amount + gst_amount,
+                "cgst_amount": cgst_amount,
+                "sgst_amount": sgst_amount,
+                "total_gst": cgst_amount + sgst_amount,
+            })
+    return rows
+
+
+def main():
+    num_amounts = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    num_scenarios = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    rng = np.random.default_rng(42)
+    amounts = np.round(rng.uniform(1, 100000, num_amounts), 2)
+    slabs = np.array([0.0, 0.25, 3.0, 5.0, 12.0, 18.0, 28.0, 40.0])
+    igst = rng.choice(slabs, num_scenarios)
+    scenarios = [
+        {"gst_rate": float(rate), "breakdown": {"CGST": float(rate) / 2, "SGST": float(rate) / 2}}
+        for rate in igst
+    ]
+    pairs = num_amounts * num_scenarios
+
+    start = time.perf_counter()
+    rows = loop_baseline(amounts.tolist(), scenarios)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = calculate_gst_batch(amounts, igst, igst / 2, igst / 2, outer=True)
+    batch_time = time.perf_counter() - start
+
+    # Results must agree exactly with the scalar formulas
+    assert np.array_equal(result["total_amount"].ravel(), np.array([row["total_amount"] for row in rows]))
+
+    print(f"{num_amounts} amounts x {num_scenarios} scenarios = {pairs} calculations")
+    print(f"Python loop : {loop_time * 1000:9.1f} ms  ({pairs / loop_time:,.0f} calc/s)")
+    print(f"Batch engine: {batch_time * 1000:9.1f} ms  ({pairs / batch_time:,.0f} calc/s)")
+    print(f"Speed-up    : {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+DatabaseGSTService latency and memory at growing catalog sizes
+
+For each scale the synthetic catalog generator refills a local Postgres,
+then every service method is timed on its database path (fresh caches)
+and, where it has one, its cached path. Reports p50/p95/p99/max latency
+and the Python memory each full load allocates.
+
+Usage: python benchmarks/bench_db_scale.py [--scales 1,10,100] [--history 3]
+           [--repeat 20] [--views] [--json results.json]
+           [--baseline results.json --max-regression 1.5 --noise-floor 0.5]
+
+Scale 1 is today's catalog (~120 codes, ~100 category entries). With
+--baseline the run exits non-zero when any p95 is more than
+--max-regression times the baseline's, so it can gate a deploy.
+
+Point it at a throwaway database: it replaces the contents of the rate
+tables (DATABASE_URL or PG* variables; PGSSLMODE=disable for a local
+server).
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generate_catalog import generate
+
+from gst.database_gst_service import DatabaseGSTService
+
+# Today's catalog, multiplied by each scale
+BASE_GOODS, BASE_SERVICES, BASE_ENTRIES, BASE_CATEGORIES = 100, 20, 100, 30
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def pick(fraction):
+        return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": pick(0.95) * 1000,
+        "p99_ms": pick(0.99) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def timed(fn, repeat, setup=None):
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def allocated_mb(fn):
+    """Peak Python allocation while fn runs and what it still holds afterwards"""
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"peak_mb": peak / 1e6, "retained_mb": current / 1e6}
+
+
+def bench_scale(service, repeat, rng):
+    """Time every public read path of one service against the current catalog"""
+    with service.pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute("SELECT DISTINCT hsn_code FROM gst_goods_rates WHERE hsn_code IS NOT NULL")
+        hsn = [row[0] for row in cur.fetchall()]
+        cur.execute("SELECT DISTINCT sac_code FROM gst_services_rates WHERE sac_code IS NOT NULL")
+        sac = [row[0] for row in cur.fetchall()]
+    categories = list(service._load_category_counts())
+
+    def cold():
+        # Drop every in-process cache so the call goes to the database
+        service._cached_categories = None
+        service._category_counts = None
+        service._category_scenarios = {}
+        service._code_index = None
+        service._search_index = None
+        service.invalidate_stats()
+        service._stats_cache = (None, 0.0)
+
+    results = {}
+    results["get_categories_with_scenarios (db)"] = timed(service.get_categories_with_scenarios, repeat, cold)
+    results["get_categories_with_scenarios (cached)"] = timed(service.get_categories_with_scenarios, repeat * 10)
+    results["get_category_counts (db)"] = timed(service.get_category_counts, repeat, cold)
+    results["get_scenarios_for_category (db)"] = timed(
+        lambda: service.get_scenarios_for_category(rng.choice(categories)), repeat, cold)
+    results["search_gst_by_hsn (db)"] = timed(lambda: service.search_gst_by_hsn(rng.choice(hsn)), repeat, cold)
+    results["search_gst_by_sac (db)"] = timed(lambda: service.search_gst_by_sac(rng.choice(sac)), repeat, cold)
+    results["lookup_codes x100 (db)"] = timed(
+        lambda: service.lookup_codes(rng.sample(hsn, min(80, len(hsn))) + rng.sample(sac, min(20, len(sac)))),
+        repeat, cold)
+    results["get_database_stats (db)"] = timed(service.get_database_stats, repeat, cold)
+    results["refresh_code_index (db)"] = timed(service.refresh_code_index, repeat)
+    results["search_gst_by_hsn (index)"] = timed(lambda: service.search_gst_by_hsn(rng.choice(hsn)), repeat * 10)
+    results["lookup_codes x100 (index)"] = timed(lambda: service.lookup_codes(rng.sample(hsn, min(100, len(hsn)))),
+                                                 repeat * 10)
+    results["search_by_prefix (index)"] = timed(lambda: service.search_by_prefix(rng.choice(hsn)[:4]), repeat * 10)
+    service.get_categories_with_scenarios()
+    service.search_scenarios("warm up")
+    results["search_scenarios (index)"] = timed(lambda: service.search_scenarios("steel parts"), repeat * 10)
+
+    cold()
+    memory = {
+        "categories": allocated_mb(service._load_categories),
+        "code_index": allocated_mb(service.refresh_code_index),
+    }
+    return results, memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", default="1,10,100", help="comma-separated catalog multipliers")
+    parser.add_argument("--history", type=int, default=3, help="rate versions per code")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--views", action="store_true", help="install the materialized current-rate views first")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare p95 latencies with an earlier --json file")
+    parser.add_argument("--max-regression", type=float, default=1.5)
+    parser.add_argument("--noise-floor", type=float, default=0.5,
+                        help="ignore methods whose baseline p95 is below this many ms")
+    args = parser.parse_args()
+
+    service = DatabaseGSTService(pool_settings={"min_size": 1, "max_size": 2})
+    if args.views:
+        service.install_current_rates()
+    rng = random.Random(7)
+    report = {}
+
+    for scale in [int(s) for s in args.scales.split(",")]:
+        with service.pooled_connection() as conn:
+            summary = generate(conn, goods=BASE_GOODS * scale, services=BASE_SERVICES * scale,
+                               history=args.history, categories=BASE_CATEGORIES,
+                               entries=BASE_ENTRIES * scale)
+        service._read_queries = None
+        results, memory = bench_scale(service, args.repeat, rng)
+        report[f"x{scale}"] = {"catalog": summary, "latency": results, "memory": memory}
+
+        print(f"\nScale x{scale}: {summary['goods_codes']} HSN + {summary['services_codes']} SAC codes, "
+              f"{summary['goods_rows'] + summary['services_rows']} rate rows, "
+              f"{summary['category_entries']} category entries")
+        print(f"  {'method':42s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'max':>9s}  (ms)")
+        for name, stats in results.items():
+            print(f"  {name:42s} {stats['p50_ms']:9.3f} {stats['p95_ms']:9.3f} "
+                  f"{stats['p99_ms']:9.3f} {stats['max_ms']:9.3f}")
+        for name, stats in memory.items():
+            print(f"  memory {name:35s} peak {stats['peak_mb']:.2f} MB, retained {stats['retained_mb']:.2f} MB")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = []
+        for scale, data in report.items():
+            for name, stats in data["latency"].items():
+                before = baseline.get(scale, {}).get("latency", {}).get(name)
+                # Sub-millisecond timings are mostly scheduler noise
+                if before and before["p95_ms"] > args.noise_floor and stats["p95_ms"] > before["p95_ms"] * args.max_regression:
+                    regressions.append(f"{scale} {name}: p95 {before['p95_ms']:.3f} -> {stats['p95_ms']:.3f} ms")
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
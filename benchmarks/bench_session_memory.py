@@ -0,0 +1,74 @@
+"""
+Per-session memory of the calculator's results state at many concurrent sessions
+
+Simulates N sessions that each calculated GST for a random category and
+compares what their session state holds:
+
+    copied     the old results dict with its own copy of the scenario list,
+               as st.cache_data hands every caller (a pickle round trip)
+    reference  amount, category and rate-data version only; scenarios are
+               read from the one shared tuple get_cached_scenarios() keeps
+
+Usage: python benchmarks/bench_session_memory.py [--sessions 1000] [--seed 7]
+
+Rates come from the service as in the app (GST_OFFLINE=1 with
+GST_SNAPSHOT_PATH reads a rate snapshot, no database needed).
+"""
+
+import argparse
+import os
+import pickle
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gst.database_gst_service import gst_db_service
+
+
+def measure(build):
+    """Bytes still allocated after build() returns, while its result is alive"""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    categories = [name for name, count in gst_db_service.get_category_counts().items() if count]
+    version = gst_db_service.data_version
+    visits = [(rng.choice(categories), float(rng.randint(100, 500000))) for _ in range(args.sessions)]
+
+    shared_bytes, store = measure(
+        lambda: {category: tuple(gst_db_service.get_scenarios_for_category(category)) for category in categories})
+
+    def copied():
+        return [{"amount": amount, "category": category,
+                 "scenarios": pickle.loads(pickle.dumps(list(store[category])))}
+                for category, amount in visits]
+
+    def reference():
+        return [{"amount": amount, "category": category, "data_version": version}
+                for category, amount in visits]
+
+    print(f"{args.sessions:,} sessions over {len(categories)} categories "
+          f"({sum(len(s) for s in store.values())} scenarios)")
+    print(f"  shared scenario store (once per process): {shared_bytes / 1024:9.1f} KiB")
+    for name, build in (("copied", copied), ("reference", reference)):
+        total, sessions = measure(build)
+        print(f"  {name:10s} {total / 1024:9.1f} KiB total, {total / len(sessions):8.0f} bytes per session")
+        del sessions
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
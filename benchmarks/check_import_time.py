@@ -0,0 +1,61 @@
+"""
+Import-time budget for the headless gst package
+
+Imports the package and touches the calculators and the rate service in a
+fresh interpreter, then fails (exit 1) if that took longer than the budget
+or pulled in Streamlit, pandas or NumPy.
+
+Usage: python benchmarks/check_import_time.py [budget_ms]
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_MS = 150.0
+HEAVY_MODULES = ("streamlit", "pandas", "numpy")
+RUNS = 5
+
+PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import gst
+gst.calculate_gst(1000, 18)
+gst.DatabaseGSTService
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed, ",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+
+def measure():
+    # Offline so the global service never starts a background database refresh
+    env = dict(os.environ, GST_OFFLINE="1")
+    output = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout.split()
+    return float(output[0]), output[1].split(",") if len(output) > 1 else []
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    timings = []
+    heavy = set()
+    for _ in range(RUNS):
+        elapsed, loaded = measure()
+        timings.append(elapsed)
+        heavy.update(loaded)
+    best = min(timings)
+
+    print(f"gst import + first use: best {best:.1f} ms over {RUNS} runs (budget {budget:.0f} ms)")
+    if heavy:
+        print(f"FAIL: importing gst loaded {', '.join(sorted(heavy))}")
+        return 1
+    if best > budget:
+        print("FAIL: import time over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
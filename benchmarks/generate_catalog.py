@@ -0,0 +1,152 @@
+"""
+Fill the rate tables with a synthetic but realistically shaped catalog
+
+Goods get 8-digit HSN codes spread over the tariff chapters, services get
+6-digit SAC codes under 99, and every code carries a rate history of
+--history versions (older versions partly deactivated, the newest active)
+on the real GST slabs, with compensation cess on the usual chapters.
+Category entries point at a sample of the codes.
+
+Applies the migrations first, so it also works on an empty database.
+
+Usage: python benchmarks/generate_catalog.py [--goods 1000] [--services 200]
+           [--history 3] [--categories 30] [--entries 600] [--seed 42] [--keep]
+
+Connects like the app (DATABASE_URL or PG* variables; PGSSLMODE=disable
+for a local server). Existing rows are deleted unless --keep is given.
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gst.database_gst_service import DatabaseGSTService
+from gst.migrations import migrate
+
+SLABS = [0, 0.25, 3, 5, 12, 18, 28]
+SLAB_WEIGHTS = [10, 1, 2, 25, 20, 35, 7]
+# Chapters that attract compensation cess (beverages, tobacco, coal, vehicles)
+CESS_CHAPTERS = {22: [12], 24: [5, 36, 71, 160, 290], 27: [4], 87: [1, 3, 15, 17, 20, 22]}
+SERVICE_SLABS = [0, 5, 12, 18, 28]
+SERVICE_WEIGHTS = [10, 20, 15, 50, 5]
+GST_START = date(2017, 7, 1)
+
+NOUNS = ["Cotton", "Steel", "Plastic", "Leather", "Paper", "Glass", "Rubber", "Wooden", "Copper", "Ceramic",
+         "Electric", "Frozen", "Organic", "Synthetic", "Aluminium", "Woollen", "Silk", "Printed", "Dried", "Roasted"]
+ITEMS = ["Articles", "Products", "Parts", "Machines", "Fabrics", "Containers", "Fittings", "Instruments",
+         "Preparations", "Tools", "Garments", "Appliances", "Sheets", "Tubes", "Accessories", "Footwear"]
+SERVICES = ["Consulting", "Transport", "Repair", "Rental", "Catering", "Courier", "Advertising", "Training",
+            "Cleaning", "Security", "Hosting", "Brokerage", "Printing", "Leasing", "Design", "Maintenance"]
+CATEGORY_WORDS = ["Home", "Office", "Kitchen", "Garden", "Auto", "Health", "Travel", "Sports", "Food", "Textile",
+                  "Hardware", "Beauty", "Toys", "Books", "Medical", "Farm", "Electronics", "Finance", "Energy"]
+
+
+def _copy(cur, table, columns, rows):
+    """Bulk-load rows with COPY, far faster than INSERTs at large scales"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join("\\N" if value is None else str(value) for value in row) + "\n")
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+
+def _history(rng, code, description, slabs, weights, history, cess=None):
+    """Rate versions for one code, oldest first; only the newest is guaranteed active"""
+    rows = []
+    day = GST_START
+    for version in range(history):
+        rate = rng.choices(slabs, weights)[0]
+        is_active = version == history - 1 or rng.random() < 0.3
+        row = [code, f"{description} (v{version + 1})" if version < history - 1 else description,
+               rate / 2, rate / 2, rate]
+        if cess is not None:
+            row.append(rng.choice(cess) if cess else None)
+        rows.append(row + [day.isoformat(), "t" if is_active else "f"])
+        day += timedelta(days=rng.randint(90, 600))
+    return rows
+
+
+def generate(conn, goods=1000, services=200, history=3, categories=30, entries=600, seed=42, keep=False):
+    rng = random.Random(seed)
+    migrate(conn)
+
+    hsn_codes = set()
+    while len(hsn_codes) < goods:
+        chapter = rng.randint(1, 98)
+        hsn_codes.add(f"{chapter:02d}{rng.randint(0, 999999):06d}")
+    hsn_codes = sorted(hsn_codes)
+    # SAC codes for services all sit under chapter 99, which caps them at 10,000
+    sac_codes = sorted(f"99{n:04d}" for n in rng.sample(range(10000), min(services, 10000)))
+
+    goods_rows = []
+    for code in hsn_codes:
+        description = f"{rng.choice(NOUNS)} {rng.choice(ITEMS)} of heading {code[:4]}"
+        goods_rows += _history(rng, code, description, SLABS, SLAB_WEIGHTS, history,
+                               cess=CESS_CHAPTERS.get(int(code[:2]), []))
+    services_rows = []
+    for code in sac_codes:
+        description = f"{rng.choice(SERVICES)} services ({code})"
+        services_rows += _history(rng, code, description, SERVICE_SLABS, SERVICE_WEIGHTS, history)
+
+    category_names = sorted({f"{rng.choice(CATEGORY_WORDS)} {rng.choice(ITEMS)}" for _ in range(categories * 4)})
+    category_names = category_names[:categories]
+    category_rows = []
+    for i in range(entries):
+        category = category_names[i % len(category_names)]
+        if rng.random() < 0.8 and hsn_codes:
+            code = rng.choice(hsn_codes)
+            category_rows.append([category, f"{rng.choice(NOUNS)} {rng.choice(ITEMS)} #{i}", code, None])
+        else:
+            code = rng.choice(sac_codes)
+            category_rows.append([category, f"{rng.choice(SERVICES)} services #{i}", None, code])
+
+    with conn.cursor() as cur:
+        if not keep:
+            cur.execute("TRUNCATE gst_goods_rates, gst_services_rates, product_categories RESTART IDENTITY")
+        _copy(cur, "gst_goods_rates",
+              ["hsn_code", "description", "cgst_rate", "sgst_rate", "igst_rate", "compensation_cess",
+               "effective_from", "is_active"], goods_rows)
+        _copy(cur, "gst_services_rates",
+              ["sac_code", "description", "cgst_rate", "sgst_rate", "igst_rate", "effective_from", "is_active"],
+              services_rows)
+        _copy(cur, "product_categories", ["category_name", "subcategory_name", "hsn_code", "sac_code"],
+              category_rows)
+        cur.execute("ANALYZE gst_goods_rates, gst_services_rates, product_categories")
+
+    return {
+        "goods_codes": len(hsn_codes),
+        "services_codes": len(sac_codes),
+        "goods_rows": len(goods_rows),
+        "services_rows": len(services_rows),
+        "categories": len(category_names),
+        "category_entries": len(category_rows),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic GST rate catalog")
+    parser.add_argument("--goods", type=int, default=1000, help="number of HSN codes")
+    parser.add_argument("--services", type=int, default=200, help="number of SAC codes")
+    parser.add_argument("--history", type=int, default=3, help="rate versions per code")
+    parser.add_argument("--categories", type=int, default=30)
+    parser.add_argument("--entries", type=int, default=600, help="product_categories rows")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="append instead of replacing existing rows")
+    args = parser.parse_args()
+
+    service = DatabaseGSTService()
+    start = time.perf_counter()
+    with service.pooled_connection() as conn:
+        summary = generate(conn, args.goods, args.services, args.history, args.categories,
+                           args.entries, args.seed, args.keep)
+    print(f"Generated in {time.perf_counter() - start:.1f}s: " + ", ".join(f"{k}={v}" for k, v in summary.items()))
+
+
+if __name__ == "__main__":
+    main()
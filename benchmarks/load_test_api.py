@@ -0,0 +1,97 @@
+"""
+Load test for the JSON API over persistent (keep-alive) HTTP/1.1 connections
+
+Opens N concurrent connections and sends requests back to back on each for
+a fixed duration, then reports throughput and latency percentiles.
+
+Usage: python benchmarks/load_test_api.py [--url http://127.0.0.1:8081]
+           [--connections 50] [--duration 10] [--endpoint calculate|batch|lookup|categories]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlparse
+
+PAYLOADS = {
+    "calculate": ("POST", "/calculate", {"amount": 50000, "rate": 18}),
+    "code": ("POST", "/calculate", {"amount": 50000, "code": "8517"}),
+    "batch": ("POST", "/calculate/batch", {"items": [{"amount": 1000 + i, "rate": 18} for i in range(100)]}),
+    "lookup": ("GET", "/lookup/8517", None),
+    "categories": ("GET", "/categories", None),
+}
+
+
+def build_request(host: str, method: str, path: str, payload) -> bytes:
+    body = json.dumps(payload).encode() if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n"
+    if body:
+        head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+    return (head + "\r\n").encode() + body
+
+
+async def read_response(reader) -> int:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Server closed the connection")
+    status = int(status_line.split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def worker(host, port, request, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(url, connections, duration, endpoint):
+    parsed = urlparse(url)
+    host, port = parsed.hostname, parsed.port or 80
+    method, path, payload = PAYLOADS[endpoint]
+    request = build_request(host, method, path, payload)
+
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, request, deadline, latencies, errors) for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+    print(f"{endpoint}: {len(latencies)} requests over {connections} keep-alive connections in {elapsed:.1f}s")
+    print(f"  throughput: {len(latencies) / elapsed:,.0f} req/s   errors: {len(errors)}")
+    print(f"  latency ms: p50 {pct(0.50):.2f}  p95 {pct(0.95):.2f}  p99 {pct(0.99):.2f}  "
+          f"mean {statistics.fmean(latencies) * 1000:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8081")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--endpoint", choices=sorted(PAYLOADS), default="calculate")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.connections, args.duration, args.endpoint))
+
+
+if __name__ == "__main__":
+    main()
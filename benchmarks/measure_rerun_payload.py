@@ -0,0 +1,89 @@
+"""
+Bytes the app sends to the browser per script run
+
+Drives app.py with Streamlit's AppTest through a typical visit (first
+load, a full rerun, entering an amount, Calculate GST, a legal page) and
+reports the serialized size of the messages each run sends, total and for
+the largest elements.
+
+Usage: python benchmarks/measure_rerun_payload.py [--top 5]
+
+Needs rates without a database, e.g. GST_OFFLINE=1 with a snapshot from
+python -m gst.rate_snapshot build (GST_SNAPSHOT_PATH), and
+GST_CHANGE_LISTENER=0. AppTest runs fragments as full runs, so the
+Calculate GST figure is an upper bound on what a fragment rerun sends.
+"""
+
+import argparse
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+_last_messages = []
+_run = LocalScriptRunner.run
+
+
+def _recording_run(self, *args, **kwargs):
+    tree = _run(self, *args, **kwargs)
+    _last_messages[:] = list(self.forward_msgs())
+    return tree
+
+
+LocalScriptRunner.run = _recording_run
+
+
+def _describe(msg):
+    delta = msg.delta
+    if not msg.HasField("delta") or not delta.HasField("new_element"):
+        return msg.WhichOneof("type")
+    element = delta.new_element
+    kind = element.WhichOneof("type")
+    body = getattr(getattr(element, kind), "body", "") if kind in ("markdown", "html") else ""
+    return f"{kind} {body.strip()[:40]!r}" if body else kind
+
+
+def measure(at, label, action, top):
+    action()
+    if at.exception:
+        raise SystemExit(f"{label}: app raised {at.exception[0].message}")
+    # page_profile is Streamlit's own usage telemetry, not app content
+    sizes = [(msg.ByteSize(), _describe(msg)) for msg in _last_messages if not msg.HasField("page_profile")]
+    print(f"{label:28s} {sum(size for size, _ in sizes):8,d} bytes in {len(sizes)} messages")
+    for size, name in sorted(sizes, reverse=True)[:top]:
+        print(f"    {size:7,d}  {name}")
+    return sum(size for size, _ in sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--top", type=int, default=5, help="largest messages to list per run")
+    args = parser.parse_args()
+
+    at = AppTest.from_file(APP, default_timeout=60)
+
+    def calculate():
+        category = next(box for box in at.selectbox if box.label.startswith("Select Product"))
+        category.select(category.options[1]).run()
+        next(button for button in at.button if button.label.endswith("Calculate GST")).click().run()
+
+    def open_disclaimer():
+        next(button for button in at.button if button.label == "Disclaimer").click().run()
+
+    steps = [
+        ("first load", at.run),
+        ("full rerun", at.run),
+        ("enter amount", lambda: at.text_input[0].input("50000").run()),
+        ("calculate GST", calculate),
+        ("disclaimer page", open_disclaimer),
+    ]
+    total = sum(measure(at, label, action, args.top) for label, action in steps)
+    print(f"{'total':28s} {total:8,d} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Headless Indian GST rate service and calculators
+
+Importing this package is cheap: names are resolved lazily on first access,
+so the database service, pandas and NumPy are only loaded by the code paths
+that need them and Streamlit is never imported.
+
+    import gst
+    gst.calculate_gst(1000, 18)
+    gst.get_service().lookup_codes(["8517", "996311"])
+"""
+
+import importlib
+
+# Public name -> defining submodule
+_EXPORTS = {
+    # Calculations
+    "calculate_gst": "utils",
+    "calculate_gst_breakdown": "utils",
+    "calculate_gst_batch": "utils",
+    "format_currency": "utils",
+    "format_data_age": "utils",
+    "validate_amount": "utils",
+    "validate_rate": "utils",
+    # Exact paise arithmetic
+    "calculate_gst_paise": "fixed_point",
+    "calculate_gst_paise_batch": "fixed_point",
+    "calculate_invoice_paise": "fixed_point",
+    "to_paise": "fixed_point",
+    "from_paise": "fixed_point",
+    "rate_to_units": "fixed_point",
+    # Rate data
+    "DatabaseGSTService": "database_gst_service",
+    "get_service": "database_gst_service",
+    "gst_db_service": "database_gst_service",
+    "get_category_list": "database_gst_service",
+    "get_category_scenarios": "database_gst_service",
+    "AsyncDatabaseGSTService": "async_service",
+    "RateIndex": "code_index",
+    "CodeIndex": "code_index",
+    "ScenarioSearchIndex": "scenario_search",
+    "Scenario": "records",
+    "GoodsRate": "records",
+    "ServicesRate": "records",
+    "create_friendly_name": "friendly_names",
+    "create_friendly_names": "friendly_names",
+    "build_reverse_index": "friendly_names",
+    # Bulk files
+    "process_file": "bulk_pipeline",
+    "iter_results": "bulk_pipeline",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'gst' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
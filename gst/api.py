@@ -0,0 +1,424 @@
+"""
+Lightweight JSON HTTP API over the GST rate service
+
+A plain ASGI application (no web framework) exposing:
+
+    GET  /health
+    GET  /categories
+    GET  /categories/{category}/scenarios
+    GET  /lookup/{code}?fallback=1
+    POST /lookup              {"codes": [...], "fallback": false}
+    POST /calculate           {"amount": 1000, "category" | "code" | "rate": ..., "inter_state": false}
+    POST /calculate/batch     {"items": [{"amount": ..., "code" | "rate": ...}], "inter_state": false,
+                               "mode": "float" | "paise", "rounding_level": "line" | "invoice"}
+
+Run standalone with ``python -m gst.api`` (uvicorn), or call
+start_api_server_thread() from the Streamlit process so the API and the UI
+share one in-process rate cache.
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import parse_qs, unquote
+
+from .fixed_point import CALCULATION_MODES, FLOAT_MODE, PAISE_MODE, PER_INVOICE, PER_LINE, ROUNDING_LEVELS
+from .records import json_default
+from .utils import MAX_AMOUNT, MAX_RATE, calculate_gst, calculate_gst_breakdown
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH_ITEMS = 100000
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _truthy(value) -> bool:
+    return str(value).lower() in ("1", "true", "yes")
+
+
+def _amount(value, field: str = "amount", limit: float = MAX_AMOUNT) -> float:
+    try:
+        amount = float(value)
+    except (TypeError, ValueError):
+        raise ApiError(400, f"{field} must be a number")
+    # float() accepts "nan" and "inf", which would serialize as invalid JSON
+    if not math.isfinite(amount):
+        raise ApiError(400, f"{field} must be a finite number")
+    if amount < 0:
+        raise ApiError(400, f"{field} must not be negative")
+    # Same ceiling as the calculator UI; it also keeps every computed figure finite
+    if amount > limit:
+        raise ApiError(400, f"{field} must not exceed {limit:,.0f}")
+    return amount
+
+
+def _rates_from_record(record: Dict) -> Dict:
+    return {
+        "gst_rate": record["igst_rate"],
+        "cgst_rate": record["cgst_rate"],
+        "sgst_rate": record["sgst_rate"],
+        "cess_rate": record.get("compensation_cess", 0.0) or 0.0,
+    }
+
+
+def _line_result(amount: float, rates: Dict, inter_state: bool) -> Dict:
+    """Same figures as the calculator UI for one amount at one rate set"""
+    gst_calc = calculate_gst(amount, rates["gst_rate"])
+    breakdown = calculate_gst_breakdown(amount, {"CGST": rates["cgst_rate"], "SGST": rates["sgst_rate"]})
+    cess_amount = (amount * rates.get("cess_rate", 0.0)) / 100
+    return {
+        "base_amount": amount,
+        "gst_rate": rates["gst_rate"],
+        "cgst_rate": 0.0 if inter_state else breakdown["cgst_rate"],
+        "sgst_rate": 0.0 if inter_state else breakdown["sgst_rate"],
+        "cgst_amount": 0.0 if inter_state else breakdown["cgst_amount"],
+        "sgst_amount": 0.0 if inter_state else breakdown["sgst_amount"],
+        "igst_amount": gst_calc["gst_amount"] if inter_state else 0.0,
+        "cess_amount": cess_amount,
+        "total_tax": gst_calc["gst_amount"] + cess_amount,
+        "total_amount": gst_calc["total_amount"] + cess_amount,
+    }
+
+
+def _paise_columns(amounts, igst, cgst, sgst, cess, errors: Dict, inter_state: bool, rounding_level: str):
+    """Batch columns in exact paise arithmetic, plus totals over the rows without errors.
+
+    The batch is one invoice: with PER_INVOICE its taxes are rounded once
+    in the totals, while the per-row columns stay rounded per line.
+    """
+    import numpy as np
+    from .fixed_point import calculate_gst_paise_batch, from_paise, rate_to_units, round_invoice, to_paise
+
+    size = len(amounts)
+    paise = np.zeros(size, dtype=np.int64)
+    units = [np.zeros(size, dtype=np.int64) for _ in range(4)]
+    for i in range(size):
+        if i in errors:
+            continue
+        try:
+            igst_units = rate_to_units(float(igst[i]))
+            if cgst[i] == sgst[i] == igst[i] / 2:
+                # An even split, as for a bare rate: halve the units so 18.0001% stays exact
+                split = [igst_units // 2, igst_units - igst_units // 2]
+            else:
+                split = [rate_to_units(float(cgst[i])), rate_to_units(float(sgst[i]))]
+            row_units = [igst_units, *split, rate_to_units(float(cess[i]))]
+        except ValueError as e:
+            errors[i] = str(e)
+            continue
+        paise[i] = to_paise(float(amounts[i]))
+        for column, value in zip(units, row_units):
+            column[i] = value
+
+    result = calculate_gst_paise_batch(paise, *units, inter_state=inter_state)
+    result["total_tax"] = result["gst_amount"] + result["cess_amount"]
+    if rounding_level == PER_INVOICE:
+        # Python ints, so the sums cannot overflow
+        amounts_list = paise.tolist()
+        numerators = {key: sum(a * u for a, u in zip(amounts_list, column.tolist()))
+                      for key, column in zip(("igst_amount", "cgst_amount", "sgst_amount", "cess_amount"), units)}
+        totals = round_invoice(sum(amounts_list), numerators, inter_state=inter_state)
+        totals["total_tax"] = totals["gst_amount"] + totals["cess_amount"]
+    else:
+        totals = {key: int(column.sum()) for key, column in result.items()}
+
+    columns = {key: result[key] / 100 for key in ("cgst_amount", "sgst_amount", "igst_amount", "cess_amount",
+                                                  "total_tax", "total_amount")}
+    keys = ("base_amount", "cgst_amount", "sgst_amount", "igst_amount", "cess_amount", "total_tax", "total_amount")
+    return columns, {key: float(from_paise(totals[key])) for key in keys}
+
+
+class GSTApi:
+    """ASGI callable; all rate data comes from the shared DatabaseGSTService"""
+
+    def __init__(self, service=None):
+        self._service = service
+
+    @property
+    def service(self):
+        if self._service is None:
+            from .database_gst_service import get_service
+            self._service = get_service()
+        return self._service
+
+    async def _call(self, in_memory: bool, fn, *args, **kwargs):
+        """Run a service call off the event loop unless its data is already in memory"""
+        if in_memory:
+            return fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _lookup(self, codes, fallback: bool = False) -> Dict:
+        return await self._call(self.service.in_memory("codes"), self.service.lookup_codes, codes, fallback=fallback)
+
+    async def _category_counts(self) -> Dict:
+        return await self._call(self.service.in_memory("counts"), self.service.get_category_counts)
+
+    # ---- handlers -------------------------------------------------------
+
+    async def health(self, request):
+        status = self.service.get_data_status()
+        return {"status": "ok", "data_version": self.service.data_version,
+                "database_available": status["database_available"], "data_age_seconds": status["age_seconds"]}
+
+    async def categories(self, request):
+        counts = await self._category_counts()
+        return {
+            "data_version": self.service.data_version,
+            "categories": [{"name": name, "scenarios": count} for name, count in counts.items()],
+        }
+
+    async def _scenarios(self, category: str):
+        if not isinstance(category, str):
+            raise ApiError(400, "category must be a string")
+        if category not in await self._category_counts():
+            raise ApiError(404, f"Unknown category: {category}")
+        return await self._call(self.service.in_memory("category", category),
+                                self.service.get_scenarios_for_category, category)
+
+    async def scenarios(self, request, category: str):
+        return {"category": category, "scenarios": await self._scenarios(category)}
+
+    async def lookup_one(self, request, code: str):
+        fallback = _truthy(request["query"].get("fallback", "0"))
+        found = await self._lookup([code], fallback)
+        if code not in found["results"]:
+            raise ApiError(404, f"Unknown HSN/SAC code: {code}")
+        return found["results"][code]
+
+    async def lookup_many(self, request):
+        body = request["json"]
+        codes = body.get("codes")
+        if not isinstance(codes, list):
+            raise ApiError(400, "codes must be a list")
+        return await self._lookup([str(code) for code in codes], bool(body.get("fallback", False)))
+
+    async def calculate(self, request):
+        body = request["json"]
+        amount = _amount(body.get("amount"))
+        inter_state = bool(body.get("inter_state", False))
+
+        if "category" in body:
+            results = []
+            for scenario in await self._scenarios(body["category"]):
+                rates = {"gst_rate": scenario["gst_rate"], "cgst_rate": scenario["breakdown"]["CGST"],
+                         "sgst_rate": scenario["breakdown"]["SGST"]}
+                line = _line_result(amount, rates, inter_state)
+                line.update({"name": scenario["name"], "hsn_code": scenario.get("hsn_code"),
+                             "sac_code": scenario.get("sac_code")})
+                results.append(line)
+            return {"category": body["category"], "results": results}
+
+        if "code" in body:
+            code = str(body["code"])
+            found = await self._lookup([code], bool(body.get("fallback", False)))
+            record = found["results"].get(code)
+            if record is None:
+                raise ApiError(404, f"Unknown HSN/SAC code: {code}")
+            result = _line_result(amount, _rates_from_record(record), inter_state)
+            result["rate_source"] = record
+            return result
+
+        if "rate" in body:
+            rate = _amount(body["rate"], "rate", MAX_RATE)
+            return _line_result(amount, {"gst_rate": rate, "cgst_rate": rate / 2, "sgst_rate": rate / 2},
+                                inter_state)
+
+        raise ApiError(400, "Provide one of category, code or rate")
+
+    async def calculate_batch(self, request):
+        """Vectorized calculation of many lines; codes are resolved in one lookup"""
+        import numpy as np
+        from .utils import calculate_gst_batch
+
+        body = request["json"]
+        items = body.get("items")
+        if not isinstance(items, list) or not items or not all(isinstance(item, dict) for item in items):
+            raise ApiError(400, "items must be a non-empty list of objects")
+        if len(items) > MAX_BATCH_ITEMS:
+            raise ApiError(413, f"At most {MAX_BATCH_ITEMS} items per batch")
+        inter_state = bool(body.get("inter_state", False))
+        mode = body.get("mode", FLOAT_MODE)
+        if mode not in CALCULATION_MODES:
+            raise ApiError(400, f"mode must be one of {', '.join(CALCULATION_MODES)}")
+        rounding_level = body.get("rounding_level", PER_LINE)
+        if rounding_level not in ROUNDING_LEVELS:
+            raise ApiError(400, f"rounding_level must be one of {', '.join(ROUNDING_LEVELS)}")
+        if rounding_level == PER_INVOICE and mode != PAISE_MODE:
+            raise ApiError(400, "rounding_level 'invoice' needs mode 'paise'")
+
+        codes = [str(item["code"]) for item in items if "code" in item]
+        found = await self._lookup(codes, bool(body.get("fallback", False)))
+        records = found["results"]
+
+        size = len(items)
+        amounts = np.empty(size)
+        igst, cgst, sgst, cess = np.zeros(size), np.zeros(size), np.zeros(size), np.zeros(size)
+        errors = {}
+        for i, item in enumerate(items):
+            try:
+                amounts[i] = _amount(item.get("amount"))
+            except ApiError as e:
+                amounts[i] = 0.0
+                errors[i] = e.message
+            if "code" in item:
+                record = records.get(str(item["code"]))
+                if record is None:
+                    errors[i] = f"Unknown HSN/SAC code: {item['code']}"
+                    continue
+                rates = _rates_from_record(record)
+                igst[i], cgst[i], sgst[i], cess[i] = (rates["gst_rate"], rates["cgst_rate"],
+                                                      rates["sgst_rate"], rates["cess_rate"])
+            elif "rate" in item:
+                try:
+                    igst[i] = _amount(item["rate"], "rate", MAX_RATE)
+                except ApiError as e:
+                    errors[i] = e.message
+                    continue
+                cgst[i] = sgst[i] = igst[i] / 2
+            else:
+                errors[i] = "Provide code or rate"
+
+        columns = {"base_amount": amounts, "gst_rate": igst}
+        totals = None
+        if mode == PAISE_MODE:
+            paise_columns, totals = _paise_columns(amounts, igst, cgst, sgst, cess, errors, inter_state,
+                                                   rounding_level)
+            columns.update(paise_columns)
+        else:
+            result = calculate_gst_batch(amounts, igst, cgst, sgst, cess)
+            zeros = np.zeros(size)
+            columns.update({
+                "cgst_amount": zeros if inter_state else result["cgst_amount"],
+                "sgst_amount": zeros if inter_state else result["sgst_amount"],
+                "igst_amount": result["gst_amount"] if inter_state else zeros,
+                "cess_amount": result["cess_amount"],
+                "total_tax": result["gst_amount"] + result["cess_amount"],
+                "total_amount": result["total_amount"],
+            })
+        # Columnar response: one list per field, plus per-index errors
+        response = {
+            "count": size,
+            "columns": {name: column.tolist() for name, column in columns.items()},
+            "errors": {str(i): message for i, message in errors.items()},
+            "missing_codes": found["missing"],
+        }
+        if totals is not None:
+            response["totals"] = totals
+        return response
+
+    # ---- ASGI plumbing --------------------------------------------------
+
+    def _route(self, method: str, path: str):
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        if method == "GET":
+            if parts == ["health"]:
+                return self.health, ()
+            if parts == ["categories"]:
+                return self.categories, ()
+            if len(parts) == 3 and parts[0] == "categories" and parts[2] == "scenarios":
+                return self.scenarios, (parts[1],)
+            if len(parts) == 2 and parts[0] == "lookup":
+                return self.lookup_one, (parts[1],)
+        elif method == "POST":
+            if parts == ["lookup"]:
+                return self.lookup_many, ()
+            if parts == ["calculate"]:
+                return self.calculate, ()
+            if parts == ["calculate", "batch"]:
+                return self.calculate_batch, ()
+        raise ApiError(404, f"No route for {method} {path}")
+
+    async def _read_json(self, receive) -> Dict:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise ApiError(413, "Request body too large")
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        if not size:
+            return {}
+        try:
+            body = json.loads(b"".join(chunks))
+        except ValueError:
+            raise ApiError(400, "Body must be valid JSON")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Body must be a JSON object")
+        return body
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    # Load rates before accepting traffic
+                    await asyncio.to_thread(self.service.warm_up, False)
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        try:
+            handler, args = self._route(scope["method"], scope["path"])
+            query = {key: values[-1] for key, values in parse_qs(scope.get("query_string", b"").decode()).items()}
+            request = {"query": query, "json": await self._read_json(receive) if scope["method"] == "POST" else {}}
+            status, payload = 200, await handler(request, *args)
+        except ApiError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            print(f"API error on {scope['method']} {scope['path']}: {e}")
+            status, payload = 500, {"error": "Internal server error"}
+
+        try:
+            # NaN/Infinity are not JSON; never send them even if a figure overflows
+            body = json.dumps(payload, default=json_default, allow_nan=False)
+        except ValueError:
+            status, body = 400, json.dumps({"error": "Result is not a finite number"})
+        body = body.encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+app = GSTApi()
+
+
+def run(host: str = "0.0.0.0", port: Optional[int] = None, api=None):
+    """Serve the API with uvicorn (HTTP/1.1 keep-alive, concurrent requests)"""
+    import uvicorn
+
+    uvicorn.run(api or app, host=host, port=port or int(os.getenv('GST_API_PORT', '8081')),
+                log_level=os.getenv('GST_API_LOG_LEVEL', 'warning'), access_log=False)
+
+
+def start_api_server_thread(port: Optional[int] = None) -> threading.Thread:
+    """Serve the API from a daemon thread inside an existing process (e.g. Streamlit)"""
+    import uvicorn
+
+    config = uvicorn.Config(app, host="0.0.0.0", port=port or int(os.getenv('GST_API_PORT', '8081')),
+                            log_level=os.getenv('GST_API_LOG_LEVEL', 'warning'), access_log=False)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, name="gst-api", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,292 @@
+"""
+Async variant of the database GST service for API front ends
+
+Same method surface as DatabaseGSTService (categories, HSN/SAC search,
+stats, bulk lookup) on an asyncpg connection pool, so one worker can keep
+hundreds of lookups in flight. Identical concurrent lookups are coalesced
+into one query, and every call takes an optional deadline in seconds.
+"""
+
+import asyncio
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .code_index import RateIndex, normalize_code
+from . import schema
+from .queries import (
+    BASE_TABLE_QUERIES,
+    STATS_QUERY,
+    STATS_SUMMARY_QUERY,
+    _goods_record,
+    _services_record,
+    _stats_from_row,
+    group_category_rows,
+)
+
+DEFAULT_DEADLINE = float(os.getenv('GST_ASYNC_DEADLINE', '10'))
+
+
+def _to_asyncpg(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders as asyncpg $1, $2, ..."""
+    counter = iter(range(1, query.count("%s") + 1))
+    return re.sub(r"%s", lambda _: f"${next(counter)}", query)
+
+
+class AsyncDatabaseGSTService:
+    """asyncio counterpart of DatabaseGSTService.
+
+    Use as ``async with AsyncDatabaseGSTService() as service:`` or call
+    start()/close() explicitly. Requires the optional asyncpg package.
+    """
+
+    def __init__(self, dsn: Optional[str] = None, min_size: Optional[int] = None,
+                 max_size: Optional[int] = None, deadline: float = DEFAULT_DEADLINE):
+        self.dsn = dsn or os.getenv('DATABASE_URL')
+        self.min_size = min_size if min_size is not None else int(os.getenv('DB_POOL_MIN_SIZE', '1'))
+        self.max_size = max_size if max_size is not None else int(os.getenv('DB_ASYNC_POOL_MAX_SIZE', '10'))
+        self.deadline = deadline
+        self._pool = None
+        self._queries = BASE_TABLE_QUERIES
+        self._pool_lock = asyncio.Lock()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._cached_categories = None
+        self._category_counts = None
+        self._category_scenarios = {}
+        self._code_index = None
+        self._friendly_names_persisted = None
+        self._stats_summary_available = None  # None = not probed yet
+        self.stats_ttl = float(os.getenv('GST_STATS_TTL', '600'))
+        self._stats_cache = (None, 0.0)
+        self.metrics = {"queries": 0, "coalesced": 0, "deadline_exceeded": 0}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        """Create the connection pool (idempotent)"""
+        async with self._pool_lock:
+            if self._pool is None:
+                import asyncpg
+
+                # asyncpg reads PGHOST/PGUSER/... itself when dsn is None
+                self._pool = await asyncpg.create_pool(
+                    self.dsn,
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    ssl=os.getenv('PGSSLMODE', 'require'),
+                    timeout=30,
+                    max_inactive_connection_lifetime=float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+                    # Pooled statements are prepared once per connection
+                    statement_cache_size=100,
+                )
+                # Read from the materialized current-rate views when they are installed
+                if await self._pool.fetchval(schema.CURRENT_RATES_INSTALLED_QUERY):
+                    self._queries = schema.VIEW_QUERIES
+        return self._pool
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def _with_deadline(self, coro, deadline: Optional[float]):
+        try:
+            return await asyncio.wait_for(coro, deadline if deadline is not None else self.deadline)
+        except asyncio.TimeoutError:
+            self.metrics["deadline_exceeded"] += 1
+            raise
+
+    async def _coalesced(self, key: tuple, factory):
+        """Share one in-flight query among identical concurrent requests"""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.metrics["coalesced"] += 1
+            # shield: one caller's deadline must not cancel the shared query
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(factory())
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: tuple, future: asyncio.Future):
+        self._inflight.pop(key, None)
+        # Every waiter may have hit its deadline; still consume the outcome
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Error in async query {key[0]}: {future.exception()}")
+
+    async def _fetch(self, query: str, *args):
+        pool = self._pool or await self.start()
+        self.metrics["queries"] += 1
+        return await pool.fetch(_to_asyncpg(query), *args)
+
+    async def _load_categories(self, category: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Run the category query, reading persisted friendly names while the column exists"""
+        import asyncpg
+
+        key, args = ("categories", ()) if category is None else ("category", (category,))
+        if self._friendly_names_persisted is not False:
+            try:
+                rows = await self._fetch(self._queries[key + "_persisted"], *args)
+                self._friendly_names_persisted = True
+                return group_category_rows(rows)
+            except asyncpg.exceptions.UndefinedColumnError:
+                # Names not persisted; compute them on load from now on
+                self._friendly_names_persisted = False
+        return group_category_rows(await self._fetch(self._queries[key], *args))
+
+    async def _fetch_database_stats(self) -> Dict:
+        """Read statistics, preferring the precomputed gst_rate_stats summary row"""
+        import asyncpg
+
+        if self._stats_summary_available is not False:
+            try:
+                rows = await self._fetch(STATS_SUMMARY_QUERY)
+                self._stats_summary_available = bool(rows)
+                if rows:
+                    return _stats_from_row(tuple(rows[0]))
+            except asyncpg.exceptions.UndefinedTableError:
+                # Summary table not installed; use the combined query from now on
+                self._stats_summary_available = False
+            except Exception as e:
+                print(f"Error reading stats summary: {e}")
+        rows = await self._fetch(STATS_QUERY)
+        return _stats_from_row(tuple(rows[0]))
+
+    async def get_categories_with_scenarios(self, deadline: Optional[float] = None) -> Dict[str, List[Dict]]:
+        if self._cached_categories is not None:
+            return self._cached_categories
+
+        async def load():
+            categories = await self._load_categories()
+            self._cached_categories = categories
+            return categories
+
+        return await self._with_deadline(self._coalesced(("categories",), load), deadline)
+
+    async def get_category_counts(self, deadline: Optional[float] = None) -> Dict[str, int]:
+        """Category names with scenario counts, without loading any scenarios"""
+        if self._cached_categories is not None:
+            return {name: len(data["scenarios"]) for name, data in self._cached_categories.items()}
+        if self._category_counts is not None:
+            return self._category_counts
+
+        async def load():
+            self._category_counts = {row[0]: row[1] for row in await self._fetch(self._queries["category_counts"])}
+            return self._category_counts
+
+        return await self._with_deadline(self._coalesced(("category_counts",), load), deadline)
+
+    async def get_scenarios_for_category(self, category: str, deadline: Optional[float] = None) -> List[Dict]:
+        """One category's scenarios, loaded on first access"""
+        if self._cached_categories is not None:
+            return self._cached_categories.get(category, {}).get("scenarios", [])
+        if category in self._category_scenarios:
+            return self._category_scenarios[category]
+
+        async def load():
+            scenarios = (await self._load_categories(category)).get(category, {}).get("scenarios", [])
+            self._category_scenarios[category] = scenarios
+            return scenarios
+
+        return await self._with_deadline(self._coalesced(("category", category), load), deadline)
+
+    async def search_gst_by_hsn(self, hsn_code: str, deadline: Optional[float] = None) -> Optional[Dict]:
+        if self._code_index is not None:
+            return self._code_index.hsn(hsn_code)
+
+        async def load():
+            rows = await self._fetch(self._queries["hsn"], hsn_code)
+            return _goods_record(rows[0]) if rows else None
+
+        # Records are immutable, so coalesced callers can share one
+        return await self._with_deadline(self._coalesced(("hsn", hsn_code), load), deadline)
+
+    async def search_gst_by_sac(self, sac_code: str, deadline: Optional[float] = None) -> Optional[Dict]:
+        if self._code_index is not None:
+            return self._code_index.sac(sac_code)
+
+        async def load():
+            rows = await self._fetch(self._queries["sac"], sac_code)
+            return _services_record(rows[0]) if rows else None
+
+        return await self._with_deadline(self._coalesced(("sac", sac_code), load), deadline)
+
+    async def get_database_stats(self, deadline: Optional[float] = None) -> Dict:
+        cached, expires_at = self._stats_cache
+        if cached is not None and time.monotonic() < expires_at:
+            return cached
+
+        async def load():
+            stats = await self._fetch_database_stats()
+            self._stats_cache = (stats, time.monotonic() + self.stats_ttl)
+            return stats
+
+        return await self._with_deadline(self._coalesced(("stats",), load), deadline)
+
+    async def refresh_code_index(self, deadline: Optional[float] = None) -> RateIndex:
+        """Load the in-memory HSN/SAC index; later lookups then skip the database"""
+        async def load():
+            goods, services = await asyncio.gather(self._fetch(self._queries["index_goods"]),
+                                                   self._fetch(self._queries["index_services"]))
+            index = RateIndex([_goods_record(row) for row in goods], [_services_record(row) for row in services])
+            self._code_index = index
+            return index
+
+        return await self._with_deadline(self._coalesced(("code_index",), load), deadline)
+
+    async def lookup_codes(self, codes: Iterable[str], fallback: bool = False,
+                           deadline: Optional[float] = None) -> Dict:
+        """Bulk lookup with the same result shape as DatabaseGSTService.lookup_codes
+
+        Prefix fallback needs the code index, so fallback=True loads it first.
+        """
+        codes = list(dict.fromkeys(code for code in codes if code))
+        results = {}
+
+        if fallback and self._code_index is None and codes:
+            await self.refresh_code_index(deadline)
+
+        if self._code_index is not None:
+            for code in codes:
+                record = self._code_index.lookup(code, fallback=fallback)
+                if record is not None:
+                    results[code] = record
+        elif codes:
+            by_normalized = {}
+            for code in codes:
+                by_normalized.setdefault(normalize_code(code), []).append(code)
+            normalized = sorted(by_normalized)
+
+            async def load():
+                return await self._fetch(self._queries["bulk_lookup"], normalized, normalized)
+
+            rows = await self._with_deadline(self._coalesced(("bulk", tuple(normalized)), load), deadline)
+            for kind, *row in rows:
+                record = _goods_record(row) if kind == "goods" else _services_record(row[:5])
+                for code in by_normalized.get(row[0], ()):
+                    # A code present in both tables resolves to goods first
+                    results.setdefault(code, record)
+
+        return {
+            "results": results,
+            "missing": [code for code in codes if code not in results],
+        }
+
+    def get_pool_stats(self) -> Dict:
+        stats = dict(self.metrics)
+        if self._pool is not None:
+            stats.update({
+                "size": self._pool.get_size(),
+                "idle": self._pool.get_idle_size(),
+                "min_size": self._pool.get_min_size(),
+                "max_size": self._pool.get_max_size(),
+            })
+        stats["inflight"] = len(self._inflight)
+        return stats
@@ -0,0 +1,324 @@
+"""
+Streaming bulk GST calculation for whole sales registers
+
+Input (CSV or Excel) is read in chunks, each chunk's distinct HSN/SAC codes
+are resolved once through DatabaseGSTService (in-memory index when warm),
+taxes are computed for the whole chunk with the vectorized engine, and the
+results are appended to the output (CSV or Parquet) before the next chunk
+is read, so memory stays flat regardless of file size.
+
+mode="paise" computes every line in exact integer paise (fixed_point). With
+rounding_level="invoice" the summary's total tax additionally rounds each
+invoice's taxes once, grouping rows by invoice_column; row figures stay
+per line.
+"""
+
+import io
+import os
+from typing import Dict, Iterable, Iterator, Optional
+
+from .fixed_point import (
+    CALCULATION_MODES,
+    FLOAT_MODE,
+    MAX_PAISE,
+    PAISE_MODE,
+    PER_INVOICE,
+    PER_LINE,
+    ROUNDING_LEVELS,
+    from_paise,
+    rate_to_units,
+    round_invoice,
+    to_paise,
+)
+from .utils import calculate_gst_batch
+
+DEFAULT_CHUNK_SIZE = 50000
+RESULT_COLUMNS = [
+    "gst_rate", "cgst_rate", "sgst_rate", "cess_rate",
+    "cgst_amount", "sgst_amount", "igst_amount", "cess_amount",
+    "total_tax", "total_amount", "rate_type", "status",
+]
+
+
+class OutputTooLarge(ValueError):
+    """Raised when results outgrow a BoundedBuffer"""
+
+
+class BoundedBuffer(io.BytesIO):
+    """In-memory output target that refuses to grow past max_bytes"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__()
+        self.max_bytes = max_bytes
+
+    def write(self, data) -> int:
+        if self.tell() + len(data) > self.max_bytes:
+            raise OutputTooLarge(f"Results exceed {self.max_bytes // (1024 * 1024)} MB; split the file and try again")
+        return super().write(data)
+
+
+def _file_format(path: str) -> str:
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext in (".xlsx", ".xlsm", ".xls"):
+        return "excel"
+    if ext == ".parquet":
+        return "parquet"
+    return "csv"
+
+
+def read_chunks(source, chunksize: int = DEFAULT_CHUNK_SIZE, file_format: Optional[str] = None):
+    """Yield DataFrame chunks from a CSV/Excel path or file-like object"""
+    import pandas as pd
+
+    file_format = file_format or _file_format(getattr(source, "name", source))
+    if file_format == "csv":
+        # Codes must stay strings so leading zeros ("0401") survive
+        yield from pd.read_csv(source, chunksize=chunksize, dtype=str, keep_default_na=False)
+        return
+    if file_format != "excel":
+        raise ValueError(f"Unsupported input format: {file_format}")
+
+    # openpyxl's read-only mode streams rows instead of loading the whole sheet
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(name) for name in next(rows)]
+        batch = []
+        for row in rows:
+            batch.append(["" if value is None else str(value) for value in row])
+            if len(batch) >= chunksize:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+class RateResolver:
+    """Resolves codes to rates once per code for the lifetime of a job"""
+
+    def __init__(self, service, fallback: bool = False):
+        self.service = service
+        self.fallback = fallback
+        self._rates: Dict[str, Optional[Dict]] = {}
+
+    def resolve(self, codes: Iterable[str]) -> Dict[str, Optional[Dict]]:
+        new_codes = [code for code in set(codes) if code and code not in self._rates]
+        if new_codes:
+            found = self.service.lookup_codes(new_codes, fallback=self.fallback)["results"]
+            for code in new_codes:
+                self._rates[code] = found.get(code)
+        return self._rates
+
+
+class InvoiceTotals:
+    """Exact per-invoice tax numerators across chunks, rounded once per invoice at the end"""
+
+    KEYS = ("base_amount", "cgst_amount", "sgst_amount", "igst_amount", "cess_amount")
+
+    def __init__(self, inter_state: bool = False):
+        self.inter_state = inter_state
+        self._numerators: Dict[str, list] = {}
+
+    def add(self, invoices, amounts, igst, cgst, sgst, cess):
+        """Accumulate one chunk: invoice ids, paise amounts and rate units per row"""
+        import pandas as pd
+
+        frame = pd.DataFrame({"invoice": invoices, "base_amount": amounts, "cgst_amount": amounts * cgst,
+                              "sgst_amount": amounts * sgst, "igst_amount": amounts * igst,
+                              "cess_amount": amounts * cess})
+        sums = frame.groupby("invoice", sort=False)[list(self.KEYS)].sum()
+        for invoice, row in zip(sums.index, sums.itertuples(index=False)):
+            totals = self._numerators.setdefault(invoice, [0] * len(self.KEYS))
+            for i, value in enumerate(row):
+                totals[i] += int(value)
+
+    def total_tax(self) -> int:
+        """Sum over invoices of the once-rounded GST and cess, in paise"""
+        total = 0
+        for base, *numerators in self._numerators.values():
+            invoice = round_invoice(base, dict(zip(self.KEYS[1:], numerators)), inter_state=self.inter_state)
+            total += invoice["gst_amount"] + invoice["cess_amount"]
+        return total
+
+    def __len__(self) -> int:
+        return len(self._numerators)
+
+
+def _paise_amounts(texts):
+    """Exact paise per amount text, and which ones parsed"""
+    import numpy as np
+
+    amounts = np.zeros(len(texts), dtype=np.int64)
+    valid = np.zeros(len(texts), dtype=bool)
+    for i, text in enumerate(texts):
+        try:
+            paise = to_paise(text)
+        except (ArithmeticError, ValueError):
+            continue
+        if abs(paise) <= MAX_PAISE:
+            amounts[i] = paise
+            valid[i] = True
+    return amounts, valid
+
+
+def calculate_chunk(df, resolver: RateResolver, amount_column: str = "amount",
+                    code_column: str = "hsn_sac", inter_state: bool = False, mode: str = FLOAT_MODE,
+                    invoice_column: Optional[str] = None, invoices: Optional[InvoiceTotals] = None):
+    """Add GST result columns to one chunk, computed in a single vectorized pass"""
+    import numpy as np
+    import pandas as pd
+
+    codes = df[code_column].astype(str).str.strip()
+    amount_text = df[amount_column].astype(str).str.replace(",", "").str.replace("₹", "")
+    rates = resolver.resolve(codes.unique())
+
+    def rate_column(key):
+        lookup = {code: (record or {}).get(key, 0.0) or 0.0 for code, record in rates.items()}
+        return codes.map(lookup).fillna(0.0).to_numpy(dtype=np.float64)
+
+    igst = rate_column("igst_rate")
+    cgst = rate_column("cgst_rate")
+    sgst = rate_column("sgst_rate")
+    cess = rate_column("compensation_cess")
+
+    if mode == PAISE_MODE:
+        from .fixed_point import calculate_gst_paise_batch
+
+        amounts, valid = _paise_amounts(amount_text.tolist())
+        # Only a handful of distinct rates, so convert each once
+        units = {rate: rate_to_units(float(rate)) for rate in set(igst) | set(cgst) | set(sgst) | set(cess)}
+        igst_units, cgst_units, sgst_units, cess_units = (
+            np.array([units[rate] for rate in column], dtype=np.int64) for column in (igst, cgst, sgst, cess))
+        result = calculate_gst_paise_batch(amounts, igst_units, cgst_units, sgst_units, cess_units,
+                                           inter_state=inter_state)
+        if invoices is not None:
+            invoices.add(df[invoice_column].astype(str).to_numpy(), amounts, igst_units, cgst_units,
+                         sgst_units, cess_units)
+        result["total_tax"] = result["gst_amount"] + result["cess_amount"]
+        figures = {key: result[key] / 100 for key in ("cgst_amount", "sgst_amount", "igst_amount",
+                                                      "cess_amount", "total_tax", "total_amount")}
+    else:
+        amounts = pd.to_numeric(amount_text, errors="coerce")
+        valid = amounts.notna().to_numpy()
+        result = calculate_gst_batch(amounts.fillna(0.0).to_numpy(dtype=np.float64), igst, cgst, sgst, cess)
+        # A supply is either intra-state (CGST + SGST) or inter-state (IGST)
+        zeros = np.zeros(len(df))
+        figures = {
+            "cgst_amount": zeros if inter_state else result["cgst_amount"],
+            "sgst_amount": zeros if inter_state else result["sgst_amount"],
+            "igst_amount": result["gst_amount"] if inter_state else zeros,
+            "cess_amount": result["cess_amount"],
+            "total_tax": result["gst_amount"] + result["cess_amount"],
+            "total_amount": result["total_amount"],
+        }
+
+    known = codes.map(lambda code: rates.get(code) is not None).to_numpy(dtype=bool)
+
+    out = df.copy()
+    out["gst_rate"] = igst
+    out["cgst_rate"] = cgst
+    out["sgst_rate"] = sgst
+    out["cess_rate"] = cess
+    for column, values in figures.items():
+        out[column] = np.round(values, 2)
+    out["rate_type"] = codes.map(lambda code: (rates.get(code) or {}).get("type", ""))
+    out["status"] = np.where(~valid, "invalid_amount", np.where(known, "ok", "unknown_code"))
+    return out
+
+
+def iter_results(chunks, service=None, amount_column: str = "amount", code_column: str = "hsn_sac",
+                 inter_state: bool = False, fallback: bool = False, mode: str = FLOAT_MODE,
+                 invoice_column: Optional[str] = None, invoices: Optional[InvoiceTotals] = None) -> Iterator:
+    """Lazily compute results for an iterable of input chunks"""
+    if mode not in CALCULATION_MODES:
+        raise ValueError(f"Unknown calculation mode: {mode}")
+    if service is None:
+        from .database_gst_service import get_service
+        service = get_service()
+    # Load the in-memory index up front so every chunk resolves without queries
+    try:
+        service.get_code_index()
+    except Exception as e:
+        print(f"Code index unavailable, resolving codes from the database: {e}")
+    resolver = RateResolver(service, fallback=fallback)
+    for chunk in chunks:
+        missing = {amount_column, code_column} - set(chunk.columns)
+        if invoices is not None and invoice_column not in chunk.columns:
+            missing.add(invoice_column)
+        if missing:
+            raise ValueError(f"Input is missing required column(s): {', '.join(sorted(missing))}")
+        yield calculate_chunk(chunk, resolver, amount_column, code_column, inter_state, mode,
+                              invoice_column, invoices)
+
+
+class _ResultWriter:
+    """Incremental CSV or Parquet writer"""
+
+    def __init__(self, target, file_format: str):
+        self.target = target
+        self.file_format = file_format
+        self._parquet_writer = None
+        self._wrote_header = False
+
+    def write(self, df):
+        if self.file_format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.target, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.target, mode="a" if self._wrote_header else "w",
+                      header=not self._wrote_header, index=False)
+            self._wrote_header = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def process_file(source, target, chunksize: int = DEFAULT_CHUNK_SIZE, service=None,
+                 amount_column: str = "amount", code_column: str = "hsn_sac",
+                 inter_state: bool = False, fallback: bool = False,
+                 input_format: Optional[str] = None, output_format: Optional[str] = None,
+                 mode: str = FLOAT_MODE, rounding_level: str = PER_LINE,
+                 invoice_column: str = "invoice") -> Dict:
+    """Stream a sales register from source to target and return row counts"""
+    output_format = output_format or _file_format(getattr(target, "name", target))
+    if output_format not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if rounding_level not in ROUNDING_LEVELS:
+        raise ValueError(f"Unknown rounding level: {rounding_level}")
+    if rounding_level == PER_INVOICE and mode != PAISE_MODE:
+        raise ValueError("Per-invoice rounding needs mode='paise'")
+    invoices = InvoiceTotals(inter_state) if rounding_level == PER_INVOICE else None
+
+    summary = {"rows": 0, "unknown_code": 0, "invalid_amount": 0, "total_tax": 0.0}
+    tax_paise = 0
+    writer = _ResultWriter(target, output_format)
+    try:
+        for result in iter_results(read_chunks(source, chunksize, input_format), service,
+                                   amount_column, code_column, inter_state, fallback, mode,
+                                   invoice_column, invoices):
+            writer.write(result)
+            summary["rows"] += len(result)
+            summary["unknown_code"] += int((result["status"] == "unknown_code").sum())
+            summary["invalid_amount"] += int((result["status"] == "invalid_amount").sum())
+            if mode == PAISE_MODE:
+                # Every figure is whole paise, so this sum is exact
+                tax_paise += int((result["total_tax"] * 100).round().astype("int64").sum())
+            else:
+                summary["total_tax"] += float(result["total_tax"].sum())
+    finally:
+        writer.close()
+    if invoices is not None:
+        summary["invoices"] = len(invoices)
+        tax_paise = invoices.total_tax()
+    summary["total_tax"] = float(from_paise(tax_paise)) if mode == PAISE_MODE else round(summary["total_tax"], 2)
+    return summary
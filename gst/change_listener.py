@@ -0,0 +1,121 @@
+"""
+Push-based cache invalidation: a background LISTEN on rate-table changes
+"""
+
+import select
+import threading
+import time
+from typing import Callable, Set
+
+# Channel the rate-table triggers publish on; payload is the changed table name
+CHANGE_CHANNEL = "gst_rates_changed"
+
+# Statement-level triggers so a bulk notification load fires once per statement,
+# and Postgres delivers notifications only after the writing transaction commits.
+CHANGE_NOTIFY_DDL = """
+    CREATE OR REPLACE FUNCTION notify_gst_rates_changed() RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM pg_notify('gst_rates_changed', TG_TABLE_NAME);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS gst_goods_rates_notify ON gst_goods_rates;
+    CREATE TRIGGER gst_goods_rates_notify
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON gst_goods_rates
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_gst_rates_changed();
+
+    DROP TRIGGER IF EXISTS gst_services_rates_notify ON gst_services_rates;
+    CREATE TRIGGER gst_services_rates_notify
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON gst_services_rates
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_gst_rates_changed();
+
+    DROP TRIGGER IF EXISTS product_categories_notify ON product_categories;
+    CREATE TRIGGER product_categories_notify
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON product_categories
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_gst_rates_changed();
+"""
+
+
+class RateChangeListener(threading.Thread):
+    """Daemon thread that LISTENs for rate changes and calls on_change(tables).
+
+    Uses its own dedicated connection (LISTEN must stay on one session, so it
+    cannot come from the shared pool). Bursts of notifications are coalesced
+    for ``debounce`` seconds into one callback. After a dropped connection it
+    reconnects with exponential backoff and fires a catch-up callback, since
+    notifications sent while disconnected are lost.
+    """
+
+    def __init__(self, connect: Callable, on_change: Callable[[Set[str]], None],
+                 channel: str = CHANGE_CHANNEL, debounce: float = 1.0,
+                 poll_interval: float = 5.0, max_backoff: float = 60.0):
+        super().__init__(name="gst-rate-change-listener", daemon=True)
+        self._connect = connect
+        self._on_change = on_change
+        self.channel = channel
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self._stop_event = threading.Event()
+        self.notifications_received = 0
+        self.refreshes = 0
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _drain(self, conn, tables: Set[str]):
+        conn.poll()
+        while conn.notifies:
+            notify = conn.notifies.pop(0)
+            tables.add(notify.payload)
+            self.notifications_received += 1
+
+    def _fire(self, tables: Set[str]):
+        self.refreshes += 1
+        try:
+            self._on_change(tables)
+        except Exception as e:
+            print(f"Error refreshing caches after rate change: {e}")
+
+    def _listen(self, conn):
+        """Block on the connection socket until stopped or the connection drops"""
+        while not self._stop_event.is_set():
+            if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                continue
+            tables = set()
+            self._drain(conn, tables)
+            # Coalesce the rest of a burst (e.g. a multi-statement rate load)
+            deadline = time.monotonic() + self.debounce
+            while (remaining := deadline - time.monotonic()) > 0:
+                if select.select([conn], [], [], remaining) != ([], [], []):
+                    self._drain(conn, tables)
+            if tables:
+                self._fire(tables)
+
+    def run(self):
+        backoff = 1.0
+        connected_before = False
+        while not self._stop_event.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {self.channel}")
+                backoff = 1.0
+                if connected_before:
+                    # Anything committed while we were away was not delivered
+                    self._fire({"*"})
+                connected_before = True
+                self._listen(conn)
+            except Exception as e:
+                print(f"Rate change listener error: {e}")
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
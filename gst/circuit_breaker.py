@@ -0,0 +1,99 @@
+"""
+Circuit breaker that makes database outages fail fast instead of hanging
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of attempting a call while the circuit is open"""
+
+
+class CircuitBreaker:
+    """Open after repeated failures; recover via a background probe.
+
+    While closed, calls pass through and consecutive failures are counted.
+    After ``failure_threshold`` failures the circuit opens: calls raise
+    CircuitOpenError immediately (no connect timeout), and a daemon thread
+    runs ``probe`` every ``probe_interval`` seconds. The first successful
+    probe closes the circuit and invokes ``on_close``. Request threads never
+    probe themselves, so no user waits on a dead database.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+
+    def __init__(self, probe: Callable[[], None], failure_threshold: int = 3,
+                 probe_interval: float = 5.0, on_close: Optional[Callable[[], None]] = None):
+        self._probe = probe
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.on_close = on_close
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.rejections = 0
+        self.last_error = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def call(self, fn, *args, **kwargs):
+        if self.state == self.OPEN:
+            with self._lock:
+                self.rejections += 1
+            raise CircuitOpenError(f"Database circuit open since {time.ctime(self.opened_at)}: {self.last_error}")
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            if self.state == self.OPEN or self.failures < self.failure_threshold:
+                return
+            self.state = self.OPEN
+            self.opened_at = time.time()
+        print(f"Database circuit opened after {self.failures} failures: {error}")
+        threading.Thread(target=self._probe_until_closed, name="gst-db-probe", daemon=True).start()
+
+    def _probe_until_closed(self):
+        while self.state == self.OPEN:
+            time.sleep(self.probe_interval)
+            try:
+                self._probe()
+            except Exception as e:
+                self.last_error = e
+                continue
+            with self._lock:
+                self.state = self.CLOSED
+                self.failures = 0
+                self.opened_at = None
+            print("Database circuit closed; connection recovered")
+            if self.on_close is not None:
+                try:
+                    self.on_close()
+                except Exception as e:
+                    print(f"Error after database recovery: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_at": self.opened_at,
+            "rejections": self.rejections,
+            "last_error": str(self.last_error) if self.last_error else None,
+        }
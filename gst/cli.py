@@ -0,0 +1,117 @@
+"""
+Command-line GST calculations over stdin/stdout
+
+    python -m gst calc < register.csv > register_gst.csv
+    python -m gst calc --mode paise --rounding-level invoice < register.csv > register_gst.csv
+    python -m gst quick 50000 18
+    python -m gst lookup 8517 996311
+    python -m gst snapshot build
+"""
+
+import argparse
+import json
+import sys
+
+
+def _cmd_calc(args):
+    """Stream a CSV sales register from stdin to stdout with GST columns added"""
+    from .bulk_pipeline import process_file
+
+    try:
+        summary = process_file(
+            sys.stdin,
+            sys.stdout,
+            chunksize=args.chunksize,
+            amount_column=args.amount_column,
+            code_column=args.code_column,
+            inter_state=args.inter_state,
+            fallback=args.fallback,
+            input_format="csv",
+            output_format="csv",
+            mode=args.mode,
+            rounding_level=args.rounding_level,
+            invoice_column=args.invoice_column,
+        )
+    except ValueError as e:
+        # Missing columns or an invalid mode combination
+        print(e, file=sys.stderr)
+        return 2
+    # Keep stdout clean for the data; the summary goes to stderr
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+
+def _cmd_quick(args):
+    """One amount at one rate, without touching the rate database"""
+    from .utils import calculate_gst, calculate_gst_breakdown, validate_amount, validate_rate
+
+    amount, error = validate_amount(args.amount)
+    if not error:
+        rate, error = validate_rate(args.rate)
+    if error:
+        print(error, file=sys.stderr)
+        return 2
+    half = rate / 2
+    result = calculate_gst(amount, rate)
+    result.update(calculate_gst_breakdown(amount, {"CGST": half, "SGST": half}))
+    print(json.dumps(result))
+    return 0
+
+
+def _cmd_lookup(args):
+    """Resolve HSN/SAC codes (arguments, or one per line on stdin) to JSON lines"""
+    from .database_gst_service import get_service
+    from .records import json_default
+
+    codes = args.codes or [line.strip() for line in sys.stdin if line.strip()]
+    found = get_service().lookup_codes(codes, fallback=args.fallback)
+    for code in codes:
+        print(json.dumps({"code": code, "result": found["results"].get(code)}, default=json_default))
+    return 0 if not found["missing"] else 1
+
+
+def _cmd_snapshot(args):
+    from .rate_snapshot import main as snapshot_main
+
+    return snapshot_main([args.action] + ([args.path] if args.path else []))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from .fixed_point import CALCULATION_MODES, FLOAT_MODE, PER_LINE, ROUNDING_LEVELS
+
+    parser = argparse.ArgumentParser(prog="python -m gst", description="Indian GST calculator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    calc = commands.add_parser("calc", help="CSV on stdin -> CSV with GST columns on stdout")
+    calc.add_argument("--amount-column", default="amount")
+    calc.add_argument("--code-column", default="hsn_sac")
+    calc.add_argument("--inter-state", action="store_true", help="charge IGST instead of CGST + SGST")
+    calc.add_argument("--fallback", action="store_true", help="use the longest known code prefix for unknown codes")
+    calc.add_argument("--chunksize", type=int, default=50000)
+    calc.add_argument("--mode", choices=CALCULATION_MODES, default=FLOAT_MODE,
+                      help="paise: exact integer-paise arithmetic")
+    calc.add_argument("--rounding-level", choices=ROUNDING_LEVELS, default=PER_LINE,
+                      help="invoice: round each invoice's tax once in the summary total (needs --mode paise)")
+    calc.add_argument("--invoice-column", default="invoice", help="groups rows for --rounding-level invoice")
+    calc.set_defaults(func=_cmd_calc)
+
+    quick = commands.add_parser("quick", help="GST for one amount at one rate")
+    quick.add_argument("amount")
+    quick.add_argument("rate", help="GST rate in percent, e.g. 18")
+    quick.set_defaults(func=_cmd_quick)
+
+    lookup = commands.add_parser("lookup", help="look up HSN/SAC codes")
+    lookup.add_argument("codes", nargs="*")
+    lookup.add_argument("--fallback", action="store_true")
+    lookup.set_defaults(func=_cmd_lookup)
+
+    snapshot = commands.add_parser("snapshot", help="build or inspect the rate snapshot")
+    snapshot.add_argument("action", choices=["build", "info"])
+    snapshot.add_argument("path", nargs="?")
+    snapshot.set_defaults(func=_cmd_snapshot)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
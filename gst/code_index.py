@@ -0,0 +1,105 @@
+"""
+In-memory HSN/SAC code index for exact, prefix and longest-match lookups
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+# Shortest prefix worth falling back to: a 2-digit HSN chapter
+MIN_FALLBACK_DIGITS = 2
+
+
+def normalize_code(code) -> str:
+    """Strip the separators people type into codes ("8517.12" / "8517 12" -> "851712")"""
+    if code is None:
+        return ""
+    return "".join(ch for ch in str(code) if ch.isalnum())
+
+
+class CodeIndex:
+    """Immutable sorted-array index over one code space (HSN or SAC).
+
+    Records are the immutable GoodsRate/ServicesRate objects the database
+    search methods return, handed out as is rather than copied. Prefix
+    queries are two binary searches over the sorted code list, so chapter
+    ("85"), heading ("8517") and sub-heading ("851712") lookups are all
+    O(log n + k) without touching the database.
+    """
+
+    def __init__(self, records: Dict[str, Dict]):
+        self._records = {normalize_code(code): record for code, record in records.items()}
+        self._codes = sorted(self._records)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, code) -> bool:
+        return normalize_code(code) in self._records
+
+    def exact(self, code) -> Optional[Dict]:
+        """Record for exactly this code, or None"""
+        return self._records.get(normalize_code(code))
+
+    def prefix(self, prefix, limit: Optional[int] = None) -> List[Dict]:
+        """All records whose code starts with prefix, in code order"""
+        prefix = normalize_code(prefix)
+        if not prefix:
+            return []
+        start = bisect_left(self._codes, prefix)
+        # Every code starting with prefix sorts before prefix + a char above all digits/letters
+        end = bisect_left(self._codes, prefix + "\x7f", start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [self._records[code] for code in self._codes[start:end]]
+
+    def longest_match(self, code) -> Optional[Dict]:
+        """Exact record, else the record for the longest indexed prefix of code.
+
+        A tariff item like "85171211" that is not listed falls back to its
+        sub-heading "851712", then heading "8517", then chapter "85".
+        """
+        code = normalize_code(code)
+        for length in range(len(code), MIN_FALLBACK_DIGITS - 1, -1):
+            record = self._records.get(code[:length])
+            if record is not None:
+                return record
+        return None
+
+    def codes(self) -> List[str]:
+        """All indexed codes in sorted order"""
+        return list(self._codes)
+
+
+class RateIndex:
+    """Pair of goods (HSN) and services (SAC) indexes built together.
+
+    Instances are never mutated; a refresh builds a new RateIndex and swaps
+    the reference, so readers always see one consistent snapshot.
+    """
+
+    def __init__(self, goods: Iterable[Dict] = (), services: Iterable[Dict] = ()):
+        self.goods = CodeIndex({record["hsn_code"]: record for record in goods})
+        self.services = CodeIndex({record["sac_code"]: record for record in services})
+
+    def __len__(self) -> int:
+        return len(self.goods) + len(self.services)
+
+    def hsn(self, code) -> Optional[Dict]:
+        return self.goods.exact(code)
+
+    def sac(self, code) -> Optional[Dict]:
+        return self.services.exact(code)
+
+    def lookup(self, code, fallback: bool = False) -> Optional[Dict]:
+        """Resolve a code of either type; optionally fall back to the longest known prefix"""
+        find = "longest_match" if fallback else "exact"
+        # SAC codes all live in chapter 99, which HSN does not use for goods
+        first, second = (self.services, self.goods) if normalize_code(code).startswith("99") else (self.goods, self.services)
+        return getattr(first, find)(code) or getattr(second, find)(code)
+
+    def prefix(self, prefix, limit: Optional[int] = None) -> List[Dict]:
+        """Prefix search across both code spaces (goods first)"""
+        results = self.goods.prefix(prefix, limit)
+        if limit is None or len(results) < limit:
+            results += self.services.prefix(prefix, None if limit is None else limit - len(results))
+        return results
@@ -0,0 +1,891 @@
+"""
+Database-driven GST service that fetches official rates from PostgreSQL
+"""
+
+import psycopg2
+import psycopg2.errors
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, List, Dict, Optional
+from .friendly_names import friendly_name_map
+from .code_index import RateIndex, normalize_code
+from .queries import (
+    BASE_TABLE_QUERIES,
+    FRIENDLY_NAMES_DDL,
+    FRIENDLY_NAMES_UPDATE,
+    STATS_QUERY,
+    STATS_SUMMARY_DDL,
+    STATS_SUMMARY_QUERY,
+    _goods_record,
+    _services_record,
+    _stats_from_row,
+    group_category_rows,
+)
+from .change_listener import CHANGE_NOTIFY_DDL, RateChangeListener
+from .circuit_breaker import CircuitBreaker
+from . import rate_snapshot, schema
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes available in time"""
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived database connections.
+
+    Connections are opened lazily through ``connect`` and reused across
+    requests so the SSL handshake is paid once per connection rather than
+    once per query. Idle connections are health-checked on checkout,
+    recycled after ``max_lifetime`` seconds and reaped after ``max_idle``
+    seconds (never below ``min_size``).
+    """
+
+    def __init__(self, connect, min_size=1, max_size=5, max_lifetime=1800.0,
+                 max_idle=300.0, checkout_timeout=30.0, health_check_after=30.0):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Invalid pool size: need 0 <= min_size <= max_size and max_size >= 1")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.checkout_timeout = checkout_timeout
+        self.health_check_after = health_check_after
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (conn, last_used) - most recently used on the right
+        self._created_at = {}  # id(conn) -> creation time
+        self._in_use = 0
+        self._closed = False
+        self._metrics = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "timeouts": 0,
+            "connections_opened": 0,
+            "connections_closed": 0,
+            "health_check_failures": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle + checked out)"""
+        return len(self._idle) + self._in_use
+
+    def _open(self):
+        conn = self._connect()
+        # Reads never need an explicit transaction; autocommit keeps pooled
+        # connections out of "idle in transaction" between checkouts.
+        conn.autocommit = True
+        with self._cond:
+            self._created_at[id(conn)] = time.monotonic()
+            self._metrics["connections_opened"] += 1
+        return conn
+
+    def _discard(self, conn):
+        """Close a connection and forget it. Caller must hold the lock."""
+        self._created_at.pop(id(conn), None)
+        self._metrics["connections_closed"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _expired(self, conn, now) -> bool:
+        created = self._created_at.get(id(conn), now)
+        return conn.closed or (self.max_lifetime and now - created > self.max_lifetime)
+
+    def _healthy(self, conn, last_used) -> bool:
+        """Cheap liveness check; only pings connections that sat idle a while"""
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.health_check_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    def _reap_idle(self, now):
+        """Close idle connections past max_idle, keeping min_size open. Caller must hold the lock."""
+        if not self.max_idle:
+            return
+        # Oldest idle connections sit on the left
+        while self._idle and self.size > self.min_size:
+            conn, last_used = self._idle[0]
+            if now - last_used <= self.max_idle:
+                break
+            self._idle.popleft()
+            self._discard(conn)
+
+    def getconn(self):
+        """Check out a connection, waiting up to checkout_timeout if the pool is exhausted"""
+        start = time.monotonic()
+        waited = False
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolTimeout("Connection pool is closed")
+                now = time.monotonic()
+                self._reap_idle(now)
+                candidate = None
+                while self._idle:
+                    conn, last_used = self._idle.pop()
+                    if self._expired(conn, now):
+                        self._discard(conn)
+                        continue
+                    candidate = (conn, last_used)
+                    break
+                if candidate is None and self.size >= self.max_size:
+                    remaining = self.checkout_timeout - (now - start)
+                    if remaining <= 0:
+                        self._metrics["timeouts"] += 1
+                        raise PoolTimeout(
+                            f"No database connection available within {self.checkout_timeout}s "
+                            f"(pool max_size={self.max_size})"
+                        )
+                    if not waited:
+                        waited = True
+                        self._metrics["waits"] += 1
+                    self._cond.wait(remaining)
+                    continue
+                # Reserve the slot before doing any network I/O outside the lock
+                self._in_use += 1
+
+            if candidate is not None:
+                conn, last_used = candidate
+                if not self._healthy(conn, last_used):
+                    with self._cond:
+                        self._metrics["health_check_failures"] += 1
+                        self._in_use -= 1
+                        self._discard(conn)
+                        self._cond.notify()
+                    continue
+            else:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._in_use -= 1
+                        self._cond.notify()
+                    raise
+
+            wait_time = time.monotonic() - start
+            with self._cond:
+                self._metrics["checkouts"] += 1
+                if waited:
+                    self._metrics["wait_time"] += wait_time
+                    self._metrics["max_wait_time"] = max(self._metrics["max_wait_time"], wait_time)
+            return conn
+
+    def putconn(self, conn, discard=False):
+        """Return a connection to the pool (or close it if broken/expired)"""
+        with self._cond:
+            self._in_use -= 1
+            now = time.monotonic()
+            if discard or self._closed or self._expired(conn, now):
+                self._discard(conn)
+            else:
+                self._idle.append((conn, now))
+                self._reap_idle(now)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out and always returns it"""
+        conn = self.getconn()
+        discard = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # Network/server-side failures leave the connection unusable
+            discard = True
+            raise
+        finally:
+            self.putconn(conn, discard=discard or conn.closed)
+
+    def close(self):
+        """Close all idle connections; checked-out ones are closed on return"""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._discard(conn)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict:
+        """Snapshot of pool usage metrics for sizing and monitoring"""
+        with self._cond:
+            stats = dict(self._metrics)
+            stats.update({
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+            })
+        stats["avg_wait_time"] = stats["wait_time"] / stats["waits"] if stats["waits"] else 0.0
+        return stats
+
+
+class SingleFlight:
+    """Collapse concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block on that call and receive the same result (or the same
+    exception) instead of issuing their own query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> [done_event, result, error]
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = [threading.Event(), None, None]
+                self._calls[key] = call
+
+        if leader:
+            try:
+                call[1] = fn()
+            except BaseException as e:
+                call[2] = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call[0].set()
+        else:
+            call[0].wait()
+
+        if call[2] is not None:
+            raise call[2]
+        return call[1]
+
+
+def _pool_settings_from_env() -> Dict:
+    """Read pool sizing from the environment (defaults suit a single basic-xs instance)"""
+    return {
+        "min_size": int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+        "max_size": int(os.getenv('DB_POOL_MAX_SIZE', '5')),
+        "max_lifetime": float(os.getenv('DB_POOL_MAX_LIFETIME', '1800')),
+        "max_idle": float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+        "checkout_timeout": float(os.getenv('DB_POOL_TIMEOUT', '30')),
+    }
+
+
+class DatabaseGSTService:
+    def __init__(self, pool_settings: Optional[Dict] = None):
+        self.connection_string = os.getenv('DATABASE_URL')
+        # Offline mode serves only the bundled snapshot and never connects
+        self.offline = os.getenv('GST_OFFLINE', '0') == '1'
+        self.snapshot_built_at = None
+        self._fallback_data = None  # Last-known-good categories, served during outages
+        self._cached_categories = None  # Add caching
+        self._categories_loaded_at = None  # Wall-clock time of the last successful load
+        self.categories_max_age = float(os.getenv('GST_CATEGORIES_MAX_AGE', '3600'))
+        self._last_good_lookups = {}  # (kind, code) -> last record read from the database
+        self.stats_ttl = float(os.getenv('GST_STATS_TTL', '600'))
+        self._stats_cache = (None, 0.0)  # (stats, expires_at)
+        self._stats_lock = threading.Lock()
+        self._stats_summary_available = None  # None = not probed yet
+        self._friendly_names_persisted = None
+        self._read_queries = None  # BASE_TABLE_QUERIES or schema.VIEW_QUERIES, probed on first read
+        self._code_index = None  # RateIndex, loaded on first prefix/lookup call
+        self._search_index = None  # (categories it was built from, ScenarioSearchIndex)
+        self._category_counts = None  # {category: scenario count}, before the full catalog is loaded
+        self._category_scenarios = {}  # category -> scenarios, loaded one category at a time
+        self.data_version = 0  # Bumped whenever cached rate data is replaced
+        self._refresh_lock = threading.Lock()
+        self._change_listener = None
+        self._single_flight = SingleFlight()
+        self._warm_up_thread = None
+        # Minimum seconds between background refreshes, so a failing refresh isn't retried per request
+        self.revalidate_interval = float(os.getenv('GST_REVALIDATE_INTERVAL', '60'))
+        self._last_revalidation = None  # time.monotonic() of the last background refresh started
+        self._revalidate_lock = threading.Lock()
+        # Fail fast while the database is down instead of waiting out connect_timeout
+        self._breaker = CircuitBreaker(
+            self._probe_database,
+            failure_threshold=int(os.getenv('DB_CIRCUIT_FAILURES', '3')),
+            probe_interval=float(os.getenv('DB_CIRCUIT_PROBE_INTERVAL', '5')),
+            on_close=lambda: self.revalidate_in_background(force=True),
+        )
+        self._pool = ConnectionPool(lambda: self._breaker.call(self.get_connection),
+                                    **(pool_settings or _pool_settings_from_env()))
+    
+    def get_connection(self):
+        """Get database connection with proper SSL configuration for DigitalOcean"""
+        if self.offline:
+            raise RuntimeError("Database access is disabled (GST_OFFLINE=1)")
+        try:
+            # Enhanced SSL configuration for cloud deployment
+            if self.connection_string:
+                # Parse connection string and add SSL settings
+                import urllib.parse
+                
+                # For DigitalOcean deployment, use specific SSL settings
+                ssl_params = {
+                    # PGSSLMODE=disable for a local development database
+                    'sslmode': os.getenv('PGSSLMODE', 'require'),
+                    'sslcert': None,
+                    'sslkey': None,
+                    'sslrootcert': None,
+                    'connect_timeout': 30
+                }
+                
+                return psycopg2.connect(self.connection_string, **ssl_params)
+            else:
+                # Fallback connection parameters with SSL
+                return psycopg2.connect(
+                    host=os.getenv('PGHOST', 'localhost'),
+                    port=os.getenv('PGPORT', '5432'),
+                    user=os.getenv('PGUSER'),
+                    password=os.getenv('PGPASSWORD'),
+                    database=os.getenv('PGDATABASE'),
+                    sslmode=os.getenv('PGSSLMODE', 'require'),
+                    connect_timeout=30
+                )
+        except Exception as e:
+            print(f"Database connection failed: {e}")
+            raise
+
+    def _probe_database(self):
+        """Recovery probe for the circuit breaker: open and close one connection"""
+        self.get_connection().close()
+
+    def pooled_connection(self):
+        """Borrow a long-lived connection from the shared pool (use as a context manager)"""
+        return self._pool.connection()
+
+    def get_pool_stats(self) -> Dict:
+        """Connection pool metrics (checkouts, waits, wait time, size)"""
+        return self._pool.stats()
+    
+    def get_categories_with_scenarios(self) -> Dict[str, List[Dict]]:
+        """Get all product categories and their scenarios from database with optimized single query"""
+        # Use aggressive caching for better performance with cloud databases
+        if self._cached_categories is not None:
+            # Stale-while-revalidate: answer now, refresh off the request path
+            if self._categories_are_stale():
+                self.revalidate_in_background()
+            return self._cached_categories
+            
+        try:
+            # Concurrent sessions on a cold cache share one in-flight query
+            return self._single_flight.do("categories", self._load_and_cache_categories)
+        except Exception as e:
+            print(f"Error fetching categories: {e}")
+            return self._fallback_data or {}
+    
+    def _load_and_cache_categories(self) -> Dict[str, List[Dict]]:
+        # Another flight may have filled the cache while we queued for the lock
+        if self._cached_categories is None:
+            # Cache the results for faster subsequent access
+            self._store_categories(self._load_categories())
+        return self._cached_categories
+    
+    def _store_categories(self, categories: Dict[str, List[Dict]]):
+        self._cached_categories = categories
+        self._fallback_data = categories
+        self._categories_loaded_at = time.time()
+        # The full catalog answers the per-category calls from now on
+        self._category_counts = None
+        self._category_scenarios = {}
+    
+    def _categories_are_stale(self) -> bool:
+        if self.offline or self._categories_loaded_at is None or not self.categories_max_age:
+            return False
+        return time.time() - self._categories_loaded_at > self.categories_max_age
+    
+    def in_memory(self, what: str, category: Optional[str] = None) -> bool:
+        """True when a read can be answered without a query.
+
+        what is "codes" (lookup_codes without a fallback index load),
+        "counts" (get_category_counts) or "category" (get_scenarios_for_category).
+        """
+        if what == "codes":
+            return self._code_index is not None
+        if self._cached_categories is not None:
+            return True
+        if what == "counts":
+            return self._category_counts is not None
+        return category in self._category_scenarios
+    
+    @property
+    def database_configured(self) -> bool:
+        return not self.offline and bool(self.connection_string or os.getenv('PGHOST'))
+    
+    def load_snapshot(self, path: Optional[str] = None, reconcile: bool = True) -> bool:
+        """Seed all caches from a build-time rate snapshot.
+
+        Returns False if there is no snapshot file. With reconcile=True and a
+        database configured, the data is refreshed from the database in the
+        background while the snapshot is served.
+        """
+        path = path or rate_snapshot.snapshot_path()
+        if not os.path.exists(path):
+            return False
+        try:
+            data = rate_snapshot.load_snapshot(path)
+        except Exception as e:
+            print(f"Error loading rate snapshot {path}: {e}")
+            return False
+        
+        self._store_categories(data["categories"])
+        self._categories_loaded_at = data["built_at"]
+        self.snapshot_built_at = data["built_at"]
+        self._code_index = RateIndex(data["goods"], data["services"])
+        if data["stats"]:
+            # Offline there is nothing to re-read, so snapshot stats never expire
+            ttl = float("inf") if not self.database_configured else self.stats_ttl
+            with self._stats_lock:
+                self._stats_cache = (data["stats"], time.monotonic() + ttl)
+        self.data_version += 1
+        
+        if reconcile and self.database_configured:
+            self.revalidate_in_background()
+        return True
+    
+    def revalidate_in_background(self, force: bool = False):
+        """Refresh cached data on a daemon thread unless the database is known to be down.
+
+        At most one refresh starts per revalidate_interval seconds; force=True
+        (used when the circuit closes again) skips that wait.
+        """
+        if self.offline or self._breaker.is_open:
+            # The recovery probe triggers revalidation when the circuit closes
+            return
+        with self._revalidate_lock:
+            now = time.monotonic()
+            last = self._last_revalidation
+            if not force and last is not None and now - last < self.revalidate_interval:
+                return
+            self._last_revalidation = now
+        threading.Thread(
+            target=self._single_flight.do, args=("revalidate", self.refresh_caches),
+            name="gst-revalidate", daemon=True,
+        ).start()
+    
+    def get_data_status(self) -> Dict:
+        """How fresh the served rate data is, for surfacing in the UI"""
+        loaded_at = self._categories_loaded_at
+        age = time.time() - loaded_at if loaded_at is not None else None
+        return {
+            "loaded_at": loaded_at,
+            "age_seconds": age,
+            "database_available": self.database_configured and not self._breaker.is_open,
+            "offline": self.offline,
+            "snapshot_built_at": self.snapshot_built_at,
+            "stale": self._breaker.is_open or (age is not None and self._categories_are_stale()),
+            "circuit": self._breaker.stats(),
+        }
+    
+    def _load_categories(self, category: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Run the category query and group rows into scenarios (raises on database errors).
+
+        With a category name only that category's rows are read.
+        """
+        key, params = ("categories", None) if category is None else ("category", (category,))
+        
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            queries = self._queries(cur)
+            # Single optimized query with JOINs to get all data at once
+            if self._friendly_names_persisted is not False:
+                try:
+                    cur.execute(queries[key + "_persisted"], params)
+                    self._friendly_names_persisted = True
+                    return group_category_rows(cur.fetchall())
+                except psycopg2.errors.UndefinedColumn:
+                    # Names not persisted; compute them on load from now on
+                    self._friendly_names_persisted = False
+            
+            cur.execute(queries[key], params)
+            results = cur.fetchall()
+        
+        return group_category_rows(results)
+    
+    def _queries(self, cur) -> Dict[str, str]:
+        """Read queries for this database: the current-rate views if installed, else the base tables"""
+        if self._read_queries is None:
+            cur.execute(schema.CURRENT_RATES_INSTALLED_QUERY)
+            self._read_queries = schema.VIEW_QUERIES if cur.fetchone()[0] else BASE_TABLE_QUERIES
+        return self._read_queries
+    
+    def install_current_rates(self):
+        """Create the materialized current-rate views (see gst/schema.py) and read from them"""
+        with self.pooled_connection() as conn:
+            schema.install(conn)
+        self._read_queries = None
+        self._friendly_names_persisted = None
+    
+    def get_category_counts(self) -> Dict[str, int]:
+        """Category names with their scenario counts, without loading any scenarios"""
+        categories = self._cached_categories
+        if categories is not None:
+            return {name: len(data["scenarios"]) for name, data in categories.items()}
+        if self._category_counts is not None:
+            if self._categories_are_stale():
+                self.revalidate_in_background()
+            return self._category_counts
+        
+        try:
+            return self._single_flight.do("category_counts", self._load_category_counts)
+        except Exception as e:
+            print(f"Error fetching category names: {e}")
+            fallback = self._fallback_data or {}
+            return {name: len(data["scenarios"]) for name, data in fallback.items()}
+    
+    def _load_category_counts(self) -> Dict[str, int]:
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            cur.execute(self._queries(cur)["category_counts"])
+            counts = {name: count for name, count in cur.fetchall()}
+        self._category_counts = counts
+        if self._categories_loaded_at is None:
+            self._categories_loaded_at = time.time()
+        return counts
+    
+    def get_scenarios_for_category(self, category: str) -> List[Dict]:
+        """Scenarios of one category, loaded with a per-category query on first access"""
+        categories = self._cached_categories
+        if categories is not None:
+            # The full catalog is in memory (warm-up, snapshot or bulk load)
+            return categories.get(category, {}).get("scenarios", [])
+        
+        scenarios = self._category_scenarios.get(category)
+        if scenarios is not None:
+            return scenarios
+        
+        try:
+            return self._single_flight.do(("category", category),
+                                         lambda: self._load_category_scenarios(category))
+        except Exception as e:
+            print(f"Error fetching scenarios for {category}: {e}")
+            return (self._fallback_data or {}).get(category, {}).get("scenarios", [])
+    
+    def _load_category_scenarios(self, category: str) -> List[Dict]:
+        scenarios = self._load_categories(category).get(category, {}).get("scenarios", [])
+        self._category_scenarios[category] = scenarios
+        return scenarios
+    
+    def install_friendly_names(self) -> int:
+        """Store precomputed friendly names in product_categories.friendly_name.
+
+        The category loader then reads them instead of converting names on
+        every load. Rows added later without a stored name are still
+        converted on load, so re-run this after catalog updates.
+        """
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            cur.execute(FRIENDLY_NAMES_DDL)
+            cur.execute("SELECT DISTINCT subcategory_name FROM product_categories WHERE subcategory_name IS NOT NULL")
+            names = friendly_name_map(row[0] for row in cur.fetchall())
+            cur.execute(FRIENDLY_NAMES_UPDATE, (list(names), list(names.values())))
+            updated = cur.rowcount
+        self._friendly_names_persisted = None
+        return updated
+    
+    def search_gst_by_hsn(self, hsn_code: str) -> Optional[Dict]:
+        """Search GST rate by HSN code"""
+        # Answer from the in-memory index when it has been loaded
+        if self._code_index is not None:
+            return self._code_index.hsn(hsn_code)
+        
+        return self._search_code("hsn", hsn_code, _goods_record)
+    
+    def search_gst_by_sac(self, sac_code: str) -> Optional[Dict]:
+        """Search GST rate by SAC code"""
+        if self._code_index is not None:
+            return self._code_index.sac(sac_code)
+        
+        return self._search_code("sac", sac_code, _services_record)
+    
+    def _search_code(self, kind: str, code: str, make_record) -> Optional[Dict]:
+        """Single-code lookup that falls back to the last answer seen for the code"""
+        try:
+            with self.pooled_connection() as conn, conn.cursor() as cur:
+                cur.execute(self._queries(cur)[kind], (code,))
+                result = cur.fetchone()
+        except Exception as e:
+            print(f"Error searching {kind.upper()}: {e}")
+            # Serve the last known answer while the database is unreachable
+            return self._last_good_lookups.get((kind, code))
+        
+        record = make_record(result) if result else None
+        if record is not None:
+            self._last_good_lookups[(kind, code)] = record
+        return record
+    
+    def lookup_codes(self, codes: Iterable[str], fallback: bool = False) -> Dict:
+        """Resolve many HSN/SAC codes at once.
+
+        Returns {"results": {code: record}, "missing": [codes]} keyed by the
+        codes as given. Uses the in-memory index when it is loaded, otherwise
+        one set-based query over both rate tables. With fallback=True unknown
+        codes resolve to their longest known prefix, which needs the index,
+        so it is loaded first if it isn't yet.
+        """
+        codes = list(dict.fromkeys(code for code in codes if code))
+        results = {}
+        
+        if fallback and self._code_index is None and codes:
+            try:
+                self.get_code_index()
+            except Exception as e:
+                # Exact matches from the query below are still better than nothing
+                print(f"Error loading code index for prefix fallback: {e}")
+        
+        if self._code_index is not None:
+            for code in codes:
+                record = self._code_index.lookup(code, fallback=fallback)
+                if record is not None:
+                    results[code] = record
+        elif codes:
+            by_normalized = {}
+            for code in codes:
+                by_normalized.setdefault(normalize_code(code), []).append(code)
+            try:
+                with self.pooled_connection() as conn, conn.cursor() as cur:
+                    cur.execute(self._queries(cur)["bulk_lookup"], (list(by_normalized), list(by_normalized)))
+                    rows = cur.fetchall()
+            except Exception as e:
+                print(f"Error in bulk code lookup: {e}")
+                rows = []
+                # Fall back to whatever we last read for each code
+                for code in codes:
+                    record = self._last_good_lookups.get(("hsn", code)) or self._last_good_lookups.get(("sac", code))
+                    if record is not None:
+                        results[code] = record
+            
+            for kind, *row in rows:
+                if kind == "goods":
+                    record, key = _goods_record(row), ("hsn", row[0])
+                else:
+                    record, key = _services_record(row[:5]), ("sac", row[0])
+                self._last_good_lookups[key] = record
+                for code in by_normalized.get(row[0], ()):
+                    # A code present in both tables resolves to goods first
+                    results.setdefault(code, record)
+        
+        return {
+            "results": results,
+            "missing": [code for code in codes if code not in results],
+        }
+    
+    def get_code_index(self) -> RateIndex:
+        """In-memory HSN/SAC index, loaded from the rate tables on first use"""
+        if self._code_index is None:
+            return self._single_flight.do("code_index", self.refresh_code_index)
+        return self._code_index
+    
+    def refresh_code_index(self) -> RateIndex:
+        """Rebuild the code index from the database and swap it in atomically"""
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            queries = self._queries(cur)
+            cur.execute(queries["index_goods"])
+            goods = [_goods_record(row) for row in cur.fetchall()]
+            
+            cur.execute(queries["index_services"])
+            services = [_services_record(row) for row in cur.fetchall()]
+        
+        # Build fully before publishing so readers never see a half-built index
+        index = RateIndex(goods, services)
+        self._code_index = index
+        return index
+    
+    def search_by_prefix(self, prefix: str, limit: Optional[int] = None) -> List[Dict]:
+        """All HSN/SAC rates under a chapter or heading prefix such as 85 or 8517"""
+        return self.get_code_index().prefix(prefix, limit)
+    
+    def lookup_code(self, code: str, fallback: bool = True) -> Optional[Dict]:
+        """Resolve an HSN or SAC code, falling back to the longest known prefix"""
+        return self.get_code_index().lookup(code, fallback=fallback)
+    
+    def search_scenarios(self, query: str, limit: int = 10) -> List[Dict]:
+        """Fuzzy search over all scenarios, e.g. "laptop" or "hotel 5000".
+
+        Returns [{"category", "scenario", "score"}] best first. The index is
+        rebuilt whenever the loaded categories change.
+        """
+        categories = self.get_categories_with_scenarios()
+        index = self._search_index
+        if index is None or index[0] is not categories:
+            from .scenario_search import ScenarioSearchIndex
+            index = (categories, ScenarioSearchIndex(categories))
+            self._search_index = index
+        return index[1].search(query, limit)
+    
+    def get_database_stats(self) -> Dict:
+        """Get database statistics (served from a process-wide TTL cache)"""
+        with self._stats_lock:
+            cached, expires_at = self._stats_cache
+            if cached is not None and time.monotonic() < expires_at:
+                return cached
+        
+        try:
+            stats = self._single_flight.do("stats", self._fetch_database_stats)
+        except Exception as e:
+            print(f"Error getting stats: {e}")
+            stats = {}
+        # Don't cache failures so the next render retries; serve the stale copy meanwhile
+        if not stats:
+            return cached or {}
+        with self._stats_lock:
+            self._stats_cache = (stats, time.monotonic() + self.stats_ttl)
+        return stats
+    
+    def invalidate_stats(self):
+        """Expire cached statistics so the next call re-reads them"""
+        with self._stats_lock:
+            # The stale copy stays as a fallback if the re-read fails
+            self._stats_cache = (self._stats_cache[0], 0.0)
+    
+    def _fetch_database_stats(self) -> Dict:
+        """Read statistics in a single round-trip, preferring the precomputed summary row"""
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            if self._stats_summary_available is not False:
+                try:
+                    cur.execute(STATS_SUMMARY_QUERY)
+                    row = cur.fetchone()
+                    self._stats_summary_available = row is not None
+                    if row:
+                        return _stats_from_row(row)
+                except psycopg2.errors.UndefinedTable:
+                    # Summary table not installed; use the combined query from now on
+                    self._stats_summary_available = False
+                except Exception as e:
+                    print(f"Error reading stats summary: {e}")
+            
+            try:
+                cur.execute(STATS_QUERY)
+                return _stats_from_row(cur.fetchone())
+                
+            except Exception as e:
+                print(f"Error getting stats: {e}")
+                return {}
+    
+    def install_stats_summary(self):
+        """Create the gst_rate_stats summary table and the triggers that keep it current"""
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            cur.execute(STATS_SUMMARY_DDL)
+        self._stats_summary_available = None
+        self.invalidate_stats()
+    
+    def warm_up(self, background: bool = True):
+        """Load category names, stats and the code index ahead of the first request.
+
+        Scenarios are loaded per category on first access; set
+        GST_PRELOAD_CATALOG=1 to load the full catalog up front instead.
+        In the background the warm-up joins the same single-flight calls as
+        user requests, so a visitor arriving mid-warm-up waits on it rather
+        than starting a second query.
+        """
+        def _warm():
+            start = time.monotonic()
+            if os.getenv('GST_PRELOAD_CATALOG', '0') == '1':
+                self.get_categories_with_scenarios()
+            categories = self.get_category_counts()
+            self.get_database_stats()
+            try:
+                self.get_code_index()
+            except Exception as e:
+                print(f"Error loading code index: {e}")
+            print(f"GST data warm-up finished in {time.monotonic() - start:.2f}s ({len(categories)} categories)")
+        
+        if not background:
+            _warm()
+            return None
+        if self._warm_up_thread is None or not self._warm_up_thread.is_alive():
+            self._warm_up_thread = threading.Thread(target=_warm, name="gst-warm-up", daemon=True)
+            self._warm_up_thread.start()
+        return self._warm_up_thread
+    
+    def refresh_caches(self, tables=None):
+        """Reload cached rate data in place and bump data_version.
+
+        The old data keeps being served until the new data is fully loaded,
+        so callers are never blocked on a refresh.
+        """
+        with self._refresh_lock:
+            try:
+                if self._cached_categories is not None:
+                    self._store_categories(self._load_categories())
+                elif self._category_counts is not None:
+                    # Lazy mode: re-read the names and only the categories already opened
+                    scenarios = {category: self._load_categories(category).get(category, {}).get("scenarios", [])
+                                 for category in list(self._category_scenarios)}
+                    self._load_category_counts()
+                    self._category_scenarios = scenarios
+                    self._categories_loaded_at = time.time()
+            except Exception as e:
+                # Keep serving what we have; the next change retries
+                print(f"Error refreshing categories: {e}")
+                return
+            if self._code_index is not None:
+                try:
+                    self.refresh_code_index()
+                except Exception as e:
+                    print(f"Error refreshing code index: {e}")
+            self.invalidate_stats()
+            self.data_version += 1
+    
+    def start_change_listener(self) -> bool:
+        """Start the background LISTEN thread that refreshes caches on rate changes"""
+        if not self.database_configured:
+            return False
+        if self._change_listener is not None and self._change_listener.is_alive():
+            return False
+        self._change_listener = RateChangeListener(
+            self.get_connection,
+            self.refresh_caches,
+            debounce=float(os.getenv('GST_CHANGE_DEBOUNCE', '1.0')),
+        )
+        self._change_listener.start()
+        return True
+    
+    def stop_change_listener(self):
+        if self._change_listener is not None:
+            self._change_listener.stop()
+            self._change_listener = None
+    
+    def install_change_notifications(self):
+        """Create the triggers that NOTIFY the listener when rate tables change"""
+        with self.pooled_connection() as conn, conn.cursor() as cur:
+            cur.execute(CHANGE_NOTIFY_DDL)
+
+# Global instance, created on first use so importing this module does no I/O
+_service = None
+_service_lock = threading.Lock()
+
+def get_service() -> DatabaseGSTService:
+    """The process-wide service, seeded from the bundled snapshot (if built) on first call"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                service = DatabaseGSTService()
+                # Serve the snapshot until the database has been consulted
+                service.load_snapshot()
+                _service = service
+    return _service
+
+def __getattr__(name):
+    # Keeps "from gst.database_gst_service import gst_db_service" working, lazily
+    if name == "gst_db_service":
+        return get_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_category_list():
+    """Return list of available categories from database"""
+    return list(get_service().get_category_counts())
+
+def get_category_scenarios(category):
+    """Get scenarios for a specific category from database"""
+    return get_service().get_scenarios_for_category(category)
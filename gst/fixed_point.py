@@ -0,0 +1,220 @@
+"""
+Exact fixed-point GST arithmetic on integer paise
+
+Amounts are integer paise and rates are percentages scaled by RATE_SCALE
+(18% -> 180000, 0.25% -> 2500), so every tax is an exact integer product
+followed by a single rounded division. Batches use int64 NumPy arrays and
+stay at integer-arithmetic speed; no floats or Decimals in the hot path.
+
+Intra-state supplies charge CGST and SGST, each rounded on its own, so the
+tax is their sum (100.05 at 18% is 900 + 900 paise, not 1801 rounded from
+IGST). Inter-state supplies charge the rounded IGST. Each result carries
+one tax figure, gst_amount == total_gst, so reconciliations never see two.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP as _DECIMAL_HALF_UP
+from typing import Dict, Iterable, List, Optional
+
+# Rates carry four decimal places of a percent (e.g. 0.1%, 1.5% cess, 12.5%)
+RATE_SCALE = 10000
+# tax_paise = amount_paise * rate_units / TAX_DIVISOR
+TAX_DIVISOR = 100 * RATE_SCALE
+
+# Rounding modes for the final division to whole paise
+ROUND_HALF_UP = "half_up"      # 0.5 paise rounds away from zero
+ROUND_HALF_EVEN = "half_even"  # banker's rounding
+ROUND_DOWN = "down"            # truncate toward zero
+ROUND_UP = "up"                # away from zero
+ROUNDING_MODES = (ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_DOWN, ROUND_UP)
+
+# Where rounding happens for multi-line invoices
+PER_LINE = "line"        # round each line's tax, then sum
+PER_INVOICE = "invoice"  # sum exact line taxes, round once per invoice
+ROUNDING_LEVELS = (PER_LINE, PER_INVOICE)
+
+# Calculation modes of the bulk pipeline, the CLI and the API batch endpoint
+FLOAT_MODE = "float"  # utils.calculate_gst_batch, figures rounded to paise for output
+PAISE_MODE = "paise"  # this module, exact integer paise
+CALCULATION_MODES = (FLOAT_MODE, PAISE_MODE)
+
+# Largest amount whose product with a 100% rate still fits in int64
+MAX_PAISE = (2 ** 63 - 1) // TAX_DIVISOR
+
+
+def to_paise(amount) -> int:
+    """Convert rupees (str, int, float or Decimal) to integer paise, half-up"""
+    if isinstance(amount, float):
+        # repr() gives the shortest string that round-trips, e.g. 0.1 -> "0.1"
+        amount = repr(amount)
+    paise = (Decimal(amount) * 100).quantize(Decimal(1), rounding=_DECIMAL_HALF_UP)
+    return int(paise)
+
+
+def from_paise(paise) -> Decimal:
+    """Integer paise back to an exact rupee Decimal"""
+    return Decimal(int(paise)).scaleb(-2)
+
+
+def rate_to_units(rate) -> int:
+    """Convert a percentage rate (NUMERIC/Decimal, str or float) to scaled integer units"""
+    if isinstance(rate, float):
+        rate = repr(rate)
+    units = Decimal(rate) * RATE_SCALE
+    if units != units.to_integral_value():
+        raise ValueError(f"Rate {rate} has more than 4 decimal places")
+    return int(units)
+
+
+def _round_div(numerator: int, divisor: int, rounding: str) -> int:
+    """Integer division of numerator by a positive divisor with the given rounding"""
+    sign = -1 if numerator < 0 else 1
+    quotient, remainder = divmod(abs(numerator), divisor)
+    if rounding == ROUND_HALF_UP:
+        quotient += remainder * 2 >= divisor
+    elif rounding == ROUND_HALF_EVEN:
+        quotient += remainder * 2 > divisor or (remainder * 2 == divisor and quotient % 2 == 1)
+    elif rounding == ROUND_UP:
+        quotient += remainder > 0
+    elif rounding != ROUND_DOWN:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+    return sign * quotient
+
+
+def _round_div_array(numerator, divisor: int, rounding: str):
+    """Vectorized _round_div over an int64 array"""
+    import numpy as np
+
+    sign = np.where(numerator < 0, -1, 1)
+    quotient, remainder = np.divmod(np.abs(numerator), divisor)
+    if rounding == ROUND_HALF_UP:
+        quotient += remainder * 2 >= divisor
+    elif rounding == ROUND_HALF_EVEN:
+        quotient += (remainder * 2 > divisor) | ((remainder * 2 == divisor) & (quotient % 2 == 1))
+    elif rounding == ROUND_UP:
+        quotient += remainder > 0
+    elif rounding != ROUND_DOWN:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+    return sign * quotient
+
+
+def _totals(base, cgst_amount, sgst_amount, igst_amount, cess_amount, inter_state: bool) -> Dict:
+    """Result dict with the tax total taken from the components actually charged"""
+    # 0 * x is a zero of the same type and shape (int or int64 array)
+    if inter_state:
+        cgst_amount = sgst_amount = 0 * igst_amount
+        gst_amount = igst_amount
+    else:
+        igst_amount = 0 * igst_amount
+        gst_amount = cgst_amount + sgst_amount
+    return {
+        "base_amount": base,
+        "gst_amount": gst_amount,
+        "cgst_amount": cgst_amount,
+        "sgst_amount": sgst_amount,
+        "igst_amount": igst_amount,
+        "total_gst": gst_amount,
+        "cess_amount": cess_amount,
+        "total_amount": base + gst_amount + cess_amount,
+    }
+
+
+def calculate_gst_paise(amount_paise: int, igst_units: int, cgst_units: Optional[int] = None,
+                        sgst_units: Optional[int] = None, cess_units: int = 0,
+                        rounding: str = ROUND_HALF_UP, inter_state: bool = False) -> Dict[str, int]:
+    """Exact GST for one line; every figure is integer paise"""
+    if cgst_units is None:
+        cgst_units = igst_units // 2
+    if sgst_units is None:
+        sgst_units = igst_units - cgst_units
+
+    return _totals(
+        amount_paise,
+        _round_div(amount_paise * cgst_units, TAX_DIVISOR, rounding),
+        _round_div(amount_paise * sgst_units, TAX_DIVISOR, rounding),
+        _round_div(amount_paise * igst_units, TAX_DIVISOR, rounding),
+        _round_div(amount_paise * cess_units, TAX_DIVISOR, rounding),
+        inter_state,
+    )
+
+
+def calculate_gst_paise_batch(amounts_paise, igst_units, cgst_units=None, sgst_units=None,
+                              cess_units=None, rounding: str = ROUND_HALF_UP, outer: bool = False,
+                              inter_state: bool = False):
+    """Integer counterpart of utils.calculate_gst_batch over int64 arrays.
+
+    Inputs broadcast like calculate_gst_batch; with outer=True every amount
+    is taxed under every rate scenario. Returns a dict of int64 arrays.
+    """
+    import numpy as np
+
+    amounts = np.asarray(amounts_paise, dtype=np.int64)
+    igst = np.asarray(igst_units, dtype=np.int64)
+    cgst = np.asarray(cgst_units if cgst_units is not None else igst // 2, dtype=np.int64)
+    sgst = np.asarray(sgst_units if sgst_units is not None else igst - cgst, dtype=np.int64)
+    cess = np.asarray(cess_units if cess_units is not None else 0, dtype=np.int64)
+
+    if amounts.size and np.abs(amounts).max() > MAX_PAISE:
+        raise OverflowError(f"Amounts above {MAX_PAISE} paise would overflow int64")
+    if outer:
+        amounts = amounts.reshape(-1, 1)
+
+    igst_amount = _round_div_array(amounts * igst, TAX_DIVISOR, rounding)
+    cgst_amount = _round_div_array(amounts * cgst, TAX_DIVISOR, rounding)
+    sgst_amount = _round_div_array(amounts * sgst, TAX_DIVISOR, rounding)
+    cess_amount = _round_div_array(amounts * cess, TAX_DIVISOR, rounding)
+    shape = np.broadcast_shapes(igst_amount.shape, cgst_amount.shape, sgst_amount.shape, cess_amount.shape)
+
+    return _totals(np.broadcast_to(amounts, shape), np.broadcast_to(cgst_amount, shape),
+                   np.broadcast_to(sgst_amount, shape), np.broadcast_to(igst_amount, shape),
+                   np.broadcast_to(cess_amount, shape), inter_state)
+
+
+def round_invoice(base_paise: int, numerators: Dict[str, int], rounding: str = ROUND_HALF_UP,
+                  inter_state: bool = False) -> Dict[str, int]:
+    """Invoice totals from exact tax numerators, rounding each tax once.
+
+    numerators maps cgst_amount, sgst_amount, igst_amount and cess_amount to
+    the sum of amount_paise * rate_units over the invoice's lines.
+    """
+    rounded = {key: _round_div(numerators.get(key, 0), TAX_DIVISOR, rounding)
+               for key in ("cgst_amount", "sgst_amount", "igst_amount", "cess_amount")}
+    return _totals(base_paise, rounded["cgst_amount"], rounded["sgst_amount"], rounded["igst_amount"],
+                   rounded["cess_amount"], inter_state)
+
+
+def calculate_invoice_paise(lines: Iterable[Dict], rounding: str = ROUND_HALF_UP,
+                            rounding_level: str = PER_LINE, inter_state: bool = False) -> Dict:
+    """Exact GST totals for an invoice.
+
+    Each line is a dict with "amount" (paise) and "igst" units, plus optional
+    "cgst", "sgst" and "cess" units. With PER_LINE each line's tax is rounded
+    to paise before summing; with PER_INVOICE the exact products are summed
+    and each tax (CGST, SGST or IGST, and cess) is rounded once per invoice.
+    """
+    if rounding_level not in (PER_LINE, PER_INVOICE):
+        raise ValueError(f"Unknown rounding level: {rounding_level}")
+
+    line_results: List[Dict[str, int]] = []
+    numerators = {"cgst_amount": 0, "sgst_amount": 0, "igst_amount": 0, "cess_amount": 0}
+    base_total = 0
+    for line in lines:
+        amount = line["amount"]
+        igst = line["igst"]
+        cgst = line.get("cgst", igst // 2)
+        sgst = line.get("sgst", igst - cgst)
+        cess = line.get("cess", 0)
+        base_total += amount
+        line_results.append(calculate_gst_paise(amount, igst, cgst, sgst, cess, rounding, inter_state))
+        numerators["igst_amount"] += amount * igst
+        numerators["cgst_amount"] += amount * cgst
+        numerators["sgst_amount"] += amount * sgst
+        numerators["cess_amount"] += amount * cess
+
+    if rounding_level == PER_LINE:
+        rounded = {key: sum(result[key] for result in line_results) for key in numerators}
+        totals = _totals(base_total, rounded["cgst_amount"], rounded["sgst_amount"], rounded["igst_amount"],
+                         rounded["cess_amount"], inter_state)
+    else:
+        totals = round_invoice(base_total, numerators, rounding, inter_state)
+    totals["lines"] = line_results
+    return totals
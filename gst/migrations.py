@@ -0,0 +1,240 @@
+"""
+Versioned schema migrations and query-plan verification
+
+Migrations are applied in order and recorded in gst_schema_migrations, so
+running them again is a no-op. Each one is idempotent on its own as well,
+which lets them adopt a database whose tables were created by hand.
+
+    python -m gst.migrations status
+    python -m gst.migrations migrate
+    python -m gst.migrations verify [--strict] [--min-rows N]
+
+verify runs EXPLAIN on every read query the service issues and fails if a
+plan sequentially scans a large table where an index should be used.
+Queries that by design read a whole table (full catalog load, index
+build, statistics) are allowed to scan that table.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import schema
+from .queries import (
+    BASE_TABLE_QUERIES,
+    STATS_QUERY,
+    STATS_SUMMARY_QUERY,
+)
+
+MIGRATIONS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS gst_schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT NOW()
+    )
+"""
+
+# (version, name, sql). Never edit an applied migration; add a new one.
+MIGRATIONS: List[Tuple[int, str, str]] = [
+    (1, "rate and category tables", """
+        CREATE TABLE IF NOT EXISTS gst_goods_rates (
+            id SERIAL PRIMARY KEY,
+            hsn_code VARCHAR(10),
+            description TEXT,
+            cgst_rate NUMERIC(5, 2),
+            sgst_rate NUMERIC(5, 2),
+            igst_rate NUMERIC(5, 2),
+            compensation_cess NUMERIC(6, 2),
+            effective_from DATE NOT NULL DEFAULT CURRENT_DATE,
+            is_active BOOLEAN NOT NULL DEFAULT TRUE,
+            last_updated TIMESTAMP NOT NULL DEFAULT NOW()
+        );
+
+        CREATE TABLE IF NOT EXISTS gst_services_rates (
+            id SERIAL PRIMARY KEY,
+            sac_code VARCHAR(10),
+            description TEXT,
+            cgst_rate NUMERIC(5, 2),
+            sgst_rate NUMERIC(5, 2),
+            igst_rate NUMERIC(5, 2),
+            effective_from DATE NOT NULL DEFAULT CURRENT_DATE,
+            is_active BOOLEAN NOT NULL DEFAULT TRUE,
+            last_updated TIMESTAMP NOT NULL DEFAULT NOW()
+        );
+
+        CREATE TABLE IF NOT EXISTS product_categories (
+            id SERIAL PRIMARY KEY,
+            category_name TEXT NOT NULL,
+            subcategory_name TEXT NOT NULL,
+            hsn_code VARCHAR(10),
+            sac_code VARCHAR(10)
+        );
+    """),
+    (2, "latest-active-rate and category indexes", """
+        -- "Latest active rate for a code": equality on code and is_active,
+        -- then the newest effective_from first, so LIMIT 1 reads one entry
+        CREATE INDEX IF NOT EXISTS gst_goods_rates_code_active_idx
+            ON gst_goods_rates (hsn_code, is_active, effective_from DESC);
+        CREATE INDEX IF NOT EXISTS gst_services_rates_code_active_idx
+            ON gst_services_rates (sac_code, is_active, effective_from DESC);
+
+        -- Per-category scenario loads and the ordered catalog read
+        CREATE INDEX IF NOT EXISTS product_categories_category_idx
+            ON product_categories (category_name, subcategory_name);
+    """),
+    (3, "stored friendly names", """
+        ALTER TABLE product_categories ADD COLUMN IF NOT EXISTS friendly_name TEXT;
+    """),
+]
+
+# Tables each query may scan in full because it reads every row by design
+FULL_SCAN_ALLOWED: Dict[str, set] = {
+    "categories": {"product_categories", schema.CATEGORY_RATES_VIEW},
+    "categories_persisted": {"product_categories", schema.CATEGORY_RATES_VIEW},
+    "category_counts": {"product_categories", schema.CATEGORY_RATES_VIEW},
+    "index_goods": {"gst_goods_rates", schema.CURRENT_RATES_VIEW},
+    "index_services": {"gst_services_rates", schema.CURRENT_RATES_VIEW},
+    "stats": {"gst_goods_rates", "gst_services_rates", "product_categories"},
+    "stats_summary": {"gst_rate_stats"},
+}
+
+# Parameters to plan each query with
+SAMPLE_PARAMS = {
+    "category": ("Electronics",),
+    "category_persisted": ("Electronics",),
+    "hsn": ("8471",),
+    "sac": ("996311",),
+    "bulk_lookup": (["8471", "996311"], ["8471", "996311"]),
+}
+
+
+def applied_versions(conn) -> Dict[int, str]:
+    with conn.cursor() as cur:
+        cur.execute(MIGRATIONS_TABLE_DDL)
+        cur.execute("SELECT version, name FROM gst_schema_migrations ORDER BY version")
+        return dict(cur.fetchall())
+
+
+def migrate(conn, target: Optional[int] = None) -> List[int]:
+    """Apply pending migrations up to target (default: all); returns the versions applied"""
+    applied = applied_versions(conn)
+    done = []
+    for version, name, sql in MIGRATIONS:
+        if version in applied or (target is not None and version > target):
+            continue
+        # One transaction per migration so a failure leaves no half-applied step
+        autocommit = conn.autocommit
+        conn.autocommit = False
+        try:
+            with conn.cursor() as cur:
+                cur.execute(sql)
+                cur.execute("INSERT INTO gst_schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.autocommit = autocommit
+        print(f"Applied migration {version}: {name}")
+        done.append(version)
+    return done
+
+
+def _relation_exists(cur, name: str) -> bool:
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+    return cur.fetchone()[0]
+
+
+def _seq_scans(plan: Dict) -> Iterable[Tuple[str, float]]:
+    """(relation, estimated rows) for every Seq Scan node in a JSON plan"""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan.get("Relation Name"), plan.get("Plan Rows", 0)
+    for child in plan.get("Plans", ()):
+        yield from _seq_scans(child)
+
+
+def queries_to_verify(cur) -> Dict[str, str]:
+    """Every read query the service can issue against this database, by name"""
+    queries = {f"base.{name}": sql for name, sql in BASE_TABLE_QUERIES.items()}
+    queries["base.stats"] = STATS_QUERY
+    if _relation_exists(cur, "gst_rate_stats"):
+        queries["base.stats_summary"] = STATS_SUMMARY_QUERY
+    if _relation_exists(cur, schema.CURRENT_RATES_VIEW) and _relation_exists(cur, schema.CATEGORY_RATES_VIEW):
+        queries.update({f"views.{name}": sql for name, sql in schema.VIEW_QUERIES.items()})
+    return queries
+
+
+def verify(conn, min_rows: int = 10000, strict: bool = False) -> List[str]:
+    """EXPLAIN every service query; returns a list of problems (empty = all good).
+
+    A sequential scan is a problem when the table holds at least min_rows
+    rows (by the planner's statistics) and the query is not allowed a full
+    read of it. With strict=True sequential scans are disabled while
+    planning, so any remaining one means no usable index exists at all;
+    this checks index coverage on a small development database.
+    """
+    problems = []
+    with conn.cursor() as cur:
+        cur.execute("SELECT relname, reltuples FROM pg_class WHERE relkind IN ('r', 'm')")
+        table_rows = dict(cur.fetchall())
+        if strict:
+            cur.execute("SET enable_seqscan = off")
+        try:
+            for name, sql in queries_to_verify(cur).items():
+                key = name.split(".", 1)[1]
+                try:
+                    cur.execute("EXPLAIN (FORMAT JSON) " + sql, SAMPLE_PARAMS.get(key))
+                except Exception as e:
+                    problems.append(f"{name}: EXPLAIN failed: {e}")
+                    continue
+                plan = cur.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                for relation, _ in _seq_scans(plan[0]["Plan"]):
+                    if relation in FULL_SCAN_ALLOWED.get(key, ()):
+                        continue
+                    rows = table_rows.get(relation, 0)
+                    if strict or rows >= min_rows:
+                        problems.append(f"{name}: sequential scan on {relation} (~{int(max(rows, 0))} rows)")
+                print(f"{'FAIL' if any(p.startswith(name + ':') for p in problems) else 'ok  '} {name}")
+        finally:
+            if strict:
+                cur.execute("RESET enable_seqscan")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m gst.migrations", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="list applied and pending migrations")
+    migrate_parser = sub.add_parser("migrate", help="apply pending migrations")
+    migrate_parser.add_argument("--to", type=int, help="stop after this version")
+    verify_parser = sub.add_parser("verify", help="EXPLAIN every service query and fail on sequential scans")
+    verify_parser.add_argument("--min-rows", type=int, default=10000,
+                               help="only flag sequential scans on tables at least this large (default 10000)")
+    verify_parser.add_argument("--strict", action="store_true",
+                               help="plan with sequential scans disabled to prove an index exists for each query")
+    args = parser.parse_args(argv)
+
+    from .database_gst_service import get_service
+
+    with get_service().pooled_connection() as conn:
+        if args.command == "status":
+            applied = applied_versions(conn)
+            for version, name, _ in MIGRATIONS:
+                print(f"{version:4d}  {'applied' if version in applied else 'pending':8s} {name}")
+            return 0
+        if args.command == "migrate":
+            applied = migrate(conn, args.to)
+            print(f"{len(applied)} migration(s) applied" if applied else "Database is up to date")
+            return 0
+
+        problems = verify(conn, min_rows=args.min_rows, strict=args.strict)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+SQL and row-shaping helpers shared by the sync and async rate services
+
+Only query text and pure functions live here, so importing this module
+opens no connections and needs neither psycopg2 nor asyncpg. Queries use
+psycopg2 %s placeholders; the async service rewrites them for asyncpg.
+"""
+
+import sys
+from typing import Dict, List
+
+from .friendly_names import friendly_name_map
+from .records import GoodsRate, Scenario, ServicesRate
+
+
+# All coverage statistics in one round-trip
+STATS_QUERY = """
+    SELECT
+        (SELECT COUNT(DISTINCT hsn_code) FROM gst_goods_rates WHERE hsn_code IS NOT NULL),
+        (SELECT COUNT(DISTINCT sac_code) FROM gst_services_rates WHERE sac_code IS NOT NULL),
+        (SELECT COUNT(DISTINCT category_name) FROM product_categories),
+        (SELECT MAX(last_updated) FROM gst_goods_rates),
+        (SELECT MAX(last_updated) FROM gst_services_rates)
+"""
+
+STATS_SUMMARY_QUERY = """
+    SELECT goods_count, services_count, categories_count,
+           last_goods_update, last_services_update
+    FROM gst_rate_stats
+    WHERE id = 1
+"""
+
+# Optional single-row summary table, refreshed by statement-level triggers
+# whenever the rate tables change, so reading stats is a primary-key lookup.
+STATS_SUMMARY_DDL = """
+    CREATE TABLE IF NOT EXISTS gst_rate_stats (
+        id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+        goods_count INTEGER NOT NULL DEFAULT 0,
+        services_count INTEGER NOT NULL DEFAULT 0,
+        categories_count INTEGER NOT NULL DEFAULT 0,
+        last_goods_update TIMESTAMP,
+        last_services_update TIMESTAMP
+    );
+
+    CREATE OR REPLACE FUNCTION refresh_gst_rate_stats_row() RETURNS VOID AS $$
+    BEGIN
+        INSERT INTO gst_rate_stats (id, goods_count, services_count, categories_count,
+                                    last_goods_update, last_services_update)
+        SELECT 1,
+            (SELECT COUNT(DISTINCT hsn_code) FROM gst_goods_rates WHERE hsn_code IS NOT NULL),
+            (SELECT COUNT(DISTINCT sac_code) FROM gst_services_rates WHERE sac_code IS NOT NULL),
+            (SELECT COUNT(DISTINCT category_name) FROM product_categories),
+            (SELECT MAX(last_updated) FROM gst_goods_rates),
+            (SELECT MAX(last_updated) FROM gst_services_rates)
+        ON CONFLICT (id) DO UPDATE SET
+            goods_count = EXCLUDED.goods_count,
+            services_count = EXCLUDED.services_count,
+            categories_count = EXCLUDED.categories_count,
+            last_goods_update = EXCLUDED.last_goods_update,
+            last_services_update = EXCLUDED.last_services_update;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION refresh_gst_rate_stats() RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_gst_rate_stats_row();
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS gst_goods_rates_stats ON gst_goods_rates;
+    CREATE TRIGGER gst_goods_rates_stats
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON gst_goods_rates
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_gst_rate_stats();
+
+    DROP TRIGGER IF EXISTS gst_services_rates_stats ON gst_services_rates;
+    CREATE TRIGGER gst_services_rates_stats
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON gst_services_rates
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_gst_rate_stats();
+
+    DROP TRIGGER IF EXISTS product_categories_stats ON product_categories;
+    CREATE TRIGGER product_categories_stats
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON product_categories
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_gst_rate_stats();
+
+    -- Seed the row so reads work before the first write
+    SELECT refresh_gst_rate_stats_row();
+"""
+
+
+def _stats_from_row(row) -> Dict:
+    goods_count, services_count, categories_count, last_goods_update, last_services_update = row
+    return {
+        'goods_count': goods_count,
+        'services_count': services_count,
+        'categories_count': categories_count,
+        'last_updated': max(last_goods_update, last_services_update) if last_goods_update and last_services_update else None,
+    }
+
+
+def _goods_record(row) -> GoodsRate:
+    """Shape a (hsn_code, description, cgst, sgst, igst, cess) row as a lookup result"""
+    return GoodsRate(row[0], row[1], float(row[2]), float(row[3]), float(row[4]),
+                     float(row[5]) if row[5] is not None else 0.0)
+
+
+def _services_record(row) -> ServicesRate:
+    """Shape a (sac_code, description, cgst, sgst, igst) row as a lookup result"""
+    return ServicesRate(row[0], row[1], float(row[2]), float(row[3]), float(row[4]))
+
+
+# Latest active rate for one code, the same rate the index and category loader use
+HSN_QUERY = """
+    SELECT hsn_code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess
+    FROM gst_goods_rates 
+    WHERE hsn_code = %s AND is_active = TRUE
+    ORDER BY effective_from DESC
+    LIMIT 1
+"""
+
+SAC_QUERY = """
+    SELECT sac_code, description, cgst_rate, sgst_rate, igst_rate
+    FROM gst_services_rates 
+    WHERE sac_code = %s AND is_active = TRUE
+    ORDER BY effective_from DESC
+    LIMIT 1
+"""
+
+# Latest active rate per code for the in-memory index, matching what the category loader shows
+INDEX_GOODS_QUERY = """
+    SELECT DISTINCT ON (hsn_code)
+        hsn_code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess
+    FROM gst_goods_rates
+    WHERE hsn_code IS NOT NULL AND is_active = TRUE
+    ORDER BY hsn_code, effective_from DESC
+"""
+
+INDEX_SERVICES_QUERY = """
+    SELECT DISTINCT ON (sac_code)
+        sac_code, description, cgst_rate, sgst_rate, igst_rate
+    FROM gst_services_rates
+    WHERE sac_code IS NOT NULL AND is_active = TRUE
+    ORDER BY sac_code, effective_from DESC
+"""
+
+# Every category/subcategory with the latest active rate for its HSN or SAC code
+_CATEGORIES_SQL = """
+    SELECT 
+        pc.category_name,
+        pc.subcategory_name,
+        {friendly_name} as friendly_name,
+        pc.hsn_code,
+        pc.sac_code,
+        COALESCE(g.cgst_rate, s.cgst_rate) as cgst_rate,
+        COALESCE(g.sgst_rate, s.sgst_rate) as sgst_rate,
+        COALESCE(g.igst_rate, s.igst_rate) as igst_rate,
+        COALESCE(g.description, s.description) as description
+    FROM product_categories pc
+    LEFT JOIN LATERAL (
+        SELECT cgst_rate, sgst_rate, igst_rate, description
+        FROM gst_goods_rates 
+        WHERE hsn_code = pc.hsn_code AND is_active = TRUE
+        ORDER BY effective_from DESC 
+        LIMIT 1
+    ) g ON pc.hsn_code IS NOT NULL
+    LEFT JOIN LATERAL (
+        SELECT cgst_rate, sgst_rate, igst_rate, description
+        FROM gst_services_rates 
+        WHERE sac_code = pc.sac_code AND is_active = TRUE
+        ORDER BY effective_from DESC 
+        LIMIT 1
+    ) s ON pc.sac_code IS NOT NULL
+    WHERE {category_filter}(g.cgst_rate IS NOT NULL OR s.cgst_rate IS NOT NULL)
+    ORDER BY pc.category_name, pc.subcategory_name
+"""
+CATEGORIES_QUERY = _CATEGORIES_SQL.format(friendly_name="NULL::text", category_filter="")
+# Same, reading friendly names stored by install_friendly_names()
+CATEGORIES_PERSISTED_QUERY = _CATEGORIES_SQL.format(friendly_name="pc.friendly_name", category_filter="")
+
+# One category's scenarios, for loading categories on first access
+CATEGORY_SCENARIOS_QUERY = _CATEGORIES_SQL.format(friendly_name="NULL::text",
+                                                  category_filter="pc.category_name = %s AND ")
+CATEGORY_SCENARIOS_PERSISTED_QUERY = _CATEGORIES_SQL.format(friendly_name="pc.friendly_name",
+                                                            category_filter="pc.category_name = %s AND ")
+
+# Category names with their scenario counts, without loading any scenarios. Same
+# latest-active-rate probes as the category loader, so each one is an index lookup
+# on (code, is_active, effective_from) and the counts match what the loader returns.
+CATEGORY_COUNTS_QUERY = """
+    SELECT pc.category_name, COUNT(*)
+    FROM product_categories pc
+    LEFT JOIN LATERAL (
+        SELECT cgst_rate
+        FROM gst_goods_rates
+        WHERE hsn_code = pc.hsn_code AND is_active = TRUE
+        ORDER BY effective_from DESC
+        LIMIT 1
+    ) g ON pc.hsn_code IS NOT NULL
+    LEFT JOIN LATERAL (
+        SELECT cgst_rate
+        FROM gst_services_rates
+        WHERE sac_code = pc.sac_code AND is_active = TRUE
+        ORDER BY effective_from DESC
+        LIMIT 1
+    ) s ON pc.sac_code IS NOT NULL
+    WHERE g.cgst_rate IS NOT NULL OR s.cgst_rate IS NOT NULL
+    GROUP BY pc.category_name
+    ORDER BY pc.category_name
+"""
+
+FRIENDLY_NAMES_DDL = "ALTER TABLE product_categories ADD COLUMN IF NOT EXISTS friendly_name TEXT"
+
+FRIENDLY_NAMES_UPDATE = """
+    UPDATE product_categories pc
+    SET friendly_name = v.friendly_name
+    FROM unnest(%s::text[], %s::text[]) AS v(subcategory_name, friendly_name)
+    WHERE pc.subcategory_name = v.subcategory_name
+      AND pc.friendly_name IS DISTINCT FROM v.friendly_name
+"""
+
+# Latest active rate for each requested code across both tables, in one round-trip
+BULK_LOOKUP_QUERY = """
+    SELECT * FROM (
+        SELECT DISTINCT ON (hsn_code)
+            'goods', hsn_code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess
+        FROM gst_goods_rates
+        WHERE hsn_code = ANY(%s) AND is_active = TRUE
+        ORDER BY hsn_code, effective_from DESC
+    ) goods
+    UNION ALL
+    SELECT * FROM (
+        SELECT DISTINCT ON (sac_code)
+            'services', sac_code, description, cgst_rate, sgst_rate, igst_rate, NULL::numeric
+        FROM gst_services_rates
+        WHERE sac_code = ANY(%s) AND is_active = TRUE
+        ORDER BY sac_code, effective_from DESC
+    ) services
+    ORDER BY 1
+"""
+
+
+# Read queries against the base tables, used until the materialized
+# current-rate views in schema.py are installed (same keys and columns)
+BASE_TABLE_QUERIES = {
+    "categories": CATEGORIES_QUERY,
+    "categories_persisted": CATEGORIES_PERSISTED_QUERY,
+    "category": CATEGORY_SCENARIOS_QUERY,
+    "category_persisted": CATEGORY_SCENARIOS_PERSISTED_QUERY,
+    "category_counts": CATEGORY_COUNTS_QUERY,
+    "hsn": HSN_QUERY,
+    "sac": SAC_QUERY,
+    "index_goods": INDEX_GOODS_QUERY,
+    "index_services": INDEX_SERVICES_QUERY,
+    "bulk_lookup": BULK_LOOKUP_QUERY,
+}
+
+def group_category_rows(results) -> Dict[str, Dict[str, List[Scenario]]]:
+    """Group category query rows into {category: {"scenarios": [...]}}"""
+    categories = {}
+    results = list(results)
+    
+    # Create user-friendly scenario names in one batch, skipping rows that have them stored
+    friendly_names = friendly_name_map(row[1] for row in results if row[2] is None)
+    
+    # Group results by category
+    for row in results:
+        category_name, subcat_name, friendly_name, hsn_code, sac_code, cgst_rate, sgst_rate, igst_rate, description = row
+        
+        if category_name not in categories:
+            categories[sys.intern(category_name)] = {"scenarios": []}
+        
+        # Immutable and interned, so every session can share the same records
+        scenario = Scenario(
+            friendly_name if friendly_name is not None else friendly_names[subcat_name],
+            description[:100] + "..." if description and len(description) > 100 else description or "",
+            float(igst_rate) if igst_rate else 0.0,
+            float(cgst_rate) if cgst_rate else 0.0,
+            float(sgst_rate) if sgst_rate else 0.0,
+            hsn_code,
+            sac_code,
+        )
+        
+        categories[category_name]["scenarios"].append(scenario)
+    
+    return categories
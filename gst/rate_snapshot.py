@@ -0,0 +1,150 @@
+"""
+Build-time compiled snapshot of all GST rate data
+
+The snapshot holds categories with their scenarios (friendly names already
+applied), the HSN/SAC rate records behind the code index and the coverage
+stats. It lets the app render without a database round-trip at startup and
+run fully offline for local testing.
+
+File layout: 8-byte magic, 4-byte little-endian header length, JSON header,
+then a zlib-compressed JSON body.
+
+Usage: python -m gst.rate_snapshot build [path]
+       python -m gst.rate_snapshot info [path]
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime
+from typing import Dict, Optional
+
+from .records import categories_from_dicts, json_default, rates_from_dicts
+
+MAGIC = b"GSTSNAP1"
+FORMAT_VERSION = 1
+# Kept at the repository root (beside app.py), outside the package source
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "gst_rates.snapshot")
+
+
+def snapshot_path() -> str:
+    return os.getenv('GST_SNAPSHOT_PATH', DEFAULT_SNAPSHOT_PATH)
+
+
+def _encode_stats(stats: Dict) -> Dict:
+    stats = dict(stats)
+    if isinstance(stats.get('last_updated'), datetime):
+        stats['last_updated'] = stats['last_updated'].isoformat()
+    return stats
+
+
+def _decode_stats(stats: Dict) -> Dict:
+    stats = dict(stats)
+    if stats.get('last_updated'):
+        stats['last_updated'] = datetime.fromisoformat(stats['last_updated'])
+    return stats
+
+
+def write_snapshot(data: Dict, path: Optional[str] = None) -> str:
+    """Write snapshot data atomically (temp file + rename) and return the path"""
+    path = path or snapshot_path()
+    body = zlib.compress(json.dumps({
+        "categories": data["categories"],
+        "goods": data["goods"],
+        "services": data["services"],
+        "stats": _encode_stats(data.get("stats") or {}),
+    }, separators=(",", ":"), ensure_ascii=False, default=json_default).encode("utf-8"), 9)
+    header = json.dumps({
+        "format_version": FORMAT_VERSION,
+        "built_at": data.get("built_at", time.time()),
+        "categories": len(data["categories"]),
+        "goods": len(data["goods"]),
+        "services": len(data["services"]),
+    }).encode("utf-8")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_header(path: Optional[str] = None) -> Dict:
+    """Read only the snapshot header (cheap; no decompression)"""
+    with open(path or snapshot_path(), "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a GST rate snapshot")
+        (header_len,) = struct.unpack("<I", f.read(4))
+        return json.loads(f.read(header_len))
+
+
+def load_snapshot(path: Optional[str] = None) -> Dict:
+    """Load a snapshot written by write_snapshot"""
+    with open(path or snapshot_path(), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        if m[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a GST rate snapshot")
+        offset = len(MAGIC)
+        (header_len,) = struct.unpack_from("<I", m, offset)
+        offset += 4
+        header = json.loads(m[offset:offset + header_len])
+        if header.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format {header.get('format_version')}")
+        body = json.loads(zlib.decompress(m[offset + header_len:]))
+
+    # Same immutable records the database loaders produce
+    body["categories"] = categories_from_dicts(body["categories"])
+    body["goods"] = rates_from_dicts(body["goods"])
+    body["services"] = rates_from_dicts(body["services"])
+    body["stats"] = _decode_stats(body.get("stats") or {})
+    body["built_at"] = header["built_at"]
+    return body
+
+
+def build_snapshot(service, path: Optional[str] = None) -> str:
+    """Export everything the app needs from the database into a snapshot file"""
+    index = service.refresh_code_index()
+    data = {
+        "built_at": time.time(),
+        "categories": service._load_categories(),
+        "goods": [index.goods.exact(code) for code in index.goods.codes()],
+        "services": [index.services.exact(code) for code in index.services.codes()],
+        "stats": service._fetch_database_stats(),
+    }
+    return write_snapshot(data, path)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    command = argv.pop(0) if argv else "build"
+    path = argv[0] if argv else None
+
+    if command == "build":
+        from .database_gst_service import DatabaseGSTService
+
+        start = time.monotonic()
+        try:
+            written = build_snapshot(DatabaseGSTService(), path)
+        except Exception as e:
+            print(f"Snapshot build failed: {e}")
+            return 1
+        header = read_header(written)
+        print(f"Wrote {written} ({os.path.getsize(written)} bytes, {header['categories']} categories, "
+              f"{header['goods']} HSN, {header['services']} SAC) in {time.monotonic() - start:.2f}s")
+        return 0
+    if command == "info":
+        print(json.dumps(read_header(path), indent=2))
+        return 0
+    print(__doc__)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Compact immutable records for scenarios and HSN/SAC rate lookups
+
+Each record keeps its fields in __slots__ instead of a per-object dict,
+shares one RateBreakdown per distinct CGST/SGST pair and interns its
+category, code and text strings, so a full HSN schedule costs a fraction
+of the nested dicts it replaces. Records cannot be changed after they are
+built, which makes them safe to hand to every session thread without a
+copy.
+
+They are read-only Mappings with the same keys as the old dicts, so
+existing code that does scenario["name"], record.get("hsn_code") or
+dict(record) keeps working. JSON needs json_default (or to_dict()).
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Record(Mapping):
+    """Read-only mapping over __slots__; subclasses list their keys in KEYS"""
+
+    __slots__ = ()
+    # Mapping key -> attribute name, in the key order of the old dicts
+    KEYS: Dict[str, str] = {}
+
+    def __init__(self, *values):
+        for attribute, value in zip(self.__slots__, values):
+            object.__setattr__(self, attribute, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, attribute) for attribute in self.__slots__)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.KEYS[key])
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self) -> Dict:
+        """Plain (nested) dict copy, e.g. for JSON"""
+        return {key: value.to_dict() if isinstance(value, Record) else value for key, value in self.items()}
+
+
+class RateBreakdown(Record):
+    __slots__ = ("cgst", "sgst")
+    KEYS = {"CGST": "cgst", "SGST": "sgst"}
+
+    def __reduce__(self):
+        return rate_breakdown, (self.cgst, self.sgst)
+
+
+_breakdowns: Dict[tuple, RateBreakdown] = {}
+
+
+def rate_breakdown(cgst: float, sgst: float) -> RateBreakdown:
+    """Shared breakdown for a CGST/SGST pair; there are only a handful of slabs"""
+    key = (cgst, sgst)
+    breakdown = _breakdowns.get(key)
+    if breakdown is None:
+        # setdefault keeps one instance if two threads race here
+        breakdown = _breakdowns.setdefault(key, RateBreakdown(cgst, sgst))
+    return breakdown
+
+
+class Scenario(Record):
+    """One product/service entry of a category, as shown in the results table"""
+
+    __slots__ = ("name", "description", "gst_rate", "breakdown", "hsn_code", "sac_code")
+    KEYS = {
+        "name": "name",
+        "description": "description",
+        "gst_rate": "gst_rate",
+        "breakdown": "breakdown",
+        "hsn_code": "hsn_code",
+        "sac_code": "sac_code",
+        "official_source": "official_source",
+    }
+    official_source = True
+
+    def __init__(self, name: str, description: str, gst_rate: float, cgst_rate: float, sgst_rate: float,
+                 hsn_code: Optional[str] = None, sac_code: Optional[str] = None):
+        super().__init__(_intern(name), _intern(description), gst_rate, rate_breakdown(cgst_rate, sgst_rate),
+                         _intern(hsn_code), _intern(sac_code))
+
+    def __reduce__(self):
+        return type(self), (self.name, self.description, self.gst_rate, self.breakdown.cgst,
+                            self.breakdown.sgst, self.hsn_code, self.sac_code)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Scenario":
+        breakdown = data.get("breakdown") or {}
+        return cls(data["name"], data.get("description") or "", data.get("gst_rate", 0.0),
+                   breakdown.get("CGST", 0.0), breakdown.get("SGST", 0.0),
+                   data.get("hsn_code"), data.get("sac_code"))
+
+
+class GoodsRate(Record):
+    """Latest active rate of an HSN code"""
+
+    __slots__ = ("hsn_code", "description", "cgst_rate", "sgst_rate", "igst_rate", "compensation_cess")
+    KEYS = {key: key for key in __slots__}
+    KEYS["type"] = "type"
+    type = "goods"
+
+    def __init__(self, hsn_code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess=0.0):
+        super().__init__(_intern(hsn_code), _intern(description), cgst_rate, sgst_rate, igst_rate,
+                         compensation_cess)
+
+
+class ServicesRate(Record):
+    """Latest active rate of a SAC code"""
+
+    __slots__ = ("sac_code", "description", "cgst_rate", "sgst_rate", "igst_rate")
+    KEYS = {key: key for key in __slots__}
+    KEYS["type"] = "type"
+    type = "services"
+
+    def __init__(self, sac_code, description, cgst_rate, sgst_rate, igst_rate):
+        super().__init__(_intern(sac_code), _intern(description), cgst_rate, sgst_rate, igst_rate)
+
+
+def rate_from_dict(data: Mapping) -> Record:
+    """GoodsRate or ServicesRate from a lookup-result dict (e.g. a snapshot entry)"""
+    if data.get("type") == "services" or (data.get("sac_code") and not data.get("hsn_code")):
+        return ServicesRate(data["sac_code"], data.get("description"), data["cgst_rate"],
+                            data["sgst_rate"], data["igst_rate"])
+    return GoodsRate(data["hsn_code"], data.get("description"), data["cgst_rate"], data["sgst_rate"],
+                     data["igst_rate"], data.get("compensation_cess") or 0.0)
+
+
+def categories_from_dicts(categories: Mapping) -> Dict[str, Dict[str, List[Scenario]]]:
+    """{category: {"scenarios": [...]}} with every scenario dict turned into a Scenario"""
+    return {
+        sys.intern(name): {"scenarios": [Scenario.from_dict(scenario) for scenario in data.get("scenarios", ())]}
+        for name, data in categories.items()
+    }
+
+
+def rates_from_dicts(records: Iterable[Mapping]) -> List[Record]:
+    return [rate_from_dict(record) for record in records]
+
+
+def json_default(value):
+    """json.dumps(..., default=json_default) for payloads that contain records"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    return str(value)
@@ -0,0 +1,203 @@
+"""
+In-memory fuzzy search over GST scenarios
+
+Builds an inverted index from the loaded categories (category names,
+friendly scenario names, the technical names behind them and rate
+descriptions) so a query like "laptop" or "hotel 5000" finds the right
+scenario without picking a category first. Tokens are matched exactly,
+by prefix (search-as-you-type) and by character trigrams (typos).
+
+Numbers are either HSN/SAC codes or amounts. A number that matches a code
+(exactly or as a prefix) ranks those scenarios above any price-band hit
+and is not used as an amount; a number of four or more digits is only
+read as an amount next to a word ("hotel 5000"), never on its own.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from .friendly_names import build_reverse_index
+
+# Field weights: a hit in the scenario name counts more than one in the description
+NAME_WEIGHT = 3.0
+CATEGORY_WEIGHT = 2.0
+ALIAS_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+# Digit tokens at least this long look like HSN/SAC codes rather than amounts
+CODE_LIKE_DIGITS = 4
+
+# Minimum trigram similarity for a typo match, and how many candidates to try
+MIN_SIMILARITY = 0.45
+MAX_FUZZY_CANDIDATES = 8
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_RANGE_RE = re.compile(r"(\d+)\s*-\s*\D?(\d+)")
+_ABOVE_RE = re.compile(r"(?:above|>)\s*\D?(\d+)")
+_UP_TO_RE = re.compile(r"(?:up to|below|≤)\s*\D?(\d+)")
+
+
+def _normalize(text: str) -> str:
+    # "₹7,500" -> "7500" so amounts tokenize as one number
+    return re.sub(r"(?<=\d),(?=\d)", "", (text or "").lower())
+
+
+def _stem(token: str) -> str:
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [_stem(token) for token in _TOKEN_RE.findall(_normalize(text))]
+
+
+def _price_bands(text: str) -> List[Tuple[int, int]]:
+    """Numeric bands in a name: "₹2,500-7,500" -> (2500, 7500), "Above ₹7,500" -> (7500, inf)"""
+    text = _normalize(text)
+    bands = [(int(low), int(high)) for low, high in _RANGE_RE.findall(text)]
+    bands += [(int(low), math.inf) for low in _ABOVE_RE.findall(text)]
+    bands += [(0, int(high)) for high in _UP_TO_RE.findall(text)]
+    return bands
+
+
+def _trigrams(token: str) -> set:
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ScenarioSearchIndex:
+    """Ranked, typo-tolerant search over {category: {"scenarios": [...]}}.
+
+    The index is immutable; build a new one when the categories change.
+    """
+
+    def __init__(self, categories: Dict[str, Dict]):
+        aliases = {}
+        for friendly, technical_names in build_reverse_index().items():
+            aliases[friendly] = " ".join(technical_names)
+
+        self._docs: List[Tuple[str, Dict]] = []
+        self._ranges: List[Tuple[int, List[Tuple[int, int]]]] = []
+        postings: Dict[str, Dict[int, float]] = {}
+        code_docs: Dict[str, List[int]] = {}
+
+        for category, data in categories.items():
+            for scenario in data.get("scenarios", []):
+                doc_id = len(self._docs)
+                self._docs.append((category, scenario))
+                alias = aliases.get(scenario["name"].casefold(), "")
+                fields = [
+                    (scenario["name"], NAME_WEIGHT),
+                    (category, CATEGORY_WEIGHT),
+                    (alias, ALIAS_WEIGHT),
+                    (scenario.get("description") or "", DESCRIPTION_WEIGHT),
+                    (scenario.get("hsn_code") or scenario.get("sac_code") or "", NAME_WEIGHT),
+                ]
+                for text, weight in fields:
+                    for token in tokenize(text):
+                        weights = postings.setdefault(token, {})
+                        weights[doc_id] = max(weights.get(doc_id, 0.0), weight)
+                bands = _price_bands(f"{scenario['name']} {alias}")
+                if bands:
+                    self._ranges.append((doc_id, bands))
+                code = "".join(tokenize(scenario.get("hsn_code") or scenario.get("sac_code") or ""))
+                if code:
+                    code_docs.setdefault(code, []).append(doc_id)
+
+        total = max(len(self._docs), 1)
+        # Rarer tokens say more about which scenario is meant
+        self._postings = {
+            token: {doc_id: weight * (1.0 + math.log(total / len(docs))) for doc_id, weight in docs.items()}
+            for token, docs in postings.items()
+        }
+        self._vocabulary = sorted(self._postings)
+        self._code_docs = code_docs
+        self._codes = sorted(code_docs)
+        self._trigram_index: Dict[str, List[str]] = {}
+        for token in self._vocabulary:
+            for gram in _trigrams(token):
+                self._trigram_index.setdefault(gram, []).append(token)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """Vocabulary tokens a query token can stand for, with match quality 0-1"""
+        if token in self._postings:
+            return {token: 1.0}
+
+        # Prefix matches so a partially typed word already finds results
+        matches = {}
+        start = bisect_left(self._vocabulary, token)
+        for candidate in self._vocabulary[start:start + 20]:
+            if not candidate.startswith(token):
+                break
+            matches[candidate] = 0.8 * len(token) / len(candidate) + 0.1
+
+        # Numbers are matched exactly or by price band, never as typos
+        if not matches and len(token) >= 3 and not token.isdigit():
+            grams = _trigrams(token)
+            counts: Dict[str, int] = {}
+            for gram in grams:
+                for candidate in self._trigram_index.get(gram, ()):
+                    counts[candidate] = counts.get(candidate, 0) + 1
+            best = sorted(counts.items(), key=lambda item: -item[1])[:MAX_FUZZY_CANDIDATES]
+            for candidate, shared in best:
+                similarity = 2.0 * shared / (len(grams) + len(_trigrams(candidate)))
+                if similarity >= MIN_SIMILARITY:
+                    matches[candidate] = 0.7 * similarity
+        return matches
+
+    def _code_matches(self, token: str) -> Dict[int, float]:
+        """Scenarios whose HSN/SAC code equals or starts with token, with match quality 0-1"""
+        matches = {}
+        for code in self._codes[bisect_left(self._codes, token):]:
+            if not code.startswith(token):
+                break
+            quality = 1.0 if code == token else 0.8 * len(token) / len(code) + 0.1
+            for doc_id in self._code_docs[code]:
+                matches[doc_id] = max(matches.get(doc_id, 0.0), quality)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Top scenarios for query as [{"category", "scenario", "score"}], best first"""
+        scores: Dict[int, float] = {}
+        hits: Dict[int, int] = {}
+        code_hits: Dict[int, int] = {}
+        tokens = tokenize(query)
+        has_words = any(not token.isdigit() for token in tokens)
+
+        for token in tokens:
+            token_scores: Dict[int, float] = {}
+            code_matches = self._code_matches(token) if token.isdigit() else {}
+            for doc_id, quality in code_matches.items():
+                code_hits[doc_id] = code_hits.get(doc_id, 0) + 1
+                token_scores[doc_id] = NAME_WEIGHT * quality
+            if token.isdigit() and not code_matches and (len(token) < CODE_LIKE_DIGITS or has_words):
+                # An amount matches scenarios whose price band contains it
+                value = int(token)
+                for doc_id, ranges in self._ranges:
+                    if any(low <= value <= high for low, high in ranges):
+                        token_scores[doc_id] = NAME_WEIGHT
+            for candidate, quality in self._expand(token).items():
+                for doc_id, weight in self._postings[candidate].items():
+                    token_scores[doc_id] = max(token_scores.get(doc_id, 0.0), weight * quality)
+            for doc_id, score in token_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                hits[doc_id] = hits.get(doc_id, 0) + 1
+
+        # Scenarios matching every query word rank above partial matches, then code hits above the rest
+        ranked = sorted(scores, key=lambda doc_id: (-hits[doc_id], -code_hits.get(doc_id, 0),
+                                                    -scores[doc_id], doc_id))[:limit]
+        results = []
+        for doc_id in ranked:
+            category, scenario = self._docs[doc_id]
+            results.append({
+                "category": category,
+                "scenario": scenario,
+                "score": round(scores[doc_id] * hits[doc_id] / max(len(tokens), 1), 3),
+            })
+        return results
@@ -0,0 +1,236 @@
+"""
+Materialized current-rate views for the GST rate tables
+
+The rate tables keep every rate a code has ever had; readers only want the
+latest active one. These views resolve that once per data change instead
+of on every read:
+
+    gst_current_rates   one row per HSN/SAC code: latest active rate
+    gst_category_rates  one row per product category entry with its rate
+
+Both are refreshed CONCURRENTLY (readers are never blocked) by
+statement-level triggers whenever a rate table or product_categories
+changes. The refresh runs in the writing transaction, so the change
+listener's NOTIFY, delivered at commit, always sees refreshed views.
+
+The price is write cost: every writing statement re-reads the rate tables
+in full (product_categories changes only rebuild the category view). That
+suits this schema, which changes a few times a year through rate
+notifications, and keeps readers consistent without a refresh worker.
+Load a large rate file with one statement (COPY or a multi-row INSERT),
+or drop the triggers for the load and run "refresh" afterwards, rather
+than writing row by row.
+
+Rows keep stable keys across refreshes (the rate row id, and the
+product_categories id plus rate id), so a concurrent refresh only
+rewrites rows that actually changed.
+
+    python -m gst.schema install    # create views, indexes and triggers
+    python -m gst.schema refresh    # refresh by hand
+    python -m gst.schema drop
+"""
+
+import sys
+from typing import List, Optional
+
+CURRENT_RATES_VIEW = "gst_current_rates"
+CATEGORY_RATES_VIEW = "gst_category_rates"
+
+CURRENT_RATES_DDL = """
+    -- Loaded into the category view; install_friendly_names() fills it in
+    ALTER TABLE product_categories ADD COLUMN IF NOT EXISTS friendly_name TEXT;
+
+    -- Views from before rate_id was added are rebuilt with the stable keys
+    DO $$
+    BEGIN
+        IF to_regclass('gst_current_rates') IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = 'gst_current_rates'::regclass AND attname = 'rate_id'
+        ) THEN
+            DROP MATERIALIZED VIEW IF EXISTS gst_category_rates;
+            DROP MATERIALIZED VIEW gst_current_rates;
+        END IF;
+    END;
+    $$;
+
+    CREATE MATERIALIZED VIEW IF NOT EXISTS gst_current_rates AS
+    SELECT * FROM (
+        SELECT DISTINCT ON (hsn_code)
+            'goods'::text AS kind, hsn_code AS code, description,
+            cgst_rate, sgst_rate, igst_rate, compensation_cess, effective_from, id AS rate_id
+        FROM gst_goods_rates
+        WHERE hsn_code IS NOT NULL AND is_active = TRUE
+        ORDER BY hsn_code, effective_from DESC
+    ) goods
+    UNION ALL
+    SELECT * FROM (
+        SELECT DISTINCT ON (sac_code)
+            'services'::text, sac_code, description,
+            cgst_rate, sgst_rate, igst_rate, NULL::numeric, effective_from, id
+        FROM gst_services_rates
+        WHERE sac_code IS NOT NULL AND is_active = TRUE
+        ORDER BY sac_code, effective_from DESC
+    ) services;
+
+    -- REFRESH ... CONCURRENTLY needs a unique index; it also serves code lookups
+    CREATE UNIQUE INDEX IF NOT EXISTS gst_current_rates_code_idx
+        ON gst_current_rates (code, kind);
+    CREATE INDEX IF NOT EXISTS gst_current_rates_kind_idx
+        ON gst_current_rates (kind, code);
+
+    CREATE MATERIALIZED VIEW IF NOT EXISTS gst_category_rates AS
+    SELECT
+        pc.id,
+        COALESCE(g.rate_id, s.rate_id) AS rate_id,
+        pc.category_name,
+        pc.subcategory_name,
+        pc.friendly_name,
+        pc.hsn_code,
+        pc.sac_code,
+        COALESCE(g.cgst_rate, s.cgst_rate) AS cgst_rate,
+        COALESCE(g.sgst_rate, s.sgst_rate) AS sgst_rate,
+        COALESCE(g.igst_rate, s.igst_rate) AS igst_rate,
+        g.compensation_cess,
+        COALESCE(g.description, s.description) AS description
+    FROM product_categories pc
+    LEFT JOIN gst_current_rates g ON g.kind = 'goods' AND g.code = pc.hsn_code
+    LEFT JOIN gst_current_rates s ON s.kind = 'services' AND s.code = pc.sac_code
+    WHERE g.cgst_rate IS NOT NULL OR s.cgst_rate IS NOT NULL;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS gst_category_rates_key_idx
+        ON gst_category_rates (id, rate_id);
+    CREATE INDEX IF NOT EXISTS gst_category_rates_category_idx
+        ON gst_category_rates (category_name, subcategory_name);
+
+    -- category view reads the code view, so refresh in that order
+    CREATE OR REPLACE FUNCTION refresh_gst_current_rates() RETURNS VOID AS $$
+    BEGIN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY gst_current_rates;
+        REFRESH MATERIALIZED VIEW CONCURRENTLY gst_category_rates;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION refresh_gst_current_rates_trigger() RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM refresh_gst_current_rates();
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    -- Category edits can't change a code's current rate, so skip that view
+    CREATE OR REPLACE FUNCTION refresh_gst_category_rates_trigger() RETURNS TRIGGER AS $$
+    BEGIN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY gst_category_rates;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS gst_goods_rates_refresh_current ON gst_goods_rates;
+    CREATE TRIGGER gst_goods_rates_refresh_current
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON gst_goods_rates
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_gst_current_rates_trigger();
+
+    DROP TRIGGER IF EXISTS gst_services_rates_refresh_current ON gst_services_rates;
+    CREATE TRIGGER gst_services_rates_refresh_current
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON gst_services_rates
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_gst_current_rates_trigger();
+
+    DROP TRIGGER IF EXISTS product_categories_refresh_current ON product_categories;
+    CREATE TRIGGER product_categories_refresh_current
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON product_categories
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_gst_category_rates_trigger();
+"""
+
+DROP_CURRENT_RATES_DDL = """
+    DROP TRIGGER IF EXISTS gst_goods_rates_refresh_current ON gst_goods_rates;
+    DROP TRIGGER IF EXISTS gst_services_rates_refresh_current ON gst_services_rates;
+    DROP TRIGGER IF EXISTS product_categories_refresh_current ON product_categories;
+    DROP FUNCTION IF EXISTS refresh_gst_current_rates_trigger();
+    DROP FUNCTION IF EXISTS refresh_gst_category_rates_trigger();
+    DROP FUNCTION IF EXISTS refresh_gst_current_rates();
+    DROP MATERIALIZED VIEW IF EXISTS gst_category_rates;
+    DROP MATERIALIZED VIEW IF EXISTS gst_current_rates;
+"""
+
+REFRESH_CURRENT_RATES = "SELECT refresh_gst_current_rates()"
+
+CURRENT_RATES_INSTALLED_QUERY = (
+    f"SELECT to_regclass('{CURRENT_RATES_VIEW}') IS NOT NULL AND to_regclass('{CATEGORY_RATES_VIEW}') IS NOT NULL"
+)
+
+_CATEGORY_COLUMNS = """
+    SELECT category_name, subcategory_name, friendly_name, hsn_code, sac_code,
+           cgst_rate, sgst_rate, igst_rate, description
+    FROM gst_category_rates
+"""
+
+# Read queries against the views, keyed like queries.BASE_TABLE_QUERIES
+# and returning the same columns, so every read path is an indexed scan.
+VIEW_QUERIES = {
+    "categories": _CATEGORY_COLUMNS + " ORDER BY category_name, subcategory_name",
+    "category": _CATEGORY_COLUMNS + " WHERE category_name = %s ORDER BY subcategory_name",
+    "category_counts": """
+        SELECT category_name, COUNT(*) FROM gst_category_rates
+        GROUP BY category_name ORDER BY category_name
+    """,
+    "hsn": """
+        SELECT code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess
+        FROM gst_current_rates WHERE code = %s AND kind = 'goods'
+    """,
+    "sac": """
+        SELECT code, description, cgst_rate, sgst_rate, igst_rate
+        FROM gst_current_rates WHERE code = %s AND kind = 'services'
+    """,
+    "index_goods": """
+        SELECT code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess
+        FROM gst_current_rates WHERE kind = 'goods' ORDER BY code
+    """,
+    "index_services": """
+        SELECT code, description, cgst_rate, sgst_rate, igst_rate
+        FROM gst_current_rates WHERE kind = 'services' ORDER BY code
+    """,
+    "bulk_lookup": """
+        SELECT kind, code, description, cgst_rate, sgst_rate, igst_rate, compensation_cess
+        FROM gst_current_rates
+        WHERE (kind = 'goods' AND code = ANY(%s)) OR (kind = 'services' AND code = ANY(%s))
+        ORDER BY kind
+    """,
+}
+# Friendly names always come from the view, so there is no separate "persisted" variant
+VIEW_QUERIES["categories_persisted"] = VIEW_QUERIES["categories"]
+VIEW_QUERIES["category_persisted"] = VIEW_QUERIES["category"]
+
+
+def install(conn):
+    """Create (or update) the views, their indexes and the refresh triggers"""
+    with conn.cursor() as cur:
+        cur.execute(CURRENT_RATES_DDL)
+
+
+def refresh(conn):
+    with conn.cursor() as cur:
+        cur.execute(REFRESH_CURRENT_RATES)
+
+
+def drop(conn):
+    with conn.cursor() as cur:
+        cur.execute(DROP_CURRENT_RATES_DDL)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    commands = {"install": install, "refresh": refresh, "drop": drop}
+    if len(argv) != 1 or argv[0] not in commands:
+        print("usage: python -m gst.schema install|refresh|drop")
+        return 2
+
+    from .database_gst_service import get_service
+
+    with get_service().pooled_connection() as conn:
+        commands[argv[0]](conn)
+    print(f"{argv[0]}: done")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
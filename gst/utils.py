@@ -0,0 +1,133 @@
+"""
+Utility functions for GST calculations and formatting
+"""
+
+import math
+
+# Largest amount the calculators accept (1 crore)
+MAX_AMOUNT = 10000000
+# GST and cess rates are percentages; compensation cess tops out well below this
+MAX_RATE = 1000.0
+
+def format_currency(amount):
+    """Format amount in Indian currency format"""
+    if amount == 0:
+        return "₹0"
+    
+    # Convert to string and handle decimal places
+    amount_str = f"{amount:,.2f}"
+    
+    # Add rupee symbol
+    return f"₹{amount_str}"
+
+def format_data_age(seconds):
+    """Human-readable age of cached rate data, e.g. 5 minutes"""
+    if seconds is None:
+        return "unknown"
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "less than a minute"
+    if minutes < 60:
+        return f"{minutes} minute{'s' if minutes != 1 else ''}"
+    hours = minutes // 60
+    if hours < 48:
+        return f"{hours} hour{'s' if hours != 1 else ''}"
+    days = hours // 24
+    return f"{days} days"
+
+def _gst_amounts(amounts, igst, cgst, sgst, cess):
+    """Core GST formulas; works on Python floats and NumPy arrays alike"""
+    gst_amount = (amounts * igst) / 100
+    cgst_amount = (amounts * cgst) / 100
+    sgst_amount = (amounts * sgst) / 100
+    cess_amount = (amounts * cess) / 100
+    return gst_amount, cgst_amount, sgst_amount, cess_amount
+
+def calculate_gst_batch(amounts, igst_rates, cgst_rates=None, sgst_rates=None, cess_rates=None, outer=False):
+    """Vectorized GST over many amounts and rate scenarios in one pass.
+
+    Rates are percentages. With outer=False, amounts and rates broadcast
+    element-wise (one rate per amount, or a scalar rate for all). With
+    outer=True, every amount is computed against every rate scenario and
+    each result column has shape (len(amounts), len(rates)).
+
+    Returns a dict of NumPy arrays (columnar results).
+    """
+    import numpy as np
+    
+    amounts = np.asarray(amounts, dtype=np.float64)
+    igst = np.asarray(igst_rates, dtype=np.float64)
+    cgst = np.asarray(cgst_rates if cgst_rates is not None else igst / 2, dtype=np.float64)
+    sgst = np.asarray(sgst_rates if sgst_rates is not None else igst / 2, dtype=np.float64)
+    cess = np.asarray(cess_rates if cess_rates is not None else 0.0, dtype=np.float64)
+    
+    if outer:
+        amounts = amounts.reshape(-1, 1)
+    
+    # Shared with the scalar functions so results match bit for bit
+    gst_amount, cgst_amount, sgst_amount, cess_amount = _gst_amounts(amounts, igst, cgst, sgst, cess)
+    base_amount = np.broadcast_to(amounts, gst_amount.shape)
+    
+    return {
+        "base_amount": base_amount,
+        "gst_rate": np.broadcast_to(igst, gst_amount.shape),
+        "gst_amount": gst_amount,
+        "cgst_rate": np.broadcast_to(cgst, cgst_amount.shape),
+        "sgst_rate": np.broadcast_to(sgst, sgst_amount.shape),
+        "cgst_amount": cgst_amount,
+        "sgst_amount": sgst_amount,
+        "total_gst": cgst_amount + sgst_amount,
+        "cess_amount": cess_amount,
+        "total_amount": base_amount + gst_amount + cess_amount,
+    }
+
+def calculate_gst(base_amount, gst_rate):
+    """Calculate GST amount and total"""
+    # Scalars skip the array conversion (and the NumPy import) of the batch path
+    gst_amount, _, _, cess_amount = _gst_amounts(float(base_amount), float(gst_rate), 0.0, 0.0, 0.0)
+    
+    return {
+        "base_amount": base_amount,
+        "gst_rate": gst_rate,
+        "gst_amount": gst_amount,
+        "total_amount": base_amount + gst_amount + cess_amount
+    }
+
+def calculate_gst_breakdown(base_amount, breakdown):
+    """Calculate CGST and SGST breakdown"""
+    _, cgst_amount, sgst_amount, _ = _gst_amounts(float(base_amount), 0.0, float(breakdown["CGST"]), float(breakdown["SGST"]), 0.0)
+    
+    return {
+        "cgst_rate": breakdown["CGST"],
+        "sgst_rate": breakdown["SGST"],
+        "cgst_amount": cgst_amount,
+        "sgst_amount": sgst_amount,
+        "total_gst": cgst_amount + sgst_amount
+    }
+
+def validate_amount(amount_str):
+    """Validate and convert amount string to float"""
+    try:
+        amount = float(amount_str.replace(",", "").replace("₹", ""))
+        # float() accepts "nan" and "inf"
+        if not math.isfinite(amount):
+            return None, "Please enter a valid amount"
+        if amount <= 0:
+            return None, "Amount must be greater than zero"
+        if amount > MAX_AMOUNT:
+            return None, "Amount cannot exceed ₹1,00,00,000"
+        return amount, None
+    except ValueError:
+        return None, "Please enter a valid amount"
+
+def validate_rate(rate_str):
+    """Validate and convert a GST rate in percent to float"""
+    try:
+        rate = float(str(rate_str).replace("%", ""))
+    except ValueError:
+        return None, "Please enter a valid rate"
+    if not math.isfinite(rate) or rate < 0:
+        return None, "Please enter a valid rate"
+    if rate > MAX_RATE:
+        return None, f"Rate cannot exceed {MAX_RATE:g}%"
+    return rate, None
@@ -0,0 +1,288 @@
+"""
+Static page content shared by the calculator and the legal pages
+
+Everything here is built once per process at import time. The stylesheet
+(assets/gst.css), page metadata and the analytics tag are sent on the
+first run of a session only. The stylesheet is added to the page's <head>,
+so it stays in place through every later rerun without being sent again.
+"""
+
+import json
+import os
+
+import streamlit as st
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "gst.css"), encoding="utf-8") as f:
+    STYLESHEET = f.read()
+
+# A JS string literal; "</" is escaped so the CSS cannot close the <script>
+_STYLESHEET_JS = json.dumps(STYLESHEET).replace("</", "<\\/")
+
+# Runs in a zero-height component iframe (same origin as the app) and moves
+# the stylesheet into the parent document, where it outlives the iframe
+STYLESHEET_HTML = f"""
+<script>
+  const doc = window.parent.document;
+  if (!doc.getElementById("gst-styles")) {{
+    const style = doc.createElement("style");
+    style.id = "gst-styles";
+    style.textContent = {_STYLESHEET_JS};
+    doc.head.appendChild(style);
+  }}
+</script>
+"""
+
+GOOGLE_ANALYTICS_ID = "G-561C8F8S4P"
+
+# Crawler hints, SEO meta tags and schema markup
+PAGE_METADATA = """
+<meta name="fragment" content="!">
+<meta name="prerender-status-code" content="200">
+<link rel="canonical" href="https://gstcalcindia.com/" />
+<meta name="description" content="Calculate GST online for goods & services in India with GSTCalcIndia.com. Fast, accurate, and up-to-date with official CBIC rates. Mobile-friendly GST calculator.">
+<meta name="keywords" content="GST calculator India, Indian GST calculator, online GST calculator, GST rates India, GST calculation, HSN code GST, SAC code GST, CBIC rates">
+<meta name="author" content="GSTCalcIndia.com">
+<meta name="robots" content="index, follow">
+<meta name="language" content="English">
+<meta name="geo.region" content="IN">
+<meta name="geo.country" content="India">
+
+<!-- Open Graph Tags for Social Media -->
+<meta property="og:title" content="Indian GST Calculator Online - Accurate Rates | GSTCalcIndia">
+<meta property="og:description" content="Calculate GST online for goods & services in India. Fast, accurate, and up-to-date with official CBIC rates.">
+<meta property="og:type" content="website">
+<meta property="og:url" content="https://gstcalcindia.com">
+<meta property="og:locale" content="en_IN">
+
+<!-- Twitter Card Tags -->
+<meta name="twitter:card" content="summary">
+<meta name="twitter:title" content="Indian GST Calculator Online - Accurate Rates">
+<meta name="twitter:description" content="Calculate GST online for goods & services in India. Fast, accurate, and up-to-date with official CBIC rates.">
+
+<!-- Schema.org Structured Data -->
+<script type="application/ld+json">
+{
+  "@context": "https://schema.org",
+  "@type": "WebApplication",
+  "name": "Indian GST Calculator",
+  "description": "Online GST calculator for goods and services in India with official CBIC rates",
+  "url": "https://gstcalcindia.com",
+  "applicationCategory": "FinanceApplication",
+  "operatingSystem": "Web Browser",
+  "inLanguage": "en-IN",
+  "offers": {
+    "@type": "Offer",
+    "price": "0",
+    "priceCurrency": "INR"
+  },
+  "author": {
+    "@type": "Organization",
+    "name": "GSTCalcIndia.com"
+  },
+  "geo": {
+    "@type": "Country",
+    "name": "India"
+  }
+}
+</script>
+"""
+
+GOOGLE_ANALYTICS_HTML = f"""
+<script async src="https://www.googletagmanager.com/gtag/js?id={GOOGLE_ANALYTICS_ID}"></script>
+<script>
+  window.dataLayer = window.dataLayer || [];
+  function gtag(){{dataLayer.push(arguments);}}
+  gtag('js', new Date());
+  gtag('config', '{GOOGLE_ANALYTICS_ID}');
+  
+  // Send initial page view
+  gtag('event', 'page_view', {{
+    page_title: 'Indian GST Calculator',
+    page_location: window.location.href
+  }});
+</script>
+"""
+
+DISCLAIMER_MARKDOWN = """
+**Last Updated:** May 25, 2025
+
+Welcome to GSTCalcIndia.com. The information and tools provided on this website, including but not limited to the GST calculator, are for general guidance and informational purposes only.
+
+### 📊 Accuracy of Information
+
+While we strive to provide accurate and up-to-date information and base our calculations on official notifications from the Central Board of Indirect Taxes and Customs (CBIC) and common interpretations of GST law in India, GSTCalcIndia.com makes no representations or warranties of any kind, express or implied, about the completeness, accuracy, reliability, suitability, or availability with respect to the website or the information, products, services, or related graphics contained on the website for any purpose.
+
+### 🔢 Estimates Only
+
+The GST calculations provided by our tool are estimates based on the input you provide and common scenarios. GST rates, rules, and their applicability can vary significantly based on many factors, including but not limited to:
+
+- Specific product specifications and HSN/SAC classifications
+- The exact nature of the service or goods
+- Applicable exemptions or concessions
+- Changes in state or central government regulations and notifications
+- The place of supply and other transactional details
+
+Our calculator may not account for all such specific nuances, conditions, or the most recent changes that may not yet be universally implemented or reflected in general public data.
+
+### ⚖️ Not Professional Advice
+
+The content on GSTCalcIndia.com is not intended to be a substitute for professional tax, legal, or financial advice. All content is for informational purposes only.
+
+Users are strongly encouraged to consult with a qualified tax professional, chartered accountant, or other appropriate financial advisor for advice tailored to their specific situation before making any financial decisions or taking any action based on the information or calculations provided by this website. Users should also refer to the official GST laws, rules, circulars, and notifications issued by the Government of India and the GST Council for definitive guidance.
+
+### 🛡️ Limitation of Liability
+
+In no event will GSTCalcIndia.com, its owners, or operators be liable for any loss or damage including without limitation, indirect or consequential loss or damage, or any loss or damage whatsoever arising from loss of data or profits arising out of, or in connection with, the use of this website or its calculator.
+
+### 🔗 External Links
+
+From time to time, this website may include links to other websites. These links are provided for your convenience to provide further information. They do not signify that we endorse the website(s). We have no responsibility for the content of the linked website(s).
+
+### 📝 Changes to Disclaimer
+
+We reserve the right to make changes to this Disclaimer at any time. Any such modifications will be effective immediately upon posting on the website. Your continued use of the website after any changes have been made constitutes your acceptance of the new Disclaimer.
+"""
+
+PRIVACY_POLICY_MARKDOWN = """
+## Privacy Policy - GSTCalcIndia.com
+
+**Effective Date**: May 2024  
+**Last Updated**: May 2024
+
+### Introduction
+This Privacy Policy describes how GSTCalcIndia.com ("we", "our", or "us") collects, uses, and protects information when you use our GST calculator service. We are committed to protecting your privacy and ensuring transparency about our data practices.
+
+### Information We Collect
+
+#### Information We DO NOT Collect
+- **Personal Identification**: We do not collect names, email addresses, phone numbers, or any personal identification information
+- **Calculation Data**: We do not store, save, or retain any amounts, GST calculations, or transaction details you enter
+- **Account Information**: We do not require user accounts, registrations, or login credentials
+- **Payment Information**: We do not process payments or collect financial information
+
+#### Information We MAY Collect
+- **Anonymous Usage Analytics**: We may use Google Analytics to collect anonymous information about:
+  - Pages visited and time spent on the site
+  - Browser type and device information (anonymized)
+  - General geographic location (country/region level only)
+  - User interactions with calculator features (anonymized)
+
+#### Technical Information
+- **Server Logs**: Our hosting service may automatically collect standard server log information including:
+  - IP addresses (not linked to personal identity)
+  - Browser type and version
+  - Referring websites
+  - Date and time of access
+
+### How We Use Information
+
+#### Analytics and Improvement
+- **Service Enhancement**: Anonymous usage data helps us understand how users interact with the calculator to improve functionality
+- **Performance Optimization**: Technical data helps us optimize loading speeds and fix technical issues
+- **Feature Development**: Usage patterns help us prioritize new features and improvements
+
+#### We DO NOT Use Information For
+- **Marketing**: We do not send promotional emails or marketing communications
+- **Selling Data**: We do not sell, rent, or share any user information with third parties
+- **Profiling**: We do not create user profiles or track individual behavior
+- **Advertising**: We do not use collected data for targeted advertising
+
+### Data Storage and Security
+
+#### Local Processing
+- **Client-Side Calculations**: All GST calculations are performed in your browser
+- **No Server Storage**: Calculation inputs and results are not transmitted to or stored on our servers
+- **Temporary Session**: Data exists only during your browser session and is cleared when you close the page
+
+#### Database Security
+- **Official Rates Only**: Our database contains only official GST rates from CBIC notifications
+- **No User Data**: Our database does not contain any user-entered information
+- **Secure Infrastructure**: Database is hosted on secure, encrypted infrastructure
+
+### Third-Party Services
+
+#### Google Analytics
+- **Purpose**: Anonymous website usage analytics
+- **Data Collected**: Anonymized usage patterns, page views, session duration
+- **Privacy Controls**: Users can opt-out using browser settings or ad blockers
+- **Google's Policy**: Subject to Google's Privacy Policy
+
+#### Hosting Services
+- **Infrastructure**: Website hosted on secure cloud infrastructure
+- **Data Handling**: Hosting provider may have access to standard server logs
+- **Security**: Industry-standard security measures and encryption
+
+### Your Rights and Choices
+
+#### Data Control
+- **No Account Deletion Needed**: Since we don't store personal data, there's nothing to delete
+- **Browser Controls**: You can clear browser cache and cookies at any time
+- **Analytics Opt-out**: You can disable analytics using browser settings or ad blockers
+
+#### Access and Correction
+- **No Personal Data**: Since we don't collect personal information, there's no personal data to access or correct
+- **Rate Accuracy**: If you notice incorrect GST rates, please contact us for verification
+
+### Children's Privacy
+- **Age Restrictions**: Our service is not specifically directed at children under 13
+- **No Collection**: We do not knowingly collect information from children
+- **Parental Guidance**: Parents should supervise children's internet usage
+
+### International Users
+- **Indian Focus**: This calculator is designed for Indian GST calculations
+- **Global Access**: International users can access the tool but should note it's specific to Indian tax regulations
+- **Data Location**: Data processing occurs on servers that may be located outside your country
+
+### Changes to This Policy
+- **Updates**: We may update this privacy policy to reflect changes in our practices or legal requirements
+- **Notification**: Material changes will be posted on this page with an updated effective date
+- **Continued Use**: Continued use of the calculator after changes constitutes acceptance of the updated policy
+
+### Legal Basis for Processing
+- **Legitimate Interest**: We process anonymous usage data based on our legitimate interest in improving the service
+- **Consent**: By using the calculator, you consent to the data practices described in this policy
+- **Compliance**: We comply with applicable data protection laws
+
+### Data Retention
+- **No Personal Data Retention**: Since we don't collect personal data, there's no retention period
+- **Analytics Data**: Anonymous analytics data may be retained according to Google Analytics retention settings
+- **Server Logs**: Standard server logs may be retained for security and technical purposes for limited periods
+
+### Contact Information
+If you have questions about this Privacy Policy or our data practices, please contact us through our website contact form.
+
+### Compliance and Jurisdiction
+- **Indian Law**: This privacy policy is governed by Indian data protection laws
+- **Jurisdiction**: Any disputes related to privacy will be subject to Indian jurisdiction
+- **Regulatory Compliance**: We comply with applicable Indian privacy and data protection regulations
+
+---
+
+**Acknowledgment**: By using our GST calculator, you acknowledge that you have read and understood this Privacy Policy and agree to our data practices as described herein.
+"""
+
+
+def _first_run_of_session(key):
+    """True the first time it is called with key in this browser session"""
+    if st.session_state.get(key):
+        return False
+    st.session_state[key] = True
+    return True
+
+
+def inject_styles():
+    """Add the shared stylesheet to the page head once per session"""
+    if _first_run_of_session("_styles_sent"):
+        st.components.v1.html(STYLESHEET_HTML, height=0)
+
+
+def inject_page_metadata():
+    """Meta tags for crawlers, which only ever see a session's first run"""
+    if _first_run_of_session("_metadata_sent"):
+        st.markdown(PAGE_METADATA, unsafe_allow_html=True)
+
+
+def inject_google_analytics():
+    """Load the analytics tag and record one page view per session"""
+    if _first_run_of_session("_analytics_sent"):
+        st.components.v1.html(GOOGLE_ANALYTICS_HTML, height=0)
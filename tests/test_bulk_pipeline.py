@@ -0,0 +1,56 @@
+"""
+Calculation modes of the streaming bulk pipeline
+"""
+
+import io
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from gst.bulk_pipeline import process_file
+
+
+class FakeService:
+    RATES = {
+        "8471": {"hsn_code": "8471", "igst_rate": 18.0, "cgst_rate": 9.0, "sgst_rate": 9.0,
+                 "compensation_cess": 0.0, "type": "goods"},
+        "2202": {"hsn_code": "2202", "igst_rate": 28.0, "cgst_rate": 14.0, "sgst_rate": 14.0,
+                 "compensation_cess": 12.0, "type": "goods"},
+    }
+
+    def get_code_index(self):
+        return None
+
+    def lookup_codes(self, codes, fallback=False):
+        return {"results": {code: self.RATES[code] for code in codes if code in self.RATES}}
+
+
+REGISTER = 'invoice,amount,hsn_sac\nA,100.05,8471\nA,100.05,8471\nB,"1,000.10",2202\nB,nan,8471\n'
+
+
+def _run(**options):
+    output = io.StringIO()
+    summary = process_file(io.StringIO(REGISTER), output, service=FakeService(),
+                           input_format="csv", output_format="csv", **options)
+    return summary, output.getvalue()
+
+
+def test_paise_mode_rounds_each_line():
+    summary, output = _run(mode="paise")
+    # 100.05 at 18%: CGST and SGST of 9.00 each (900.45 paise), not 18.01
+    assert "A,100.05,8471,18.0,9.0,9.0,0.0,9.0,9.0,0.0,0.0,18.0,118.05,goods,ok" in output
+    assert summary["total_tax"] == 436.03
+    assert summary["invalid_amount"] == 1
+
+
+def test_invoice_rounding_rounds_each_invoice_once():
+    summary, _ = _run(mode="paise", rounding_level="invoice")
+    # A: CGST 2 x 900.45 = 1800.9 paise -> 18.01, same for SGST; B: 140.01 + 140.01 + 120.01 cess
+    assert summary["total_tax"] == 436.05
+    assert summary["invoices"] == 2
+
+
+def test_invoice_rounding_needs_paise_mode():
+    with pytest.raises(ValueError):
+        _run(rounding_level="invoice")
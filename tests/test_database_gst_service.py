@@ -0,0 +1,24 @@
+"""
+Background services of DatabaseGSTService stay off without a database
+"""
+
+import threading
+
+from gst.database_gst_service import DatabaseGSTService
+
+
+def test_change_listener_needs_a_database(monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("PGHOST", raising=False)
+    monkeypatch.delenv("GST_OFFLINE", raising=False)
+    threads = threading.active_count()
+    assert DatabaseGSTService().start_change_listener() is False
+    assert threading.active_count() == threads
+
+
+def test_change_listener_stays_off_offline(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "postgresql://gst@127.0.0.1:9/gst")
+    monkeypatch.setenv("GST_OFFLINE", "1")
+    service = DatabaseGSTService()
+    assert service.start_change_listener() is False
+    assert service._change_listener is None
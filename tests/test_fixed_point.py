@@ -0,0 +1,86 @@
+"""
+Half-paise cases for the exact paise calculators
+
+Pins that every result carries one tax total: intra-state GST is the sum of
+the separately rounded CGST and SGST, inter-state GST is the rounded IGST.
+"""
+
+import pytest
+
+from gst.fixed_point import (
+    PER_INVOICE,
+    PER_LINE,
+    ROUND_HALF_EVEN,
+    calculate_gst_paise,
+    calculate_gst_paise_batch,
+    calculate_invoice_paise,
+    rate_to_units,
+    to_paise,
+)
+
+# (rupees, rate %, CGST = SGST paise, IGST paise); IGST rounds differently from 2 x CGST
+HALF_PAISE_CASES = [
+    ("100.05", "18", 900, 1801),   # 900.45 each half, 1800.9 IGST
+    ("10.10", "5", 25, 51),        # 25.25 each half, 50.5 IGST
+    ("100.25", "18", 902, 1805),   # 902.25 each half, 1804.5 IGST
+    ("0.03", "28", 0, 1),          # 0.42 each half, 0.84 IGST
+]
+
+
+def _consistent(result):
+    assert result["total_gst"] == result["gst_amount"]
+    assert result["gst_amount"] == result["cgst_amount"] + result["sgst_amount"] + result["igst_amount"]
+    assert result["total_amount"] == result["base_amount"] + result["gst_amount"] + result["cess_amount"]
+
+
+@pytest.mark.parametrize("rupees, rate, half, igst", HALF_PAISE_CASES)
+def test_intra_state_total_is_sum_of_rounded_halves(rupees, rate, half, igst):
+    amount = to_paise(rupees)
+    result = calculate_gst_paise(amount, rate_to_units(rate))
+    assert (result["cgst_amount"], result["sgst_amount"], result["igst_amount"]) == (half, half, 0)
+    assert result["gst_amount"] == 2 * half
+    assert result["total_amount"] == amount + 2 * half
+    _consistent(result)
+
+
+@pytest.mark.parametrize("rupees, rate, half, igst", HALF_PAISE_CASES)
+def test_inter_state_total_is_rounded_igst(rupees, rate, half, igst):
+    amount = to_paise(rupees)
+    result = calculate_gst_paise(amount, rate_to_units(rate), inter_state=True)
+    assert (result["cgst_amount"], result["sgst_amount"], result["igst_amount"]) == (0, 0, igst)
+    assert result["total_amount"] == amount + igst
+    _consistent(result)
+
+
+def test_half_even_rounding():
+    # 1804.5 IGST and 902.25 halves: banker's rounding keeps 1804 and 902
+    result = calculate_gst_paise(10025, rate_to_units(18), rounding=ROUND_HALF_EVEN, inter_state=True)
+    assert result["igst_amount"] == 1804
+    assert calculate_gst_paise(10025, rate_to_units(18), rounding=ROUND_HALF_EVEN)["gst_amount"] == 1804
+
+
+@pytest.mark.parametrize("inter_state", [False, True])
+def test_batch_matches_single_lines(inter_state):
+    amounts = [to_paise(rupees) for rupees, _, _, _ in HALF_PAISE_CASES]
+    rates = [rate_to_units(rate) for _, rate, _, _ in HALF_PAISE_CASES]
+    batch = calculate_gst_paise_batch(amounts, rates, inter_state=inter_state)
+    for i, (amount, rate) in enumerate(zip(amounts, rates)):
+        single = calculate_gst_paise(amount, rate, inter_state=inter_state)
+        assert {key: int(column[i]) for key, column in batch.items()} == single
+
+
+@pytest.mark.parametrize("inter_state", [False, True])
+@pytest.mark.parametrize("level", [PER_LINE, PER_INVOICE])
+def test_invoice_totals_are_consistent(level, inter_state):
+    lines = [{"amount": to_paise(rupees), "igst": rate_to_units(rate)} for rupees, rate, _, _ in HALF_PAISE_CASES]
+    totals = calculate_invoice_paise(lines, rounding_level=level, inter_state=inter_state)
+    _consistent(totals)
+    if level == PER_LINE:
+        assert totals["gst_amount"] == sum(line["gst_amount"] for line in totals["lines"])
+
+
+def test_invoice_rounding_once_per_invoice():
+    # Two lines of 900.45 + 25.25 exact CGST: 925 per line, 926 once per invoice
+    lines = [{"amount": 10005, "igst": rate_to_units(18)}, {"amount": 1010, "igst": rate_to_units(5)}]
+    assert calculate_invoice_paise(lines, rounding_level=PER_LINE)["cgst_amount"] == 925
+    assert calculate_invoice_paise(lines, rounding_level=PER_INVOICE)["cgst_amount"] == 926
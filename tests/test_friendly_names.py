@@ -0,0 +1,69 @@
+"""
+Friendly names must match the original chain of str.replace calls
+"""
+
+from itertools import permutations
+
+from gst.friendly_names import FRIENDLY_REPLACEMENTS, create_friendly_name, create_friendly_names
+
+# Clean-up steps of the original create_friendly_name, in their original order
+ORIGINAL_CLEANUP = [
+    (" - reduced to ", " "),
+    (" - maintained at ", " "),
+    (" (exempt)", " (No GST)"),
+    (" services", ""),
+    (" Products", ""),
+    (" Items", ""),
+    (" Articles", ""),
+]
+
+# Subcategory names in the shape of the rate catalog's, plus the cases a
+# single-pass replacement gets wrong
+CATALOG_NAMES = [
+    "Rate - reduced to services",
+    "Cement - maintained at Products",
+    "Cement - maintained at 28%",
+    "Hair Oil - reduced to 5%",
+    "Fresh Milk (exempt)",
+    "Healthcare services (exempt)",
+    "Legal services",
+    "Dairy Products",
+    "Plastic Items",
+    "Leather Articles",
+    "Tractors - reduced to 12% Items",
+    "Footwear",
+    "",
+]
+
+
+def original_friendly_name(technical_name):
+    if technical_name in FRIENDLY_REPLACEMENTS:
+        return FRIENDLY_REPLACEMENTS[technical_name]
+    friendly_name = technical_name
+    for old, new in ORIGINAL_CLEANUP:
+        friendly_name = friendly_name.replace(old, new)
+    return friendly_name.strip()
+
+
+def _all_names():
+    names = list(FRIENDLY_REPLACEMENTS) + CATALOG_NAMES
+    # Every ordered pair of clean-up patterns, so chained rewrites are covered
+    for (first, _), (second, _) in permutations(ORIGINAL_CLEANUP, 2):
+        names.append(f"Goods{first}{second.lstrip()}")
+        names.append(f"Goods{first}x{second}")
+    return names
+
+
+def test_matches_original_over_catalog_names():
+    for name in _all_names():
+        assert create_friendly_name(name) == original_friendly_name(name), name
+
+
+def test_reported_regressions():
+    assert create_friendly_name("Rate - reduced to services") == "Rate"
+    assert create_friendly_name("Cement - maintained at Products") == "Cement"
+
+
+def test_batch_matches_single():
+    names = _all_names()
+    assert create_friendly_names(names) == [original_friendly_name(name) for name in names]
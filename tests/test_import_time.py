@@ -0,0 +1,73 @@
+"""
+Keeps the headless gst package within its import-time budget
+
+Runs benchmarks/check_import_time.py in a fresh interpreter, so a change
+that makes importing gst slow or pulls Streamlit, pandas or NumPy into it
+fails the test suite. GST_IMPORT_BUDGET_MS overrides the budget for slow
+CI machines. Importing must also stay free of I/O when a rate snapshot and
+a database are configured.
+"""
+
+import os
+import subprocess
+import sys
+
+from gst import rate_snapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHECK = os.path.join(ROOT, "benchmarks", "check_import_time.py")
+
+
+def test_import_time_within_budget():
+    args = [sys.executable, CHECK]
+    if os.getenv("GST_IMPORT_BUDGET_MS"):
+        args.append(os.environ["GST_IMPORT_BUDGET_MS"])
+    result = subprocess.run(args, cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+IMPORT_PROBE = """
+import threading
+import gst
+import gst.async_service
+import gst.database_gst_service as module
+from gst import DatabaseGSTService
+print(module._service is None, threading.active_count())
+"""
+
+
+def _write_snapshot(path):
+    scenario = {"name": "Laptops", "description": "Laptops", "gst_rate": 18.0,
+                "breakdown": {"CGST": 9.0, "SGST": 9.0}, "hsn_code": "8471", "sac_code": None}
+    goods = {"hsn_code": "8471", "description": "Laptops", "cgst_rate": 9.0, "sgst_rate": 9.0,
+             "igst_rate": 18.0, "compensation_cess": 0.0}
+    return rate_snapshot.write_snapshot({"categories": {"Electronics": {"scenarios": [scenario]}},
+                                         "goods": [goods], "services": []}, str(path))
+
+
+def test_import_does_no_io_with_snapshot_and_database(tmp_path):
+    env = dict(os.environ, GST_SNAPSHOT_PATH=_write_snapshot(tmp_path / "rates.snapshot"),
+               DATABASE_URL="postgresql://gst@127.0.0.1:9/gst", PGSSLMODE="disable")
+    env.pop("GST_OFFLINE", None)
+    result = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    # No service built, no snapshot read, no refresh thread, nothing logged
+    assert result.stdout == "True 1\n"
+
+
+def test_service_loads_snapshot_on_first_use(tmp_path):
+    env = dict(os.environ, GST_SNAPSHOT_PATH=_write_snapshot(tmp_path / "rates.snapshot"), GST_OFFLINE="1")
+    probe = "import gst; print(gst.get_category_list(), gst.get_service().lookup_code('8471')['igst_rate'])"
+    result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split("\n")[0] == "['Electronics'] 18.0"
+
+
+def test_async_service_imports_only_pure_helpers():
+    probe = ("import sys, gst.async_service; "
+             "print('gst.database_gst_service' in sys.modules, 'psycopg2' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "False False\n"
@@ -0,0 +1,49 @@
+"""
+Numeric queries: HSN/SAC codes versus price bands
+"""
+
+from gst.records import Scenario
+from gst.scenario_search import ScenarioSearchIndex
+
+CATEGORIES = {
+    "Hotels": {"scenarios": [
+        Scenario("Luxury Hotel Stay", "Above ₹7,500/night", 18.0, 9.0, 9.0, sac_code="996311"),
+        Scenario("Premium Hotel Stay", "₹2,500-7,500/night", 12.0, 6.0, 6.0, sac_code="996312"),
+        Scenario("Budget Hotel (up to 1000)", "Rooms up to ₹1,000/night", 0.0, 0.0, 0.0, sac_code="996313"),
+    ]},
+    "Electronics": {"scenarios": [
+        Scenario("Mobile Phone/Smartphone", "Telephone sets", 18.0, 9.0, 9.0, hsn_code="8517"),
+        Scenario("Computer/Laptop", "Computers, laptops", 18.0, 9.0, 9.0, hsn_code="8471"),
+        Scenario("Hearing Aids", "Parts", 0.0, 0.0, 0.0, hsn_code="902140"),
+    ]},
+}
+
+
+def names(results):
+    return [result["scenario"]["name"] for result in results]
+
+
+def test_code_does_not_match_price_bands():
+    index = ScenarioSearchIndex(CATEGORIES)
+    assert names(index.search("8517")) == ["Mobile Phone/Smartphone"]
+
+
+def test_unknown_code_like_number_alone_is_not_an_amount():
+    index = ScenarioSearchIndex(CATEGORIES)
+    assert "Luxury Hotel Stay" not in names(index.search("9999"))
+
+
+def test_amount_next_to_a_word_still_matches_a_band():
+    index = ScenarioSearchIndex(CATEGORIES)
+    assert names(index.search("hotel 5000"))[0] == "Premium Hotel Stay"
+    assert names(index.search("hotel 8000"))[0] == "Luxury Hotel Stay"
+
+
+def test_code_prefix_ranks_above_band_hits():
+    index = ScenarioSearchIndex(CATEGORIES)
+    # 902 is inside the "up to 1000" band and a prefix of HSN 902140
+    results = names(index.search("902"))
+    assert results[0] == "Hearing Aids"
+    # 996 is a SAC prefix of every hotel; codes win over the band
+    assert set(names(index.search("996"))[:3]) == {"Luxury Hotel Stay", "Premium Hotel Stay",
+                                                    "Budget Hotel (up to 1000)"}